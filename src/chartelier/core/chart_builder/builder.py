@@ -39,8 +39,17 @@ class ChartBuilder:
         """Initialize chart builder."""
         self._templates: dict[str, BaseTemplate] = {}
         self._pattern_defaults: dict[PatternID, str] = {}
+        # get_available_charts results per pattern; cleared whenever a template is registered
+        self._charts_by_pattern: dict[PatternID, list[ChartSpec]] = {}
+        # Cleared once vl-convert is found missing, so later PNG requests skip the failed import
+        self._png_available = True
         self._initialize_templates()
 
+    @property
+    def png_available(self) -> bool:
+        """Whether PNG export is attempted; False once vl-convert was found to be missing."""
+        return self._png_available
+
     def _initialize_templates(self) -> None:
         """Initialize and register available templates."""
         # Import and register implemented templates
@@ -90,6 +99,7 @@ class ChartBuilder:
             template: Template instance
         """
         self._templates[template_id] = template
+        self._charts_by_pattern.clear()
         logger.debug("Registered template", template_id=template_id)
 
     def get_available_charts(self, pattern_id: PatternID) -> list[ChartSpec]:
@@ -101,6 +111,10 @@ class ChartBuilder:
         Returns:
             List of available chart specifications
         """
+        cached = self._charts_by_pattern.get(pattern_id)
+        if cached is not None:
+            return list(cached)
+
         available = []
         for template_id, template in self._templates.items():
             if pattern_id.value in template.spec.pattern_ids:
@@ -123,7 +137,8 @@ class ChartBuilder:
                 )
             )
 
-        return available
+        self._charts_by_pattern[pattern_id] = available
+        return list(available)
 
     def get_template_spec(self, template_id: str) -> TemplateSpec | None:
         """Get template specification.
@@ -255,23 +270,26 @@ class ChartBuilder:
         Raises:
             ExportError: If export fails
         """
-        try:
-            if format == OutputFormat.PNG:
-                return self._export_png(chart, dpi)
-            return self._export_svg(chart)
-        except Exception as e:
-            # Try fallback
-            if format == OutputFormat.PNG:
-                logger.warning("PNG export failed, falling back to SVG", error=str(e))
-                try:
-                    return self._export_svg(chart)
-                except Exception as svg_error:
-                    msg = f"Export failed for both PNG and SVG: {svg_error}"
-                    raise ExportError(msg) from svg_error
-            else:
+        if format != OutputFormat.PNG:
+            try:
+                return self._export_svg(chart)
+            except Exception as e:
                 msg = f"SVG export failed: {e}"
                 raise ExportError(msg) from e
 
+        if self._png_available:
+            try:
+                return self._export_png(chart, dpi)
+            except Exception as e:  # noqa: BLE001 — Any PNG failure falls back to SVG below
+                logger.warning("PNG export failed, falling back to SVG", error=str(e))
+
+        # Fall back to SVG
+        try:
+            return self._export_svg(chart)
+        except Exception as svg_error:
+            msg = f"Export failed for both PNG and SVG: {svg_error}"
+            raise ExportError(msg) from svg_error
+
     def _export_png(self, chart: alt.Chart | alt.LayerChart, dpi: int) -> str:
         """Export chart as PNG.
 
@@ -301,6 +319,7 @@ class ChartBuilder:
             return base64.b64encode(png_data).decode("utf-8")
 
         except ImportError as e:
+            self._png_available = False
             msg = "vl-convert-python not installed"
             raise ExportError(msg) from e
 
@@ -1,13 +1,18 @@
 """Error handling and exception definitions for Chartelier."""
 
-from typing import Any
+from typing import Any, ClassVar
 
 from .enums import ErrorCode, MCPErrorCode, PipelinePhase
 from .models import ErrorDetail, ErrorResponse
 
 
 class ChartelierError(Exception):
-    """Base exception for all Chartelier errors."""
+    """Base exception for all Chartelier errors.
+
+    Subclasses override ``mcp_code`` to select the JSON-RPC error code they map to.
+    """
+
+    mcp_code: ClassVar[MCPErrorCode] = MCPErrorCode.APPLICATION_ERROR
 
     def __init__(
         self,
@@ -57,6 +62,8 @@ class ChartelierError(Exception):
 class ValidationError(ChartelierError):
     """Raised when request validation fails."""
 
+    mcp_code = MCPErrorCode.INVALID_PARAMS
+
     def __init__(
         self,
         message: str,
@@ -83,9 +90,10 @@ class DataTooLargeError(ChartelierError):
         actual_size_mb: float | None = None,
     ):
         """Initialize data too large error."""
-        hint = f"Please reduce data size to under {max_size_mb}MB"
         if actual_size_mb:
-            hint += f" (current: {actual_size_mb:.1f}MB)"
+            hint = f"Please reduce data size to under {max_size_mb}MB (current: {actual_size_mb:.1f}MB)"
+        else:
+            hint = f"Please reduce data size to under {max_size_mb}MB"
 
         super().__init__(
             message=message,
@@ -202,9 +210,11 @@ class MappingError(BusinessError):
 
         hint = None
         if available_columns:
-            hint = f"Available columns: {', '.join(available_columns[:10])}"
+            shown = ", ".join(available_columns[:10])
             if len(available_columns) > 10:
-                hint += f" (and {len(available_columns) - 10} more)"
+                hint = f"Available columns: {shown} (and {len(available_columns) - 10} more)"
+            else:
+                hint = f"Available columns: {shown}"
 
         super().__init__(
             message=message,
@@ -246,9 +256,13 @@ class TimeoutError(ChartelierError):
         phase: PipelinePhase | None = None,
     ):
         """Initialize timeout error."""
-        hint = "Operation took too long. Consider simplifying your request or reducing data size."
         if timeout_seconds:
-            hint = f"Operation exceeded {timeout_seconds}s timeout. " + hint
+            hint = (
+                f"Operation exceeded {timeout_seconds}s timeout. "
+                "Operation took too long. Consider simplifying your request or reducing data size."
+            )
+        else:
+            hint = "Operation took too long. Consider simplifying your request or reducing data size."
 
         super().__init__(
             message=message,
@@ -267,9 +281,10 @@ class RateLimitError(ChartelierError):
         retry_after_seconds: int | None = None,
     ):
         """Initialize rate limit error."""
-        hint = "Too many requests. Please wait before trying again."
         if retry_after_seconds:
             hint = f"Rate limit exceeded. Please retry after {retry_after_seconds} seconds."
+        else:
+            hint = "Too many requests. Please wait before trying again."
 
         super().__init__(
             message=message,
@@ -281,6 +296,8 @@ class RateLimitError(ChartelierError):
 class SystemError(ChartelierError):
     """Raised for internal system errors."""
 
+    mcp_code = MCPErrorCode.INTERNAL_ERROR
+
     def __init__(
         self,
         message: str = "An internal error occurred",
@@ -298,15 +315,18 @@ class SystemError(ChartelierError):
 class DependencyUnavailableError(ChartelierError):
     """Raised when required dependency is unavailable."""
 
+    mcp_code = MCPErrorCode.INTERNAL_ERROR
+
     def __init__(
         self,
         message: str,
         dependency: str | None = None,
     ):
         """Initialize dependency unavailable error."""
-        hint = "A required service is unavailable. Please try again later."
         if dependency:
-            hint = f"Service '{dependency}' is unavailable. " + hint
+            hint = f"Service '{dependency}' is unavailable. A required service is unavailable. Please try again later."
+        else:
+            hint = "A required service is unavailable. Please try again later."
 
         super().__init__(
             message=message,
@@ -326,9 +346,13 @@ class ChartBuildError(BusinessError):
     ):
         """Initialize chart build error."""
         if not hint:
-            hint = "Failed to build the chart. Check data compatibility with the selected template."
             if template_id:
-                hint = f"Failed to build chart with template '{template_id}'. " + hint
+                hint = (
+                    f"Failed to build chart with template '{template_id}'. "
+                    "Failed to build the chart. Check data compatibility with the selected template."
+                )
+            else:
+                hint = "Failed to build the chart. Check data compatibility with the selected template."
 
         super().__init__(
             message=message,
@@ -346,12 +370,13 @@ class ExportError(SystemError):
         format: str | None = None,  # noqa: A002 — format parameter refers to file format
     ):
         """Initialize export error."""
-        hint = "Failed to export the chart."
         if format:
             hint = (
                 f"Failed to export chart as {format}. "
                 "The chart may be too complex or the export format may not be supported."
             )
+        else:
+            hint = "Failed to export the chart."
 
         super().__init__(
             message=message,
@@ -369,13 +394,7 @@ def map_to_mcp_error_code(error: ChartelierError) -> MCPErrorCode:
     Returns:
         Corresponding MCP error code
     """
-    if isinstance(error, ValidationError):
-        return MCPErrorCode.INVALID_PARAMS
-    if isinstance(error, (BusinessError, UpstreamError, TimeoutError, RateLimitError)):
-        return MCPErrorCode.APPLICATION_ERROR
-    if isinstance(error, (SystemError, DependencyUnavailableError)):
-        return MCPErrorCode.INTERNAL_ERROR
-    return MCPErrorCode.APPLICATION_ERROR
+    return error.mcp_code
 
 
 def create_mcp_error_response(
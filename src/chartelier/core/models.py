@@ -1,11 +1,22 @@
 """Pydantic models for Chartelier data structures."""
 
+import base64
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator, model_validator
 
 from .enums import AuxiliaryElement, Locale, OutputFormat, PatternID
 
+# Precomputed value-to-member lookup so pattern IDs skip Enum's member resolution
+_PATTERN_ID_BY_VALUE: dict[str, PatternID] = {p.value: p for p in PatternID}
+
+
+def _lookup_pattern_id(v: Any) -> Any:  # noqa: ANN401
+    """Resolve a raw pattern ID string to its enum member, leaving anything else to pydantic."""
+    if isinstance(v, str):
+        return _PATTERN_ID_BY_VALUE.get(v, v)
+    return v
+
 
 class VisualizeOptions(BaseModel):
     """Optional visualization parameters."""
@@ -91,14 +102,39 @@ class ChartMetadata(BaseModel):
     versions: VersionInfo = Field(default_factory=VersionInfo, description="Version information")
     fallback_applied: bool = Field(default=False, description="Whether fallback was used")
 
+    @field_validator("pattern_id", mode="before")
+    @classmethod
+    def _fast_pattern_id(cls, v: Any) -> Any:  # noqa: ANN401
+        """Resolve pattern ID via the precomputed lookup."""
+        return _lookup_pattern_id(v)
+
 
 class VisualizeResponse(BaseModel):
     """Response model for successful visualization."""
 
+    # Input is the serialized form too (base64 ``image``), so both schemas describe it
+    model_config = ConfigDict(json_schema_mode_override="serialization")
+
     format: OutputFormat = Field(..., description="Output image format")
-    image: str = Field(..., description="Base64 encoded PNG or SVG string")
+    image_bytes: bytes = Field(..., description="Raw PNG or SVG bytes", exclude=True, repr=False)
     metadata: ChartMetadata = Field(..., description="Chart generation metadata")
 
+    @computed_field(description="Base64 encoded PNG or SVG string")  # type: ignore[prop-decorator]
+    @property
+    def image(self) -> str:
+        """Base64-encode the image on access so internal callers can keep raw bytes."""
+        return base64.b64encode(self.image_bytes).decode("ascii")
+
+    @model_validator(mode="before")
+    @classmethod
+    def _decode_image(cls, data: Any) -> Any:  # noqa: ANN401
+        """Accept the serialized form by decoding its base64 ``image`` into ``image_bytes``."""
+        if isinstance(data, dict) and "image_bytes" not in data and "image" in data:
+            image = data["image"]
+            data = {key: value for key, value in data.items() if key != "image"}
+            data["image_bytes"] = base64.b64decode(image, validate=True)
+        return data
+
 
 class ErrorDetail(BaseModel):
     """Detailed error information."""
@@ -127,6 +163,12 @@ class PatternSelection(BaseModel):
     reasoning: str | None = Field(default=None, description="LLM reasoning for selection")
     confidence: float | None = Field(default=None, ge=0.0, le=1.0, description="Selection confidence")
 
+    @field_validator("pattern_id", mode="before")
+    @classmethod
+    def _fast_pattern_id(cls, v: Any) -> Any:  # noqa: ANN401
+        """Resolve pattern ID via the precomputed lookup."""
+        return _lookup_pattern_id(v)
+
 
 class ChartSelection(BaseModel):
     """Result of chart template selection."""
@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
 import json
+import math
+import random
+import sqlite3
+import threading
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Protocol
 
@@ -57,8 +67,19 @@ class LLMSettings(BaseSettings):
     max_retries: int = Field(3, description="Maximum number of retries")
     retry_delay: float = Field(1.0, description="Initial retry delay in seconds")
     temperature: float = Field(0.0, description="Temperature for generation")
+    max_concurrency: int = Field(8, description="Maximum in-flight requests for acomplete_many")
     max_tokens: int | None = Field(None, description="Maximum tokens to generate")
+    max_input_tokens: int = Field(32000, description="Refuse requests whose estimated prompt tokens exceed this")
     disable_llm: bool = Field(default=False, description="Disable LLM calls (use mock)")
+    cache_enabled: bool = Field(default=True, description="Cache responses of deterministic (temperature=0) requests")
+    cache_path: str | None = Field(None, description="SQLite file for the response cache (in-memory LRU if unset)")
+    cache_ttl: int = Field(86400, description="Response cache entry lifetime in seconds")
+    cache_max_entries: int = Field(256, description="Maximum entries held by the response cache")
+    semantic_cache: bool = Field(default=False, description="Serve paraphrased queries from cache by similarity")
+    semantic_cache_threshold: float = Field(0.95, description="Minimum cosine similarity for a semantic cache hit")
+    semantic_cache_model: str = Field(
+        "sentence-transformers/all-MiniLM-L6-v2", description="Local embedding model for the semantic cache"
+    )
 
 
 class LLMTimeoutError(ChartelierError):
@@ -80,8 +101,16 @@ class LLMTimeoutError(ChartelierError):
 class LLMAPIError(ChartelierError):
     """Raised when LLM API returns an error."""
 
-    def __init__(self, message: str, status_code: int | None = None) -> None:
-        """Initialize LLM API error."""
+    def __init__(self, message: str, status_code: int | None = None, retry_after: float | None = None) -> None:
+        """Initialize LLM API error.
+
+        Args:
+            message: Error message from the provider
+            status_code: HTTP status code, if known
+            retry_after: Seconds the provider asked us to wait (``Retry-After``), if given
+        """
+        self.status_code = status_code
+        self.retry_after = retry_after
         details = [ErrorDetail(field="api_error", reason=message)]
         if status_code:
             details.append(ErrorDetail(field="status_code", reason=str(status_code)))
@@ -94,6 +123,264 @@ class LLMAPIError(ChartelierError):
         )
 
 
+def _update_digest(digest: hashlib.blake2b, value: Any) -> None:  # noqa: ANN401
+    """Feed one length-prefixed field into digest so field boundaries stay unambiguous."""
+    if isinstance(value, str):
+        tag, data = b"s", value.encode("utf-8")
+    else:
+        tag, data = b"j", json.dumps(value, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    digest.update(tag)
+    digest.update(len(data).to_bytes(8, "little"))
+    digest.update(data)
+
+
+def _retry_after_seconds(error: Exception) -> float | None:
+    """Read a numeric ``Retry-After`` header from a provider exception, if present."""
+    headers = getattr(error, "headers", None) or getattr(getattr(error, "response", None), "headers", None)
+    if not isinstance(headers, Mapping):
+        return None
+    value = headers.get("retry-after", headers.get("Retry-After"))
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        return None
+    return seconds if seconds >= 0 else None
+
+
+class LLMCache:
+    """In-memory LRU cache of LLM responses keyed by a canonical request hash."""
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: int | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of responses kept before evicting the least recently used
+            ttl_seconds: Entry lifetime in seconds, or None to never expire
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, LLMResponse]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(request_kwargs: dict[str, Any]) -> str:
+        """Build a cache key from the request parameters that affect the response.
+
+        Args:
+            request_kwargs: Keyword arguments about to be sent to the LLM
+
+        Returns:
+            BLAKE2b hex digest of the request
+        """
+        digest = hashlib.blake2b(digest_size=32)
+        for value in (
+            request_kwargs.get("model"),
+            request_kwargs.get("temperature"),
+            request_kwargs.get("response_format"),
+            request_kwargs.get("max_tokens"),
+        ):
+            _update_digest(digest, value)
+        # Message contents are fed to the hash directly instead of serializing the whole payload
+        for message in request_kwargs.get("messages") or ():
+            _update_digest(digest, message.get("role"))
+            _update_digest(digest, message.get("content"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> LLMResponse | None:
+        """Return the cached response for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            created_at, response = entry
+            if self.ttl_seconds is not None and time.time() - created_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: LLMResponse) -> None:
+        """Store a response under key, evicting the oldest entry when full."""
+        with self._lock:
+            self._entries[key] = (time.time(), response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class SQLiteLLMCache(LLMCache):
+    """LLM response cache persisted to a SQLite file so it survives restarts."""
+
+    def __init__(self, path: str, max_entries: int = 256, ttl_seconds: int | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: SQLite database file path
+            max_entries: Maximum number of responses kept before evicting the oldest
+            ttl_seconds: Entry lifetime in seconds, or None to never expire
+        """
+        super().__init__(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, created_at INTEGER NOT NULL)"
+            )
+
+    def get(self, key: str) -> LLMResponse | None:
+        """Return the cached response for key, or None if missing or expired."""
+        with self._lock:
+            row = self._conn.execute("SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        value, created_at = row
+        if self.ttl_seconds is not None and time.time() - created_at > self.ttl_seconds:
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            return None
+        return LLMResponse.model_validate_json(value)
+
+    def set(self, key: str, response: LLMResponse) -> None:
+        """Store a response under key, dropping expired entries and the oldest beyond max_entries."""
+        now = int(time.time())
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, created_at) VALUES (?, ?, ?)",
+                (key, response.model_dump_json(), now),
+            )
+            # Entries that are never read again would otherwise stay in the file forever
+            if self.ttl_seconds is not None:
+                self._conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+            self._conn.execute(
+                "DELETE FROM llm_cache WHERE rowid NOT IN "
+                "(SELECT rowid FROM llm_cache ORDER BY created_at DESC, rowid DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+
+
+EmbeddingFunction = Callable[[str], Sequence[float]]
+
+# Namespace hash and unit-length embedding of a request's free-form text
+SemanticKey = tuple[str, list[float]]
+
+
+class SemanticLLMCache:
+    """Similarity-based LLM response cache for paraphrased queries.
+
+    Only the request's free-form text (the user's query) is embedded. Everything
+    else (model, response format, and every message with that text taken out, so
+    the prompt template and data summary) goes into the namespace hash, so a hit
+    needs an otherwise identical request. Lookups scan the namespace's normalized
+    vectors; the cache is bounded, so a brute-force dot product is sufficient.
+    """
+
+    def __init__(self, embed: EmbeddingFunction, threshold: float = 0.95, max_entries: int = 256) -> None:
+        """Initialize the cache.
+
+        Args:
+            embed: Function returning an embedding vector for a text
+            threshold: Minimum cosine similarity accepted as a hit
+            max_entries: Maximum entries kept per namespace before evicting the oldest
+        """
+        self.embed = embed
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._namespaces: dict[str, deque[tuple[list[float], LLMResponse]]] = {}
+        self._lock = threading.Lock()
+
+    def make_key(self, request_kwargs: dict[str, Any], text: str) -> SemanticKey:
+        """Build the cache key of a request.
+
+        Args:
+            request_kwargs: Keyword arguments about to be sent to the LLM
+            text: Free-form part of the prompt matched by similarity (e.g. the user's query)
+
+        Returns:
+            Tuple of (namespace hash, unit-length embedding of text)
+        """
+        digest = hashlib.blake2b(digest_size=32)
+        for value in (
+            request_kwargs.get("model"),
+            request_kwargs.get("temperature"),
+            request_kwargs.get("response_format"),
+            request_kwargs.get("max_tokens"),
+        ):
+            _update_digest(digest, value)
+        for message in request_kwargs.get("messages") or ():
+            content = message.get("content")
+            _update_digest(digest, message.get("role"))
+            _update_digest(digest, content.replace(text, "") if isinstance(content, str) else content)
+
+        vector = [float(v) for v in self.embed(text)]
+        norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+        return digest.hexdigest(), [v / norm for v in vector]
+
+    def get(self, key: SemanticKey) -> LLMResponse | None:
+        """Return the most similar cached response above the threshold, if any."""
+        namespace, query = key
+        with self._lock:
+            entries = list(self._namespaces.get(namespace, ()))
+
+        best_score = -1.0
+        best_response = None
+        for vector, response in entries:
+            score = sum(a * b for a, b in zip(query, vector, strict=False))
+            if score > best_score:
+                best_score, best_response = score, response
+
+        return best_response if best_score >= self.threshold else None
+
+    def set(self, key: SemanticKey, response: LLMResponse) -> None:
+        """Store a response under a key built by ``make_key``."""
+        namespace, vector = key
+        with self._lock:
+            entries = self._namespaces.setdefault(namespace, deque(maxlen=self.max_entries))
+            entries.append((vector, response))
+
+
+def load_fastembed_embedder(model_name: str) -> EmbeddingFunction:
+    """Load a local embedding function backed by fastembed.
+
+    Args:
+        model_name: fastembed model identifier
+
+    Returns:
+        Function mapping a text to its embedding vector
+
+    Raises:
+        ImportError: If fastembed is not installed
+    """
+    try:
+        from fastembed import TextEmbedding  # noqa: PLC0415 — Lazy import for optional dependency
+    except ImportError as e:
+        msg = "fastembed is not installed. Install with: pip install chartelier[semantic-cache]"
+        raise ImportError(msg) from e
+
+    model = TextEmbedding(model_name=model_name)
+
+    def embed(text: str) -> Sequence[float]:
+        return [float(v) for v in next(iter(model.embed([text])))]
+
+    return embed
+
+
+class LLMInputTooLargeError(ChartelierError):
+    """Raised when a prompt exceeds the configured input token ceiling."""
+
+    def __init__(self, estimated_tokens: int, max_tokens: int) -> None:
+        """Initialize LLM input too large error."""
+        super().__init__(
+            code=ErrorCode.E413_TOO_LARGE,
+            message=f"LLM prompt too large: ~{estimated_tokens} tokens exceeds limit of {max_tokens}",
+            hint="Reduce the number of columns or shorten the query",
+            details=[
+                ErrorDetail(field="estimated_input_tokens", reason=str(estimated_tokens)),
+                ErrorDetail(field="max_input_tokens", reason=str(max_tokens)),
+            ],
+        )
+
+
 class LLMClient(Protocol):
     """Protocol for LLM client implementations."""
 
@@ -120,17 +407,64 @@ class LLMClient(Protocol):
         """
         ...
 
+    async def acomplete(
+        self,
+        messages: list[LLMMessage],
+        *,
+        response_format: ResponseFormat = ResponseFormat.TEXT,
+        **kwargs: Any,  # noqa: ANN401 — LLM libraries require flexible kwargs
+    ) -> LLMResponse:
+        """Complete a chat conversation without blocking the event loop.
+
+        Args:
+            messages: List of messages in the conversation
+            response_format: Expected response format
+            **kwargs: Additional parameters for the LLM
+
+        Returns:
+            LLM response
+
+        Raises:
+            LLMTimeoutError: If the request times out
+            LLMAPIError: If the API returns an error
+        """
+        ...
+
+    def effective_temperature(self, model: str | None = None, temperature: float | None = None) -> float:
+        """Return the temperature a request is actually sent with.
+
+        Added after the other methods; callers treat clients without it as sending the
+        requested temperature.
+
+        Args:
+            model: Model the request targets (defaults to the configured model)
+            temperature: Requested temperature (defaults to the configured temperature)
+
+        Returns:
+            Temperature after any model-specific override
+        """
+        ...
+
 
 class BaseLLMClient(ABC):
     """Base class for LLM client implementations."""
 
-    def __init__(self, settings: LLMSettings | None = None) -> None:
+    def __init__(
+        self,
+        settings: LLMSettings | None = None,
+        cache: LLMCache | None = None,
+        semantic_cache: SemanticLLMCache | None = None,
+    ) -> None:
         """Initialize the LLM client.
 
         Args:
             settings: LLM settings, defaults to environment variables
+            cache: Optional response cache consulted for deterministic requests
+            semantic_cache: Optional similarity cache consulted after an exact cache miss
         """
-        self.settings = settings or LLMSettings()
+        self.settings = settings or _default_settings()
+        self.cache = cache
+        self.semantic_cache = semantic_cache
         self.logger = get_logger(self.__class__.__name__)
 
     @abstractmethod
@@ -144,34 +478,130 @@ class BaseLLMClient(ABC):
         """Complete a chat conversation."""
         ...
 
+    async def acomplete(
+        self,
+        messages: list[LLMMessage],
+        *,
+        response_format: ResponseFormat = ResponseFormat.TEXT,
+        **kwargs: Any,  # noqa: ANN401 — LLM libraries require flexible kwargs
+    ) -> LLMResponse:
+        """Complete a chat conversation without blocking the event loop.
+
+        The default implementation runs ``complete`` in a worker thread; clients
+        with a native async transport override it.
+        """
+        return await asyncio.to_thread(self.complete, messages, response_format=response_format, **kwargs)
+
+    def effective_temperature(self, model: str | None = None, temperature: float | None = None) -> float:  # noqa: ARG002 — Used by overrides
+        """Return the temperature a request is actually sent with.
+
+        Callers that reuse answers across requests should check this rather than the
+        temperature they ask for, since a client may override it for some models.
+        """
+        return self.settings.temperature if temperature is None else temperature
+
+    async def acomplete_many(
+        self,
+        requests: Sequence[list[LLMMessage]],
+        *,
+        response_format: ResponseFormat = ResponseFormat.TEXT,
+        **kwargs: Any,  # noqa: ANN401 — LLM libraries require flexible kwargs
+    ) -> list[LLMResponse | BaseException]:
+        """Complete independent conversations concurrently.
+
+        At most ``settings.max_concurrency`` requests are in flight at once.
+
+        Args:
+            requests: Message lists, one per conversation
+            response_format: Expected response format for every conversation
+            **kwargs: Additional parameters applied to every conversation
+
+        Returns:
+            Responses in request order; failed requests yield their exception instead
+        """
+        semaphore = asyncio.Semaphore(self.settings.max_concurrency)
+
+        async def _bounded(messages: list[LLMMessage]) -> LLMResponse:
+            async with semaphore:
+                return await self.acomplete(messages, response_format=response_format, **kwargs)
+
+        return await asyncio.gather(*(_bounded(messages) for messages in requests), return_exceptions=True)
+
+    def _default_deadline(self) -> float:
+        """Deadline bounding the whole retry budget of a call, not just one attempt."""
+        return time.monotonic() + self.settings.timeout * self.settings.max_retries
+
+    def _check_deadline(self, deadline: float | None, model: str | None) -> None:
+        """Drop a request whose caller has already given up instead of dispatching it.
+
+        Raises:
+            LLMTimeoutError: If the deadline has passed
+        """
+        if deadline is not None and time.monotonic() >= deadline:
+            self.logger.warning("LLM request deadline passed, not dispatching", extra={"model": model})
+            raise LLMTimeoutError(timeout=self.settings.timeout, model=model)
+
+    def _backoff_delay(self, error: Exception, previous_delay: float, deadline: float | None) -> float:
+        """Pick how long to wait before the next attempt.
+
+        A provider-supplied ``Retry-After`` (typically on 429 responses) is honored
+        as is. Otherwise the delay is drawn with decorrelated jitter between
+        ``retry_delay`` and twice the previous delay, so clients failing together
+        don't retry in lockstep. The wait never exceeds ``timeout`` or the time left
+        before ``deadline``.
+
+        Args:
+            error: Exception raised by the failed attempt
+            previous_delay: Delay used before the failed attempt (``retry_delay`` initially)
+            deadline: Monotonic time after which no further attempt is dispatched
+
+        Returns:
+            Seconds to sleep
+        """
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            delay = float(retry_after)
+        else:
+            base = self.settings.retry_delay
+            delay = random.uniform(base, max(base, previous_delay * 2))  # noqa: S311 — Jitter, not cryptography
+        delay = min(delay, self.settings.timeout)
+        if deadline is not None:
+            delay = min(delay, max(0.0, deadline - time.monotonic()))
+        return delay
+
     def _retry_with_backoff(
         self,
         func: Any,  # noqa: ANN401 — Generic retry function
         *args: Any,  # noqa: ANN401 — Generic retry function
+        deadline: float | None = None,
         **kwargs: Any,  # noqa: ANN401 — Generic retry function
     ) -> Any:  # noqa: ANN401 — Generic retry function
-        """Execute function with exponential backoff retry.
+        """Execute function with jittered exponential backoff retry.
 
         Args:
             func: Function to execute
             *args: Positional arguments for the function
+            deadline: Monotonic time after which no further attempt is dispatched
             **kwargs: Keyword arguments for the function
 
         Returns:
             Function result
 
         Raises:
+            LLMTimeoutError: If the deadline passes before an attempt is dispatched
             Exception: If all retries fail
         """
         last_exception = None
         delay = self.settings.retry_delay
 
         for attempt in range(self.settings.max_retries):
+            self._check_deadline(deadline, kwargs.get("model"))
             try:
                 return func(*args, **kwargs)
             except (LLMTimeoutError, LLMAPIError) as e:
                 last_exception = e
                 if attempt < self.settings.max_retries - 1:
+                    delay = self._backoff_delay(e, delay, deadline)
                     self.logger.warning(
                         "LLM request failed, retrying",
                         extra={
@@ -182,7 +612,65 @@ class BaseLLMClient(ABC):
                         },
                     )
                     time.sleep(delay)
-                    delay *= 2  # Exponential backoff
+                else:
+                    self.logger.exception(
+                        "LLM request failed after all retries",
+                        extra={
+                            "attempts": self.settings.max_retries,
+                            "error": str(e),
+                        },
+                    )
+
+        if last_exception:
+            raise last_exception
+        raise RuntimeError("Unexpected retry failure")  # Should not reach here
+
+    async def _aretry_with_backoff(
+        self,
+        func: Any,  # noqa: ANN401 — Generic retry function
+        *args: Any,  # noqa: ANN401 — Generic retry function
+        deadline: float | None = None,
+        **kwargs: Any,  # noqa: ANN401 — Generic retry function
+    ) -> Any:  # noqa: ANN401 — Generic retry function
+        """Await coroutine function with jittered exponential backoff retry.
+
+        Mirrors ``_retry_with_backoff`` but sleeps with ``asyncio.sleep`` so other
+        requests keep progressing while this one backs off.
+
+        Args:
+            func: Coroutine function to execute
+            *args: Positional arguments for the function
+            deadline: Monotonic time after which no further attempt is dispatched
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            Function result
+
+        Raises:
+            LLMTimeoutError: If the deadline passes before an attempt is dispatched
+            Exception: If all retries fail
+        """
+        last_exception = None
+        delay = self.settings.retry_delay
+
+        for attempt in range(self.settings.max_retries):
+            self._check_deadline(deadline, kwargs.get("model"))
+            try:
+                return await func(*args, **kwargs)
+            except (LLMTimeoutError, LLMAPIError) as e:
+                last_exception = e
+                if attempt < self.settings.max_retries - 1:
+                    delay = self._backoff_delay(e, delay, deadline)
+                    self.logger.warning(
+                        "LLM request failed, retrying",
+                        extra={
+                            "attempt": attempt + 1,
+                            "max_retries": self.settings.max_retries,
+                            "delay": delay,
+                            "error": str(e),
+                        },
+                    )
+                    await asyncio.sleep(delay)
                 else:
                     self.logger.exception(
                         "LLM request failed after all retries",
@@ -197,13 +685,63 @@ class BaseLLMClient(ABC):
         raise RuntimeError("Unexpected retry failure")  # Should not reach here
 
 
+# Converts a provider exception (and the requested model) into a Chartelier error
+_ExceptionTranslator = Callable[[Exception, str], ChartelierError]
+
+# Roles carrying fixed instructions that form the cacheable prompt prefix
+_STATIC_ROLES = frozenset({"system", "developer"})
+
+
+@dataclass
+class _InFlightRequest:
+    """A deterministic request being sent on behalf of every caller that asks for it."""
+
+    done: threading.Event = field(default_factory=threading.Event)
+    response: LLMResponse | None = None
+    error: Exception | None = None
+
+
+def _clone_error(error: Exception) -> Exception:
+    """Copy a shared failure so every waiter raises its own instance.
+
+    Raising one instance in several threads would interleave updates to its traceback.
+    ``copy.copy`` doesn't fit: it re-runs ``__init__`` with the already formatted message.
+    """
+    clone = Exception.__new__(type(error), *error.args)
+    clone.__dict__.update(error.__dict__)
+    return clone
+
+
 class LiteLLMClient(BaseLLMClient):
-    """LiteLLM-based client implementation."""
+    """LiteLLM-based client implementation.
+
+    Identical deterministic requests issued concurrently are coalesced: the first
+    caller sends the request and the others wait for its result instead of
+    sending their own.
+    """
 
-    def __init__(self, settings: LLMSettings | None = None) -> None:
+    def __init__(
+        self,
+        settings: LLMSettings | None = None,
+        cache: LLMCache | None = None,
+        semantic_cache: SemanticLLMCache | None = None,
+    ) -> None:
         """Initialize LiteLLM client."""
-        super().__init__(settings)
+        super().__init__(settings, cache, semantic_cache)
         self._client = None
+        self._providers: dict[str, str | None] = {}
+        self._litellm: Any = None
+        self._exception_translators: dict[type, _ExceptionTranslator] = {}
+        self._exception_name_translators: dict[str, _ExceptionTranslator] = {
+            "Timeout": self._timeout_error,
+            "MockTimeout": self._timeout_error,
+            "APIError": self._api_error,
+            "MockAPIError": self._api_error,
+        }
+        # Requests currently being sent, keyed by cache key, so concurrent duplicates share one call
+        self._inflight: dict[str, _InFlightRequest] = {}
+        self._ainflight: dict[str, asyncio.Future[LLMResponse]] = {}
+        self._inflight_lock = threading.Lock()
         self._ensure_litellm()
 
     def _ensure_litellm(self) -> None:
@@ -214,43 +752,57 @@ class LiteLLMClient(BaseLLMClient):
             self._litellm = litellm
             # Enable dropping unsupported params for better compatibility
             litellm.drop_params = True
+            # Resolve litellm's exception classes once so errors dispatch with a single MRO walk
+            for attr, translator in (
+                ("Timeout", self._timeout_error),
+                ("RateLimitError", self._api_error),
+                ("APIError", self._api_error),
+            ):
+                klass = getattr(litellm, attr, None)
+                if isinstance(klass, type):
+                    self._exception_translators[klass] = translator
         except ImportError as e:
             msg = "litellm is not installed. Install with: pip install chartelier[litellm]"
             raise ImportError(msg) from e
 
-    def complete(  # noqa: C901 — Exception handling requires complexity
+    def effective_temperature(self, model: str | None = None, temperature: float | None = None) -> float:
+        """Return the temperature a request is actually sent with."""
+        # GPT-5 models only support temperature=1.0
+        if "gpt-5" in (model or self.settings.model).lower():
+            return 1.0
+        return super().effective_temperature(model, temperature)
+
+    def _build_request_kwargs(
         self,
         messages: list[LLMMessage],
-        *,
-        response_format: ResponseFormat = ResponseFormat.TEXT,
-        **kwargs: Any,  # noqa: ANN401 — LiteLLM requires flexible kwargs
-    ) -> LLMResponse:
-        """Complete a chat conversation using LiteLLM.
+        response_format: ResponseFormat,
+        overrides: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Build the keyword arguments for a litellm completion call.
 
         Args:
             messages: List of messages in the conversation
             response_format: Expected response format
-            **kwargs: Additional parameters for the LLM
+            overrides: Per-call parameters passed to ``complete``
 
         Returns:
-            LLM response
+            Request keyword arguments
         """
-        # Convert messages to dict format
-        message_dicts = [{"role": msg.role, "content": msg.content} for msg in messages]
-
         # Prepare kwargs
-        model = kwargs.get("model", self.settings.model)
-
-        # GPT-5 models only support temperature=1.0
-        temperature = 1.0 if "gpt-5" in model.lower() else kwargs.get("temperature", self.settings.temperature)
+        model = overrides.get("model", self.settings.model)
+        message_dicts = self._structure_messages(messages, model)
 
-        request_kwargs = {
+        request_kwargs: dict[str, Any] = {
             "model": model,
             "messages": message_dicts,
-            "temperature": temperature,
+            "temperature": self.effective_temperature(model, overrides.get("temperature")),
             "timeout": self.settings.timeout,
+            # Retries are handled by _retry_with_backoff; don't let the provider SDK compound them
+            "max_retries": 0,
         }
 
+        # Left unset by default: for reasoning models the budget also covers reasoning tokens,
+        # so a small cap can leave the visible answer empty or cut off
         if self.settings.max_tokens:
             request_kwargs["max_tokens"] = self.settings.max_tokens
 
@@ -260,77 +812,278 @@ class LiteLLMClient(BaseLLMClient):
         if response_format == ResponseFormat.JSON:
             request_kwargs["response_format"] = {"type": "json_object"}
 
+        return request_kwargs
+
+    def _structure_messages(self, messages: list[LLMMessage], model: str) -> list[dict[str, Any]]:
+        """Convert messages to litellm dicts with a stable, cacheable prefix.
+
+        Static instruction messages (system/developer) are moved ahead of the
+        conversation and stripped of trailing whitespace so the prompt prefix is
+        byte-identical across calls, which lets providers reuse their prompt
+        cache. For Anthropic models those messages are also marked with a
+        cache-control breakpoint.
+
+        Args:
+            messages: List of messages in the conversation
+            model: Model the request is sent to
+
+        Returns:
+            Message dicts in litellm format
+        """
+        static = [msg for msg in messages if msg.role in _STATIC_ROLES]
+        dynamic = [msg for msg in messages if msg.role not in _STATIC_ROLES]
+        mark_cache = self._get_provider(model) == "anthropic"
+
+        message_dicts: list[dict[str, Any]] = []
+        for msg in static:
+            content = msg.content.rstrip()
+            if mark_cache:
+                message_dicts.append(
+                    {
+                        "role": msg.role,
+                        "content": [{"type": "text", "text": content, "cache_control": {"type": "ephemeral"}}],
+                    }
+                )
+            else:
+                message_dicts.append({"role": msg.role, "content": content})
+        message_dicts.extend({"role": msg.role, "content": msg.content} for msg in dynamic)
+        return message_dicts
+
+    def _get_provider(self, model: str) -> str | None:
+        """Resolve the provider name litellm routes model to, or None if unknown."""
+        if model not in self._providers:
+            try:
+                provider = self._litellm.get_llm_provider(model)[1]
+            except Exception:  # noqa: BLE001 — Unknown models simply get no provider-specific handling
+                provider = None
+            self._providers[model] = provider if isinstance(provider, str) else None
+        return self._providers[model]
+
+    def _timeout_error(self, e: Exception, model: str) -> ChartelierError:  # noqa: ARG002 — Translator signature
+        """Translate a provider timeout."""
+        return LLMTimeoutError(timeout=self.settings.timeout, model=model)
+
+    def _api_error(self, e: Exception, model: str) -> ChartelierError:  # noqa: ARG002 — Translator signature
+        """Translate a provider API error."""
+        return LLMAPIError(
+            message=str(e),
+            status_code=getattr(e, "status_code", None),
+            retry_after=_retry_after_seconds(e),
+        )
+
+    def _translate_exception(self, e: Exception, model: str) -> ChartelierError | None:
+        """Map a litellm exception to the matching Chartelier error, or None if unrecognized."""
+        translators = self._exception_translators
+        for klass in type(e).__mro__:
+            translator = translators.get(klass)
+            if translator is not None:
+                return translator(e, model)
+        # Fall back to class names so look-alike exceptions (e.g. test doubles) are still recognized
+        name_translator = self._exception_name_translators.get(type(e).__name__)
+        if name_translator is not None:
+            return name_translator(e, model)
+        return None
+
+    def _call_litellm(self, **kwargs: Any) -> Any:  # noqa: ANN401 — Internal wrapper
+        """Call litellm, translating its exceptions to ours.
+
+        Each attempt is bounded by the ``timeout`` request kwarg, which litellm enforces itself.
+        """
+        try:
+            return self._litellm.completion(**kwargs)
+        except Exception as e:
+            translated = self._translate_exception(e, kwargs.get("model", "unknown"))
+            if translated is not None:
+                raise translated from e
+            # Re-raise other exceptions
+            raise
+
+    async def _acall_litellm(self, **kwargs: Any) -> Any:  # noqa: ANN401 — Internal wrapper
+        """Async counterpart of ``_call_litellm`` built on ``litellm.acompletion``."""
+        try:
+            return await asyncio.wait_for(self._litellm.acompletion(**kwargs), timeout=self.settings.timeout)
+        except TimeoutError as e:
+            raise LLMTimeoutError(
+                timeout=self.settings.timeout,
+                model=kwargs.get("model", "unknown"),
+            ) from e
+        except Exception as e:
+            translated = self._translate_exception(e, kwargs.get("model", "unknown"))
+            if translated is not None:
+                raise translated from e
+            raise
+
+    def _prepare_request(
+        self,
+        messages: list[LLMMessage],
+        response_format: ResponseFormat,
+        overrides: dict[str, Any],
+        semantic_query: str | None = None,
+    ) -> tuple[dict[str, Any], LLMResponse | None, SemanticKey | None]:
+        """Build request kwargs, enforce the input ceiling, and consult the caches.
+
+        Args:
+            messages: List of messages in the conversation
+            response_format: Expected response format
+            overrides: Per-call parameters passed to ``complete``
+            semantic_query: Free-form text the semantic cache may match by similarity
+
+        Returns:
+            Tuple of (request kwargs, cached response or None, semantic cache key or None)
+
+        Raises:
+            LLMInputTooLargeError: If the prompt exceeds ``max_input_tokens``
+        """
+        request_kwargs = self._build_request_kwargs(messages, response_format, overrides)
+        model = request_kwargs["model"]
+
+        # Rough 4-chars-per-token estimate keeps oversized prompts from reaching the provider
+        input_tokens_estimate = sum(len(msg.content) for msg in messages) // 4
+        if input_tokens_estimate > self.settings.max_input_tokens:
+            raise LLMInputTooLargeError(input_tokens_estimate, self.settings.max_input_tokens)
+
+        # Only deterministic requests are safe to serve from cache
+        semantic_key = None
+        if request_kwargs["temperature"] == 0:
+            if self.cache is not None:
+                cached = self.cache.get(LLMCache.make_key(request_kwargs))
+                if cached is not None:
+                    self.logger.debug("LLM cache hit", extra={"model": model})
+                    return request_kwargs, cached, None
+            # Requests without a query have nothing to match by similarity
+            if self.semantic_cache is not None and semantic_query:
+                # The key (and its embedding) is kept to store the response on a miss
+                semantic_key = self.semantic_cache.make_key(request_kwargs, semantic_query)
+                cached = self.semantic_cache.get(semantic_key)
+                if cached is not None:
+                    self.logger.debug("LLM semantic cache hit", extra={"model": model})
+                    return request_kwargs, cached, None
+
         # Log request
         self.logger.debug(
             "Sending LLM request",
             extra={
-                "model": request_kwargs["model"],
+                "model": model,
                 "message_count": len(messages),
                 "response_format": response_format.value,
+                "input_tokens_estimate": input_tokens_estimate,
             },
         )
+        return request_kwargs, None, semantic_key
 
-        def _call_litellm(**kwargs: Any) -> Any:  # noqa: ANN401 — Internal wrapper
-            """Inner function that wraps litellm call with exception translation."""
-            try:
-                return self._litellm.completion(**kwargs)
-            except Exception as e:
-                # Check exception type by name or by isinstance if possible
-                exception_name = e.__class__.__name__
-
-                # Check if it's a litellm Timeout exception
-                if exception_name in ("Timeout", "MockTimeout"):
-                    raise LLMTimeoutError(
-                        timeout=self.settings.timeout,
-                        model=kwargs.get("model", "unknown"),
-                    ) from e
-                # Check if it's a litellm APIError exception
-                if exception_name in ("APIError", "MockAPIError"):
-                    raise LLMAPIError(
-                        message=str(e),
-                        status_code=getattr(e, "status_code", None),
-                    ) from e
-                # Try isinstance checks if the attributes are actual types
-                if hasattr(self._litellm, "Timeout"):
-                    try:
-                        if isinstance(e, self._litellm.Timeout):
-                            raise LLMTimeoutError(
-                                timeout=self.settings.timeout,
-                                model=kwargs.get("model", "unknown"),
-                            ) from e
-                    except TypeError:
-                        # isinstance failed, continue
-                        pass
-
-                    try:
-                        if hasattr(self._litellm, "APIError") and isinstance(e, self._litellm.APIError):
-                            raise LLMAPIError(
-                                message=str(e),
-                                status_code=getattr(e, "status_code", None),
-                            ) from e
-                    except TypeError:
-                        # isinstance failed, continue
-                        pass
-
-                # Re-raise other exceptions
-                raise
+    def _finish_request(
+        self,
+        request_kwargs: dict[str, Any],
+        response: Any,  # noqa: ANN401 — Raw litellm response
+        semantic_key: SemanticKey | None = None,
+    ) -> LLMResponse:
+        """Convert a litellm response to ``LLMResponse`` and populate the caches.
+
+        Args:
+            request_kwargs: Keyword arguments the request was sent with
+            response: Raw litellm completion response
+            semantic_key: Semantic cache key built when the request missed, if any
+
+        Returns:
+            LLM response
+        """
+        # Extract response
+        content = response.choices[0].message.content
+
+        llm_response = LLMResponse(
+            content=content,
+            model=response.model,
+            usage=response.usage.model_dump() if response.usage else None,
+            finish_reason=response.choices[0].finish_reason,
+        )
+
+        if request_kwargs["temperature"] == 0:
+            if self.cache is not None:
+                self.cache.set(LLMCache.make_key(request_kwargs), llm_response)
+            if self.semantic_cache is not None and semantic_key is not None:
+                self.semantic_cache.set(semantic_key, llm_response)
+        return llm_response
+
+    def complete(
+        self,
+        messages: list[LLMMessage],
+        *,
+        response_format: ResponseFormat = ResponseFormat.TEXT,
+        deadline: float | None = None,
+        semantic_query: str | None = None,
+        **kwargs: Any,  # noqa: ANN401 — LiteLLM requires flexible kwargs
+    ) -> LLMResponse:
+        """Complete a chat conversation using LiteLLM.
+
+        Args:
+            messages: List of messages in the conversation
+            response_format: Expected response format
+            deadline: Monotonic time after which no attempt is dispatched
+                (defaults to now + timeout * max_retries)
+            semantic_query: Free-form part of the prompt (e.g. the user's query) the
+                semantic cache may match by similarity; the request is not looked up
+                in the semantic cache without it
+            **kwargs: Additional parameters for the LLM
+
+        Returns:
+            LLM response
+        """
+        request_kwargs, cached, semantic_key = self._prepare_request(messages, response_format, kwargs, semantic_query)
+        if cached is not None:
+            return cached
+        if deadline is None:
+            deadline = self._default_deadline()
+
+        # Sampled responses are not interchangeable, so only deterministic requests are shared
+        if request_kwargs["temperature"] != 0:
+            return self._send(request_kwargs, deadline, semantic_key)
+
+        key = LLMCache.make_key(request_kwargs)
+        while True:
+            with self._inflight_lock:
+                flight = self._inflight.get(key)
+                if flight is None:
+                    flight = self._inflight[key] = _InFlightRequest()
+                    break
+
+            self.logger.debug("Joining in-flight LLM request", extra={"model": request_kwargs["model"]})
+            if not flight.done.wait(timeout=max(0.0, deadline - time.monotonic())):
+                raise LLMTimeoutError(timeout=self.settings.timeout, model=request_kwargs["model"])
+            if flight.error is not None:
+                raise _clone_error(flight.error) from flight.error
+            if flight.response is not None:
+                return flight.response
+            # The leader was interrupted (e.g. KeyboardInterrupt) before finishing; take the request over
 
         try:
-            # Execute with retry
-            response = self._retry_with_backoff(
-                _call_litellm,
-                **request_kwargs,
-            )
+            flight.response = self._send(request_kwargs, deadline, semantic_key)
+        except Exception as e:
+            # Only ordinary failures are shared; an interrupt belongs to the leader's thread alone
+            flight.error = e
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+            flight.done.set()
+        return flight.response
+
+    def _send(
+        self, request_kwargs: dict[str, Any], deadline: float, semantic_key: SemanticKey | None = None
+    ) -> LLMResponse:
+        """Send a prepared request with retries and convert the result.
 
-            # Extract response
-            content = response.choices[0].message.content
+        Args:
+            request_kwargs: Keyword arguments for ``litellm.completion``
+            deadline: Monotonic time after which no attempt is dispatched
+            semantic_key: Semantic cache key to store the response under, if any
 
-            return LLMResponse(
-                content=content,
-                model=response.model,
-                usage=response.usage.model_dump() if response.usage else None,
-                finish_reason=response.choices[0].finish_reason,
-            )
+        Returns:
+            LLM response
+        """
+        try:
+            # Execute with retry
+            response = self._retry_with_backoff(self._call_litellm, deadline=deadline, **request_kwargs)
+            return self._finish_request(request_kwargs, response, semantic_key)
 
         except (LLMTimeoutError, LLMAPIError):
             # Re-raise our errors as-is
@@ -339,6 +1092,105 @@ class LiteLLMClient(BaseLLMClient):
             self.logger.exception("Unexpected error in LLM request")
             raise LLMAPIError(message=f"Unexpected error: {e}") from e
 
+    async def acomplete(
+        self,
+        messages: list[LLMMessage],
+        *,
+        response_format: ResponseFormat = ResponseFormat.TEXT,
+        deadline: float | None = None,
+        semantic_query: str | None = None,
+        **kwargs: Any,  # noqa: ANN401 — LiteLLM requires flexible kwargs
+    ) -> LLMResponse:
+        """Complete a chat conversation using ``litellm.acompletion``.
+
+        Args:
+            messages: List of messages in the conversation
+            response_format: Expected response format
+            deadline: Monotonic time after which no attempt is dispatched
+                (defaults to now + timeout * max_retries)
+            semantic_query: Free-form part of the prompt (e.g. the user's query) the
+                semantic cache may match by similarity; the request is not looked up
+                in the semantic cache without it
+            **kwargs: Additional parameters for the LLM
+
+        Returns:
+            LLM response
+        """
+        request_kwargs, cached, semantic_key = self._prepare_request(messages, response_format, kwargs, semantic_query)
+        if cached is not None:
+            return cached
+        if deadline is None:
+            deadline = self._default_deadline()
+
+        if request_kwargs["temperature"] != 0:
+            return await self._asend(request_kwargs, deadline, semantic_key)
+
+        key = LLMCache.make_key(request_kwargs)
+        loop = asyncio.get_running_loop()
+        while (pending := self._ainflight.get(key)) is not None and pending.get_loop() is loop:
+            response = await self._ajoin(pending, request_kwargs["model"], deadline)
+            if response is not None:
+                return response
+
+        future: asyncio.Future[LLMResponse] = loop.create_future()
+        self._ainflight[key] = future
+        try:
+            response = await self._asend(request_kwargs, deadline, semantic_key)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved so an unjoined failure isn't reported as unhandled
+            raise
+        except BaseException:
+            # Cancellation and interrupts belong to the leader's task alone
+            future.cancel()
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            if self._ainflight.get(key) is future:
+                del self._ainflight[key]
+
+    async def _ajoin(self, pending: asyncio.Future[LLMResponse], model: str, deadline: float) -> LLMResponse | None:
+        """Wait for another task's identical request.
+
+        Args:
+            pending: Future the leading task resolves
+            model: Model the request targets
+            deadline: Monotonic time after which waiting is abandoned
+
+        Returns:
+            The shared response, or None if the leader was cancelled and the request must be resent
+        """
+        self.logger.debug("Joining in-flight LLM request", extra={"model": model})
+        try:
+            # Shield so a follower timing out doesn't cancel the leader's request
+            return await asyncio.wait_for(asyncio.shield(pending), max(0.0, deadline - time.monotonic()))
+        except TimeoutError as e:
+            raise LLMTimeoutError(timeout=self.settings.timeout, model=model) from e
+        except asyncio.CancelledError:
+            # A cancelled leader cancels its future; unless this task was cancelled too, take the request over
+            task = asyncio.current_task()
+            if not pending.cancelled() or (task is not None and task.cancelling()):
+                raise
+            return None
+        except Exception as e:
+            raise _clone_error(e) from e
+
+    async def _asend(
+        self, request_kwargs: dict[str, Any], deadline: float, semantic_key: SemanticKey | None = None
+    ) -> LLMResponse:
+        """Async counterpart of ``_send``."""
+        try:
+            response = await self._aretry_with_backoff(self._acall_litellm, deadline=deadline, **request_kwargs)
+            return self._finish_request(request_kwargs, response, semantic_key)
+
+        except (LLMTimeoutError, LLMAPIError):
+            raise
+        except Exception as e:
+            self.logger.exception("Unexpected error in LLM request")
+            raise LLMAPIError(message=f"Unexpected error: {e}") from e
+
 
 class MockLLMClient(BaseLLMClient):
     """Mock LLM client for testing."""
@@ -346,6 +1198,7 @@ class MockLLMClient(BaseLLMClient):
     def __init__(
         self,
         settings: LLMSettings | None = None,
+        cache: LLMCache | None = None,
         *,
         default_response: str | None = None,
         simulate_timeout: bool = False,
@@ -355,11 +1208,12 @@ class MockLLMClient(BaseLLMClient):
 
         Args:
             settings: LLM settings
+            cache: Response cache (accepted for interface parity; mock responses are never cached)
             default_response: Default response to return
             simulate_timeout: Whether to simulate timeout
             simulate_error: Whether to simulate API error
         """
-        super().__init__(settings)
+        super().__init__(settings, cache)
         self.default_response = default_response or "Mock response"
         self.simulate_timeout = simulate_timeout
         self.simulate_error = simulate_error
@@ -367,6 +1221,21 @@ class MockLLMClient(BaseLLMClient):
         self.last_messages: list[LLMMessage] | None = None
         self.last_kwargs: dict[str, Any] = {}
 
+    @property
+    def default_response(self) -> str:
+        """Response content returned for text requests."""
+        return self._default_response
+
+    @default_response.setter
+    def default_response(self, value: str) -> None:
+        # Validate and wrap the JSON form once instead of on every call
+        self._default_response = value
+        try:
+            json.loads(value)
+            self._json_content = value
+        except (json.JSONDecodeError, TypeError):
+            self._json_content = json.dumps({"response": value})
+
     def complete(
         self,
         messages: list[LLMMessage],
@@ -402,16 +1271,7 @@ class MockLLMClient(BaseLLMClient):
                 status_code=500,
             )
 
-        # Generate response based on format
-        if response_format == ResponseFormat.JSON:
-            # Try to parse the default response as JSON, or create a simple JSON
-            try:
-                json.loads(self.default_response)
-                content = self.default_response
-            except (json.JSONDecodeError, TypeError):
-                content = json.dumps({"response": self.default_response})
-        else:
-            content = self.default_response
+        content = self._json_content if response_format == ResponseFormat.JSON else self._default_response
 
         return LLMResponse(
             content=content,
@@ -421,6 +1281,81 @@ class MockLLMClient(BaseLLMClient):
         )
 
 
+@functools.lru_cache(maxsize=1)
+def _default_settings() -> LLMSettings:
+    """Return the process-wide settings loaded from the environment.
+
+    The environment is read once; call ``_default_settings.cache_clear()`` after
+    changing ``CHARTELIER_LLM_*`` variables at runtime.
+    """
+    return LLMSettings()
+
+
+# Shared caches keyed by the settings that shape them, so clients configured alike share one
+_shared_caches: dict[tuple[str | None, int, int], LLMCache] = {}
+_shared_semantic_caches: dict[tuple[str, float, int], SemanticLLMCache] = {}
+_shared_cache_lock = threading.Lock()
+
+
+def get_llm_cache(settings: LLMSettings) -> LLMCache | None:
+    """Return the process-wide response cache described by settings.
+
+    Clients whose settings name the same cache path, TTL and size share one instance.
+
+    Args:
+        settings: LLM settings
+
+    Returns:
+        Shared cache instance, or None if caching is disabled
+    """
+    if not settings.cache_enabled:
+        return None
+
+    key = (settings.cache_path, settings.cache_ttl, settings.cache_max_entries)
+    with _shared_cache_lock:
+        cache = _shared_caches.get(key)
+        if cache is None:
+            if settings.cache_path:
+                cache = SQLiteLLMCache(
+                    settings.cache_path, max_entries=settings.cache_max_entries, ttl_seconds=settings.cache_ttl
+                )
+            else:
+                cache = LLMCache(max_entries=settings.cache_max_entries, ttl_seconds=settings.cache_ttl)
+            _shared_caches[key] = cache
+        return cache
+
+
+def get_semantic_llm_cache(settings: LLMSettings) -> SemanticLLMCache | None:
+    """Return the process-wide semantic response cache described by settings.
+
+    Clients whose settings name the same embedding model, threshold and size share one instance.
+
+    Args:
+        settings: LLM settings
+
+    Returns:
+        Shared semantic cache instance, or None if disabled or fastembed is unavailable
+    """
+    if not settings.semantic_cache:
+        return None
+
+    key = (settings.semantic_cache_model, settings.semantic_cache_threshold, settings.cache_max_entries)
+    with _shared_cache_lock:
+        cache = _shared_semantic_caches.get(key)
+        if cache is None:
+            try:
+                embed = load_fastembed_embedder(settings.semantic_cache_model)
+            except ImportError:
+                logger.warning("fastembed not available, semantic cache disabled")
+                return None
+            cache = _shared_semantic_caches[key] = SemanticLLMCache(
+                embed,
+                threshold=settings.semantic_cache_threshold,
+                max_entries=settings.cache_max_entries,
+            )
+        return cache
+
+
 def get_llm_client(settings: LLMSettings | None = None) -> LLMClient:
     """Factory function to get appropriate LLM client.
 
@@ -430,14 +1365,15 @@ def get_llm_client(settings: LLMSettings | None = None) -> LLMClient:
     Returns:
         LLM client instance
     """
-    settings = settings or LLMSettings()
+    settings = settings or _default_settings()
+    cache = get_llm_cache(settings)
 
     if settings.disable_llm:
         logger.info("LLM disabled, using mock client")
-        return MockLLMClient(settings)
+        return MockLLMClient(settings, cache)
 
     try:
-        return LiteLLMClient(settings)
+        return LiteLLMClient(settings, cache, get_semantic_llm_cache(settings))
     except ImportError:
         logger.warning("LiteLLM not available, falling back to mock client")
-        return MockLLMClient(settings)
+        return MockLLMClient(settings, cache)
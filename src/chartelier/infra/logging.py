@@ -5,22 +5,72 @@ common fields for monitoring and debugging. It does NOT handle PII filtering
 directly - that responsibility lies with the calling components.
 """
 
+import functools
 import hashlib
-import json
 import logging
 import os
 import re
 import sys
+import time
 import traceback
-from datetime import UTC, datetime
 from typing import Any
 
+from chartelier.infra.serialization import dumps
+
 __all__ = ["StructuredLogger", "configure_logging", "get_logger", "redact_query"]
 
 
+# LogRecord attributes that are not user-supplied extra fields
+_EXCLUDED_FIELDS = frozenset(
+    {
+        "name",
+        "msg",
+        "args",
+        "created",
+        "filename",
+        "funcName",
+        "levelname",
+        "levelno",
+        "lineno",
+        "module",
+        "msecs",
+        "message",
+        "pathname",
+        "process",
+        "processName",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+    }
+)
+
+
 class StructuredFormatter(logging.Formatter):
     """Formatter that outputs JSON-structured log entries."""
 
+    def __init__(self) -> None:
+        """Initialize formatter with an empty timestamp cache."""
+        super().__init__()
+        # (epoch second, ISO prefix) - the prefix is only reformatted when the second changes
+        self._ts_cache: tuple[int, str] = (-1, "")
+
+    def _timestamp(self, created: float) -> str:
+        """Format an epoch timestamp as ISO 8601 UTC with microseconds."""
+        sec = int(created)
+        # Round like datetime.fromtimestamp so output matches the previous isoformat() values
+        usec = round((created - sec) * 1_000_000)
+        if usec >= 1_000_000:
+            sec += 1
+            usec -= 1_000_000
+        cached_sec, prefix = self._ts_cache
+        if sec != cached_sec:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+            self._ts_cache = (sec, prefix)
+        return f"{prefix}.{usec:06d}+00:00"
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON.
 
@@ -31,39 +81,16 @@ class StructuredFormatter(logging.Formatter):
             JSON-formatted log string.
         """
         log_entry = {
-            "ts": datetime.now(UTC).isoformat(),
+            "ts": self._timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
         }
 
         # Add any extra fields from the record
-        excluded_fields = {
-            "name",
-            "msg",
-            "args",
-            "created",
-            "filename",
-            "funcName",
-            "levelname",
-            "levelno",
-            "lineno",
-            "module",
-            "msecs",
-            "message",
-            "pathname",
-            "process",
-            "processName",
-            "relativeCreated",
-            "thread",
-            "threadName",
-            "exc_info",
-            "exc_text",
-            "stack_info",
-        }
-        log_entry.update({key: value for key, value in record.__dict__.items() if key not in excluded_fields})
+        log_entry.update({key: value for key, value in record.__dict__.items() if key not in _EXCLUDED_FIELDS})
 
-        return json.dumps(log_entry, ensure_ascii=False, default=str)
+        return dumps(log_entry, default=str)
 
 
 class StructuredLogger:
@@ -77,47 +104,48 @@ class StructuredLogger:
         """
         self._logger = logger
 
-    def _log(
-        self,
-        level: int,
-        msg: str,
-        **kwargs: Any,
-    ) -> None:
-        """Internal log method with extra fields support.
+    def isEnabledFor(self, level: int) -> bool:  # noqa: N802 — Mirrors logging.Logger
+        """Return whether a message at level would be emitted.
 
-        Args:
-            level: Log level.
-            msg: Log message.
-            **kwargs: Additional fields to include in the log entry.
+        Lets callers skip building expensive ``extra`` payloads for disabled levels.
         """
-        extra = dict(kwargs)
-        self._logger.log(level, msg, extra=extra)
+        return self._logger.isEnabledFor(level)
+
+    # Each level method checks isEnabledFor before anything else so disabled calls never
+    # reach the logging machinery; kwargs is already a fresh dict and is passed as extra as-is.
 
     def debug(self, msg: str, *args: Any, **kwargs: Any) -> None:  # noqa: ARG002
         """Log debug message."""
-        self._log(logging.DEBUG, msg, **kwargs)
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.log(logging.DEBUG, msg, extra=kwargs)
 
     def info(self, msg: str, *args: Any, **kwargs: Any) -> None:  # noqa: ARG002
         """Log info message."""
-        self._log(logging.INFO, msg, **kwargs)
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.log(logging.INFO, msg, extra=kwargs)
 
     def warning(self, msg: str, *args: Any, **kwargs: Any) -> None:  # noqa: ARG002
         """Log warning message."""
-        self._log(logging.WARNING, msg, **kwargs)
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._logger.log(logging.WARNING, msg, extra=kwargs)
 
     def error(self, msg: str, *args: Any, **kwargs: Any) -> None:  # noqa: ARG002
         """Log error message."""
-        self._log(logging.ERROR, msg, **kwargs)
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._logger.log(logging.ERROR, msg, extra=kwargs)
 
     def critical(self, msg: str, *args: Any, **kwargs: Any) -> None:  # noqa: ARG002
         """Log critical message."""
-        self._log(logging.CRITICAL, msg, **kwargs)
+        if self._logger.isEnabledFor(logging.CRITICAL):
+            self._logger.log(logging.CRITICAL, msg, extra=kwargs)
 
     def exception(self, msg: str, **kwargs: Any) -> None:
         """Log exception with traceback."""
-        extra = dict(kwargs)
-        extra["traceback"] = traceback.format_exc()
-        self._logger.exception(msg, extra=extra)
+        # Formatting the traceback is the expensive part; skip it when ERROR is disabled
+        if not self._logger.isEnabledFor(logging.ERROR):
+            return
+        kwargs["traceback"] = traceback.format_exc()
+        self._logger.exception(msg, extra=kwargs)
 
 
 def get_logger(name: str) -> StructuredLogger:
@@ -168,6 +196,22 @@ def configure_logging(level: int = logging.INFO, stream: Any = sys.stdout) -> No
     root_logger.propagate = False
 
 
+@functools.lru_cache(maxsize=8)
+def _redaction_pattern(threshold: int) -> re.Pattern[str]:
+    """Compile the pattern matching whitespace-delimited tokens that must be redacted.
+
+    A token qualifies when it is at least ``threshold`` characters long and contains
+    a character other than digits, dots, and hyphens, so numeric tokens never match.
+    """
+    return re.compile(rf"(?<!\S)(?=\S*[^\s0-9.\-])\S{{{threshold},}}(?!\S)")
+
+
+def _hash_token(match: re.Match[str]) -> str:
+    """Replace a matched token with a short stable hash."""
+    digest = hashlib.blake2b(match.group(0).encode(), digest_size=4).hexdigest()
+    return f"[REDACTED_{digest}]"
+
+
 def redact_query(query: str, threshold: int = 16) -> str:
     """Redact long non-numeric strings in query for privacy.
 
@@ -181,15 +225,4 @@ def redact_query(query: str, threshold: int = 16) -> str:
     Returns:
         Query string with long non-numeric parts replaced by hashes.
     """
-
-    def replace_long_string(match: re.Match[str]) -> str:
-        """Replace long non-numeric strings with hash."""
-        text = match.group(0)
-        if len(text) >= threshold and not text.replace(".", "").replace("-", "").isdigit():
-            hash_value = hashlib.sha256(text.encode()).hexdigest()[:8]
-            return f"[REDACTED_{hash_value}]"
-        return text
-
-    # Pattern to match continuous non-whitespace sequences
-    pattern = r"\S+"
-    return re.sub(pattern, replace_long_string, query)
+    return _redaction_pattern(threshold).sub(_hash_token, query)
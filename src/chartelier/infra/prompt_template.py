@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import functools
+import re
+import tomllib
 from pathlib import Path
 from typing import Any
 
-import toml
 from jinja2 import Environment, StrictUndefined, Template, TemplateError, UndefinedError, meta
 from pydantic import BaseModel, Field, field_validator
 
@@ -14,6 +16,15 @@ from chartelier.infra.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Shared Jinja2 environment with strict undefined to catch missing variables.
+# Note: autoescape=False is safe here as we're generating LLM prompts, not HTML
+_ENV = Environment(
+    undefined=StrictUndefined,
+    trim_blocks=True,
+    lstrip_blocks=True,
+    autoescape=False,  # noqa: S701 - Safe for LLM prompts, not HTML
+)
+
 
 class PromptMessage(BaseModel):
     """Definition of a single prompt message."""
@@ -78,21 +89,26 @@ class PromptTemplate:
 
         self.config = self._load_config()
 
-        # Initialize Jinja2 environment with strict undefined to catch missing variables
-        # Note: autoescape=False is safe here as we're generating LLM prompts, not HTML
-        self.env = Environment(
-            undefined=StrictUndefined,
-            trim_blocks=True,
-            lstrip_blocks=True,
-            autoescape=False,  # noqa: S701 - Safe for LLM prompts, not HTML
-        )
+        self.env = _ENV
 
-        # Pre-compile templates for better performance
-        self._compiled_templates: list[tuple[PromptMessage, Template]] = []
+        # Pre-compile templates for better performance. Messages without variables are
+        # rendered once here so the static prompt prefix is byte-identical on every call.
+        # For the others, the literal lines before the first Jinja2 tag are kept as a
+        # plain string and only the remainder goes through the template engine.
+        self._compiled_templates: list[tuple[PromptMessage, str, Template | None]] = []
+        self._required_variables: frozenset[str] = frozenset()
         for message in self.config.messages:
             try:
-                template = self.env.from_string(message.content)
-                self._compiled_templates.append((message, template))
+                variables = meta.find_undeclared_variables(self.env.parse(message.content))  # type: ignore[no-untyped-call]
+                if variables:
+                    prefix, body = _split_literal_prefix(message.content)
+                    self._compiled_templates.append((message, prefix, self.env.from_string(body)))
+                else:
+                    static_content = self.env.from_string(message.content).render()
+                    if message.do_strip:
+                        static_content = static_content.strip()
+                    self._compiled_templates.append((message, static_content, None))
+                self._required_variables |= variables
             except TemplateError as e:
                 msg = f"Invalid Jinja2 template in {self.prompt_path}: {e}"
                 raise PromptTemplateError(msg) from e
@@ -116,9 +132,9 @@ class PromptTemplate:
             PromptTemplateError: If TOML parsing or validation fails
         """
         try:
-            with self.prompt_path.open(encoding="utf-8") as f:
-                data = toml.load(f)
-        except toml.TomlDecodeError as e:
+            with self.prompt_path.open("rb") as f:
+                data = tomllib.load(f)
+        except tomllib.TOMLDecodeError as e:
             msg = f"Invalid TOML in {self.prompt_path}: {e}"
             raise PromptTemplateError(msg) from e
         except Exception as e:
@@ -136,7 +152,10 @@ class PromptTemplate:
         """Create PromptTemplate from component directory and prompt name.
 
         This is a convenience method that constructs the path to the prompt
-        file based on the component's directory structure.
+        file based on the component's directory structure. Instances are cached
+        per resolved path and modification time, so the TOML parse and Jinja2
+        compilation run once per file per process; editing the file invalidates
+        the cached instance.
 
         Args:
             component_path: Path to the component directory (usually Path(__file__).parent)
@@ -145,14 +164,27 @@ class PromptTemplate:
         Returns:
             PromptTemplate instance
 
+        Raises:
+            FileNotFoundError: If the TOML file doesn't exist
+
         Example:
             >>> template = PromptTemplate.from_component(
             ...     Path(__file__).parent,
             ...     "pattern_selection"
             ... )
         """
-        prompt_path = component_path / "prompts" / f"{prompt_name}.toml"
-        return cls(prompt_path)
+        prompt_path = (component_path / "prompts" / f"{prompt_name}.toml").resolve()
+        try:
+            mtime_ns = prompt_path.stat().st_mtime_ns
+        except FileNotFoundError as e:
+            msg = f"Prompt template file not found: {prompt_path}"
+            raise FileNotFoundError(msg) from e
+        return _load_cached(str(prompt_path), mtime_ns)
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached instances created by :meth:`from_component`."""
+        _load_cached.cache_clear()
 
     def render(self, **kwargs: Any) -> list[LLMMessage]:  # noqa: ANN401
         """Render the prompt template with provided variables.
@@ -169,9 +201,13 @@ class PromptTemplate:
         """
         messages = []
 
-        for message, template in self._compiled_templates:
+        for message, prefix, template in self._compiled_templates:
+            if template is None:
+                messages.append(LLMMessage(role=message.role, content=prefix))
+                continue
+
             try:
-                content = template.render(**kwargs)
+                content = prefix + template.render(**kwargs)
             except UndefinedError as e:
                 msg = f"Missing required variable for prompt template: {e}. Available variables: {list(kwargs.keys())}"
                 raise UndefinedError(msg) from e
@@ -196,21 +232,16 @@ class PromptTemplate:
 
         return messages
 
-    def get_required_variables(self) -> set[str]:
+    def get_required_variables(self) -> frozenset[str]:
         """Get set of variable names used in the templates.
 
-        This uses Jinja2's meta API to find undeclared variables.
+        The variables are collected with Jinja2's meta API when the template is loaded,
+        so this is a constant-time lookup.
 
         Returns:
-            Set of variable names required by the templates
+            Immutable set of variable names required by the templates
         """
-        all_variables = set()
-        for message in self.config.messages:
-            ast = self.env.parse(message.content)
-            variables = meta.find_undeclared_variables(ast)
-            all_variables.update(variables)
-
-        return all_variables
+        return self._required_variables
 
     @property
     def version(self) -> str:
@@ -220,3 +251,38 @@ class PromptTemplate:
     def __repr__(self) -> str:
         """String representation of PromptTemplate."""
         return f"PromptTemplate(path={self.prompt_path}, version={self.config.version})"
+
+
+_TAG_START = re.compile(r"\{[{%#]")
+
+
+def _split_literal_prefix(source: str) -> tuple[str, str]:
+    """Split a template source into a literal head and the part Jinja2 must render.
+
+    The split happens at the last newline before the first tag so that
+    ``lstrip_blocks``/``trim_blocks`` see the remainder exactly as they would
+    have in the full source.
+
+    Args:
+        source: Jinja2 template source
+
+    Returns:
+        Tuple of (literal prefix, remaining template source)
+    """
+    match = _TAG_START.search(source)
+    if match is None:
+        return "", source
+    cut = source.rfind("\n", 0, match.start()) + 1
+    # Jinja2 normalizes line endings in template data; mirror that for the literal part
+    prefix = source[:cut].replace("\r\n", "\n").replace("\r", "\n")
+    return prefix, source[cut:]
+
+
+@functools.lru_cache(maxsize=128)
+def _load_cached(path_str: str, mtime_ns: int) -> PromptTemplate:  # noqa: ARG001 - mtime_ns is part of the cache key
+    """Load a PromptTemplate once per (path, mtime) pair.
+
+    Cached instances are shared across callers; they are never mutated after
+    construction and Jinja2 template rendering is thread-safe.
+    """
+    return PromptTemplate(path_str)
@@ -0,0 +1,65 @@
+"""JSON serialization helpers.
+
+orjson is used when installed (the ``speedups`` extra); otherwise the stdlib ``json``
+module is. Both accept and reject the same documents, and callers handle a single
+error type either way: ``json.JSONDecodeError``.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - orjson is an optional accelerator
+    _orjson = None  # type: ignore[assignment]
+
+__all__ = ["dumps", "loads"]
+
+
+def loads(data: str | bytes) -> Any:  # noqa: ANN401 — Arbitrary JSON value
+    """Parse a JSON document.
+
+    Args:
+        data: JSON text, as str or UTF-8 bytes
+
+    Returns:
+        Parsed value
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.loads(data)
+        except _orjson.JSONDecodeError:
+            # orjson is stricter than the stdlib (NaN/Infinity, lone surrogates), so the stdlib
+            # parser has the final say and installing the extra never changes what is accepted
+            pass
+    if isinstance(data, bytes):
+        # json.loads would raise UnicodeDecodeError here; report it like orjson does
+        try:
+            text = data.decode()
+        except UnicodeDecodeError as e:
+            msg = f"Invalid UTF-8: {e.reason}"
+            raise json.JSONDecodeError(msg, data.decode(errors="replace"), e.start) from e
+        return json.loads(text)
+    return json.loads(data)
+
+
+def dumps(value: Any, *, default: Callable[[Any], Any] | None = None) -> str:  # noqa: ANN401 — Arbitrary JSON value
+    """Serialize a value to a JSON string, leaving non-ASCII characters unescaped.
+
+    Args:
+        value: Value to serialize
+        default: Called for objects that aren't natively serializable
+
+    Returns:
+        JSON text
+    """
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(value, default=default).decode()
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib encoder handles them
+    return json.dumps(value, ensure_ascii=False, default=default)
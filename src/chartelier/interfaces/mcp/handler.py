@@ -1,156 +1,320 @@
 """MCP protocol handler implementation."""
 
 import json
+import logging
+from collections.abc import Callable
 from typing import Any
 
-from pydantic import ValidationError
+from pydantic import BaseModel
 
 from chartelier.core.enums import MCPErrorCode
 from chartelier.core.errors import ChartelierError
 from chartelier.infra.logging import get_logger
+from chartelier.infra.serialization import dumps, loads
 from chartelier.interfaces.mcp.protocol import (
     ImageContent,
-    InitializeResult,
-    JSONRPCError,
-    JSONRPCRequest,
     JSONRPCResponse,
     MCPMethod,
-    TextContent,
-    ToolCallParams,
     ToolCallResult,
-    ToolsListResult,
-    get_chartelier_tool,
+    get_initialize_result_json,
+    get_tools_list_json,
 )
 from chartelier.interfaces.validators import RequestValidator
 from chartelier.orchestration import Coordinator
 
 logger = get_logger(__name__)
 
+# Upper bound on a raw JSON-RPC message. The data argument is capped by the request
+# validator; JSON string escaping inflates it by up to 6x (a control character becomes
+# a 6-byte \uXXXX escape), plus the envelope and query, so data within the validator's
+# cap is never refused here. This bounds parsing work rather than the memory already
+# spent reading the line.
+MAX_MESSAGE_BYTES = 7 * RequestValidator.MAX_DATA_SIZE_BYTES
+
+
+def _message_size_exceeds_cap(message: str | bytes) -> bool:
+    """Return whether a message is over MAX_MESSAGE_BYTES once UTF-8 encoded.
+
+    Text is only encoded when its length alone can't decide, since a character takes
+    one to four bytes.
+
+    Args:
+        message: Raw JSON-RPC message
+
+    Returns:
+        True if the message's UTF-8 size exceeds the cap
+    """
+    if isinstance(message, bytes) or message.isascii() or len(message) > MAX_MESSAGE_BYTES:
+        return len(message) > MAX_MESSAGE_BYTES
+    if 4 * len(message) <= MAX_MESSAGE_BYTES:
+        return False
+    return len(message.encode("utf-8", "surrogatepass")) > MAX_MESSAGE_BYTES
+
+
+def _parse_message(message: str | bytes) -> tuple[Any, str | None]:
+    """Parse a JSON-RPC message and check its envelope.
+
+    Messages larger than MAX_MESSAGE_BYTES (700 MiB) in UTF-8, whether passed as bytes or
+    text, are refused before their JSON is decoded.
+
+    Args:
+        message: Raw JSON-RPC message
+
+    Returns:
+        Tuple of (parsed message or None, reason it is not a valid request or None)
+    """
+    if _message_size_exceeds_cap(message):
+        return None, f"Request exceeds {MAX_MESSAGE_BYTES} bytes"
+    data = loads(message)
+    return data, _invalid_request_reason(data)
+
+
+def _invalid_request_reason(data: Any) -> str | None:  # noqa: ANN401 — Arbitrary parsed JSON
+    """Check the JSON-RPC request envelope.
+
+    Args:
+        data: Parsed JSON message
+
+    Returns:
+        Why the message is not a valid request, or None if it is valid
+    """
+    if not isinstance(data, dict):
+        return "Request must be a JSON object"
+    if data.get("jsonrpc", "2.0") != "2.0":
+        return "Unsupported JSON-RPC version"
+    if not isinstance(data.get("method"), str):
+        return "Request method must be a string"
+    request_id = data.get("id")
+    if request_id is not None and (isinstance(request_id, bool) or not isinstance(request_id, int | str)):
+        return "Request id must be a string, number or null"
+    params = data.get("params")
+    if params is not None and not isinstance(params, dict):
+        return "Request params must be an object"
+    return None
+
+
+def _invalid_tool_call_reason(params: dict[str, Any]) -> str | None:
+    """Check tools/call parameters against the ToolCallParams shape.
+
+    The arguments are passed to RequestValidator unchanged, so only their type is checked here.
+
+    Args:
+        params: Tool call parameters
+
+    Returns:
+        Reason the parameters are invalid, or None when they are valid
+    """
+    if not isinstance(params.get("name"), str):
+        return "'name' must be a string"
+    if not isinstance(params.get("arguments"), dict):
+        return "'arguments' must be an object"
+    return None
+
+
+# Error responses have a fixed shape, so they are formatted from a template instead of
+# building JSONRPCError/JSONRPCResponse models; only id, message and data vary.
+_ERROR_RESPONSE_TEMPLATE = '{"jsonrpc":"2.0","id":%s,"error":{"code":%d,"message":%s,"data":%s}}'
+
+
+def _encode(value: str | int | None) -> str:
+    """JSON-encode a scalar for splicing into a response template."""
+    return dumps(value)
+
+
+def _error_response(request_id: int | str, code: MCPErrorCode, message: str, data: str | None = None) -> str:
+    """Serialize a JSON-RPC error response.
+
+    Args:
+        request_id: ID of the request being answered (0 when it cannot be determined)
+        code: JSON-RPC error code
+        message: Error message
+        data: Optional additional error information
+
+    Returns:
+        JSON-RPC response string
+    """
+    return _ERROR_RESPONSE_TEMPLATE % (_encode(request_id), code, _encode(message), _encode(data))
+
+
+_MethodHandler = Callable[[dict[str, Any]], BaseModel | dict[str, Any] | str | None]
+
+
+def _success_response(request_id: int | str, result: BaseModel | dict[str, Any] | str) -> str:
+    """Serialize a JSON-RPC success response.
+
+    Args:
+        request_id: ID of the request being answered
+        result: Result model or dict, or a result that is already serialized JSON
+
+    Returns:
+        JSON-RPC response string
+    """
+    if isinstance(result, str):
+        # Splice the pre-serialized result into the envelope instead of re-encoding it
+        return f'{{"jsonrpc":"2.0","id":{_encode(request_id)},"result":{result}}}'
+    return JSONRPCResponse(id=request_id, result=result).model_dump_json(exclude_none=True)
+
+
+def _text_error(text: str, structured_content: dict[str, Any] | None = None) -> dict[str, Any]:
+    """Build an error tools/call result as a plain dict.
+
+    Error results only hold text, so the ToolCallResult shape is written out directly.
+
+    Args:
+        text: Error message shown to the client
+        structured_content: Optional machine-readable error details
+
+    Returns:
+        Tool call result dict
+    """
+    result: dict[str, Any] = {"content": [{"type": "text", "text": text}]}
+    if structured_content is not None:
+        result["structuredContent"] = structured_content
+    result["isError"] = True
+    return result
+
 
 class MCPHandler:
     """Handler for MCP protocol messages."""
 
+    __slots__ = ("_dispatch", "coordinator", "initialized", "request_count", "validator")
+
     def __init__(self) -> None:
         """Initialize the MCP handler."""
         self.initialized = False
         self.request_count = 0
         self.validator = RequestValidator()
         self.coordinator = Coordinator()
+        # Method name -> handler; a handler returning None sends no response
+        self._dispatch: dict[str, _MethodHandler] = {
+            MCPMethod.INITIALIZE.value: self._handle_initialize,
+            MCPMethod.INITIALIZED.value: self._handle_initialized,
+            MCPMethod.TOOLS_LIST.value: self._handle_tools_list,
+            MCPMethod.TOOLS_CALL.value: self._handle_tools_call,
+            MCPMethod.PING.value: self._handle_ping,
+        }
 
-    def handle_message(self, message: str) -> str | None:
+    def handle_message(self, message: str | bytes) -> str | None:
         """Handle a JSON-RPC message and return response.
 
         Args:
-            message: Raw JSON-RPC message string
+            message: Raw JSON-RPC message, as text or UTF-8 bytes
 
         Returns:
             JSON-RPC response string or None if no response needed
         """
+        # ID to answer with if handling fails; 0 until a valid request ID is parsed
+        parsed_id: int | str = 0
         try:
-            # Parse JSON-RPC request
-            data = json.loads(message)
-            request = JSONRPCRequest(**data)
+            # Parse JSON-RPC request. The envelope is checked by hand instead of through
+            # JSONRPCRequest, which would run pydantic validation on every message.
+            data, invalid_reason = _parse_message(message)
+            if invalid_reason is not None:
+                logger.warning("Invalid JSON-RPC request", reason=invalid_reason)
+                request_id = data.get("id") if isinstance(data, dict) else None
+                if not isinstance(request_id, int | str) or isinstance(request_id, bool):
+                    request_id = 0
+                return _error_response(request_id, MCPErrorCode.INVALID_REQUEST, "Invalid Request", invalid_reason)
+            request_id = data.get("id")
+            if request_id is not None:
+                parsed_id = request_id
+            method: str = data["method"]
+            params: dict[str, Any] = data.get("params") or {}
 
-            # Log request (without data content)
-            if request.id is not None:
-                logger.info(
-                    "Received MCP request",
-                    extra={
-                        "method": request.method,
-                        "id": request.id,
-                        "request_count": self.request_count,
-                    },
-                )
-            else:
-                logger.info(
-                    "Received MCP notification",
-                    extra={
-                        "method": request.method,
-                        "request_count": self.request_count,
-                    },
-                )
+            # Log request (without data content). The level is checked first so the quiet
+            # default (WARNING) doesn't pay for building the extra dicts on every message.
+            if logger.isEnabledFor(logging.INFO):
+                if request_id is not None:
+                    logger.info(
+                        "Received MCP request",
+                        extra={
+                            "method": method,
+                            "id": request_id,
+                            "request_count": self.request_count,
+                        },
+                    )
+                else:
+                    logger.info(
+                        "Received MCP notification",
+                        extra={
+                            "method": method,
+                            "request_count": self.request_count,
+                        },
+                    )
             self.request_count += 1
 
-            # Route to appropriate handler
-            if request.method == MCPMethod.INITIALIZE:
-                result = self._handle_initialize(request.params or {})
-            elif request.method == MCPMethod.INITIALIZED:
-                # No response needed for initialized notification
-                self.initialized = True
-                logger.info("MCP connection initialized")
-                return None
-            elif request.method == MCPMethod.TOOLS_LIST:
-                result = self._handle_tools_list()
-            elif request.method == MCPMethod.TOOLS_CALL:
-                result = self._handle_tools_call(request.params or {})
-            elif request.method == MCPMethod.PING:
-                result = {}  # Empty object for ping response
-            else:
-                # Method not found
-                error = JSONRPCError(
-                    code=MCPErrorCode.METHOD_NOT_FOUND,
-                    message=f"Method not found: {request.method}",
-                )
-                response = JSONRPCResponse(id=request.id if request.id is not None else 0, error=error.model_dump())
-                return json.dumps(response.model_dump(exclude_none=True))
+            # Route to appropriate handler. Results stay pydantic models until the response
+            # boundary, where the whole envelope is serialized in one pass. A str result is
+            # JSON serialized ahead of time and is spliced into the envelope as is.
+            handler = self._dispatch.get(method)
+            if handler is None:
+                return _error_response(parsed_id, MCPErrorCode.METHOD_NOT_FOUND, f"Method not found: {method}")
+
+            result = handler(params)
 
-            # Create success response (only if we have a result and an ID)
-            if request.id is not None:
-                response = JSONRPCResponse(id=request.id, result=result)
-                return json.dumps(response.model_dump(exclude_none=True))
+            # Create success response (only if we have a result and an ID). Notification
+            # handlers (e.g. initialized) return None and produce no response.
+            if result is not None and request_id is not None:
+                return _success_response(request_id, result)
             # Notifications don't need a response
             return None  # noqa: TRY300
 
         except json.JSONDecodeError as e:
             # Invalid JSON
             logger.error("Invalid JSON received: %s", e)  # noqa: TRY400
-            error_response = JSONRPCResponse(
-                id=0,  # Use 0 when ID cannot be determined
-                error=JSONRPCError(
-                    code=MCPErrorCode.PARSE_ERROR,
-                    message="Parse error: Invalid JSON",
-                    data=str(e),
-                ).model_dump(),
-            )
-            return json.dumps(error_response.model_dump(exclude_none=True))
+            # Use 0 when ID cannot be determined
+            return _error_response(0, MCPErrorCode.PARSE_ERROR, "Parse error: Invalid JSON", str(e))
         except Exception as e:
             # Internal error
             logger.exception("Internal error handling MCP request")
-            error_response = JSONRPCResponse(
-                id=data.get("id", 0) if "data" in locals() else 0,
-                error=JSONRPCError(
-                    code=MCPErrorCode.INTERNAL_ERROR,
-                    message="Internal error",
-                    data=str(e),
-                ).model_dump(),
-            )
-            return json.dumps(error_response.model_dump(exclude_none=True))
+            return _error_response(parsed_id, MCPErrorCode.INTERNAL_ERROR, "Internal error", str(e))
 
-    def _handle_initialize(self, params: dict[str, Any]) -> dict[str, Any]:
+    def _handle_initialize(self, params: dict[str, Any]) -> str:
         """Handle initialize request.
 
         Args:
             params: Initialize parameters
 
         Returns:
-            Initialize result
+            Serialized initialize result
+        """
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Handling initialize request", extra={"params": params})
+        return get_initialize_result_json()
+
+    def _handle_initialized(self, params: dict[str, Any]) -> None:  # noqa: ARG002 — Dispatch signature
+        """Handle initialized notification (no response is sent).
+
+        Args:
+            params: Notification parameters (unused)
         """
-        logger.info("Handling initialize request", extra={"params": params})
-        result = InitializeResult()
-        return result.model_dump(by_alias=True)
+        self.initialized = True
+        logger.info("MCP connection initialized")
 
-    def _handle_tools_list(self) -> dict[str, Any]:
+    def _handle_ping(self, params: dict[str, Any]) -> str:  # noqa: ARG002 — Dispatch signature
+        """Handle ping request.
+
+        Args:
+            params: Ping parameters (unused)
+
+        Returns:
+            Pre-serialized empty result object
+        """
+        return "{}"
+
+    def _handle_tools_list(self, params: dict[str, Any]) -> str:  # noqa: ARG002 — Dispatch signature
         """Handle tools/list request.
 
+        Args:
+            params: Request parameters (unused)
+
         Returns:
-            Tools list result
+            Serialized tools list result
         """
         logger.info("Handling tools/list request")
-        tool = get_chartelier_tool()
-        result = ToolsListResult(tools=[tool])
-        return result.model_dump(by_alias=True)
+        return get_tools_list_json()
 
-    def _handle_tools_call(self, params: dict[str, Any]) -> dict[str, Any]:  # noqa: PLR0911
+    def _handle_tools_call(self, params: dict[str, Any]) -> ToolCallResult | dict[str, Any]:  # noqa: PLR0911
         """Handle tools/call request.
 
         Args:
@@ -160,51 +324,43 @@ class MCPHandler:
             Tool call result
         """
         try:
-            # Parse parameters
-            try:
-                call_params = ToolCallParams(**params)
-            except ValidationError as e:
-                # Invalid parameters
-                logger.warning("Invalid tool call parameters: %s", e)
-                error_result = ToolCallResult(
-                    content=[TextContent(text=f"Invalid parameters: {e}")],
-                    isError=True,
+            # Check parameters against the ToolCallParams shape
+            invalid_reason = _invalid_tool_call_reason(params)
+            if invalid_reason is not None:
+                logger.warning("Invalid tool call parameters", reason=invalid_reason)
+                return _text_error(f"Invalid parameters: {invalid_reason}")
+            tool_name: str = params["name"]
+            arguments: dict[str, Any] = params["arguments"]
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Handling tools/call request",
+                    extra={
+                        "tool_name": tool_name,
+                        "has_arguments": bool(arguments),
+                    },
                 )
-                return error_result.model_dump(by_alias=True)
-            logger.info(
-                "Handling tools/call request",
-                extra={
-                    "tool_name": call_params.name,
-                    "has_arguments": bool(call_params.arguments),
-                },
-            )
 
             # Currently only support chartelier_visualize
-            if call_params.name != "chartelier_visualize":
-                error_result = ToolCallResult(
-                    content=[
-                        TextContent(text=f"Unknown tool: {call_params.name}. Only 'chartelier_visualize' is supported.")
-                    ],
-                    isError=True,
-                )
-                return error_result.model_dump(by_alias=True)
+            if tool_name != "chartelier_visualize":
+                return _text_error(f"Unknown tool: {tool_name}. Only 'chartelier_visualize' is supported.")
 
             # Validate request using RequestValidator
             try:
-                validated_request = self.validator.validate(call_params.arguments or {})
-                logger.info(
-                    "Request validated successfully",
-                    extra={
-                        "data_format": validated_request.data_format,
-                        "data_size_bytes": validated_request.data_size_bytes,
-                        "query_length": len(validated_request.query),
-                    },
-                )
+                validated_request = self.validator.validate(arguments)
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Request validated successfully",
+                        extra={
+                            "data_format": validated_request.data_format,
+                            "data_size_bytes": validated_request.data_size_bytes,
+                            "query_length": len(validated_request.query),
+                        },
+                    )
             except ChartelierError as e:
                 logger.warning("Request validation failed: %s", e)
-                error_result = ToolCallResult(
-                    content=[TextContent(text=f"Validation error: {e.message}")],
-                    structuredContent={
+                return _text_error(
+                    f"Validation error: {e.message}",
+                    {
                         "error": {
                             "code": e.code.value,
                             "message": e.message,
@@ -212,9 +368,7 @@ class MCPHandler:
                             "details": e.details,
                         }
                     },
-                    isError=True,
                 )
-                return error_result.model_dump(by_alias=True)
 
             # Call Coordinator to process the visualization request
             visualization_result = self.coordinator.process(validated_request)
@@ -227,9 +381,9 @@ class MCPHandler:
                 if visualization_result.error.get("hint"):
                     error_message = f"{error_message}. {visualization_result.error['hint']}"
 
-                error_result = ToolCallResult(
-                    content=[TextContent(text=error_message)],
-                    structuredContent={
+                return _text_error(
+                    error_message,
+                    {
                         "error": {
                             "code": visualization_result.error.get("code", "E500_INTERNAL"),
                             "message": visualization_result.error["message"],
@@ -238,9 +392,7 @@ class MCPHandler:
                         },
                         "metadata": visualization_result.metadata,
                     },
-                    isError=True,
                 )
-                return error_result.model_dump(by_alias=True)
             # Return success result with image and metadata
             # Determine MIME type based on format
             mime_type = "image/png" if visualization_result.format == "png" else "image/svg+xml"
@@ -252,28 +404,21 @@ class MCPHandler:
             )
 
             # Build structured content with only metadata (per MCP spec)
-            success_result = ToolCallResult(
+            return ToolCallResult(
                 content=[image_content],
                 structuredContent={
                     "metadata": visualization_result.metadata,
                 },
                 isError=False,
             )
-            return success_result.model_dump(by_alias=True)
         except ChartelierError as e:
             # Chartelier-specific error (for future use)
             logger.error("Chartelier error: %s", e)  # noqa: TRY400
-            error_result = ToolCallResult(
-                content=[TextContent(text=str(e))],
-                structuredContent={"error": {"code": e.code.value, "message": e.message, "hint": e.hint}},
-                isError=True,
+            return _text_error(
+                str(e),
+                {"error": {"code": e.code.value, "message": e.message, "hint": e.hint}},
             )
-            return error_result.model_dump(by_alias=True)
         except Exception as e:
             # Unexpected error
             logger.exception("Unexpected error in tools/call")
-            error_result = ToolCallResult(
-                content=[TextContent(text=f"Internal error: {e}")],
-                isError=True,
-            )
-            return error_result.model_dump(by_alias=True)
+            return _text_error(f"Internal error: {e}")
@@ -1,5 +1,6 @@
 """MCP protocol message models and definitions."""
 
+import functools
 from enum import Enum
 from typing import Any, Literal
 
@@ -157,3 +158,21 @@ def get_chartelier_tool() -> Tool:
             },
         ),
     )
+
+
+@functools.lru_cache(maxsize=1)
+def get_tools_list_json() -> str:
+    """Get the serialized tools/list result.
+
+    The tool definition is static, so it is built and serialized once per process.
+    """
+    return ToolsListResult(tools=[get_chartelier_tool()]).model_dump_json(by_alias=True)
+
+
+@functools.lru_cache(maxsize=1)
+def get_initialize_result_json() -> str:
+    """Get the serialized initialize result.
+
+    The server does not negotiate anything per client, so the result is constant.
+    """
+    return InitializeResult().model_dump_json(by_alias=True)
@@ -2,7 +2,10 @@
 
 import argparse
 import logging
+import queue
 import sys
+import threading
+from typing import BinaryIO
 
 from chartelier.infra.logging import configure_logging, get_logger
 from chartelier.interfaces.mcp.handler import MCPHandler
@@ -12,6 +15,45 @@ configure_logging(level=logging.WARNING, stream=sys.stderr)
 logger = get_logger(__name__)
 
 
+def _read_lines(stdin: BinaryIO, lines: queue.Queue[bytes | Exception | None]) -> None:
+    """Read non-blank lines from stdin into a queue.
+
+    Args:
+        stdin: Binary stream to read messages from
+        lines: Queue receiving each line, then None at end of input, or the error that
+            stopped reading
+    """
+    try:
+        # Read JSON-RPC messages from stdin line by line
+        for line in iter(stdin.readline, b""):
+            # JSON parsers accept the trailing newline, so the line is passed on as is
+            # rather than copying a possibly multi-MB payload just to strip it
+            if not line.isspace():
+                lines.put(line)
+    except Exception as e:  # noqa: BLE001 — Re-raised by the server loop
+        lines.put(e)
+    else:
+        lines.put(None)
+
+
+def _next_line(lines: queue.Queue[bytes | Exception | None]) -> bytes | None:
+    """Take the next line read by the reader thread.
+
+    Args:
+        lines: Queue filled by _read_lines
+
+    Returns:
+        Next line, or None at end of input
+
+    Raises:
+        Exception: The error that stopped the reader thread
+    """
+    item = lines.get()
+    if isinstance(item, Exception):
+        raise item
+    return item
+
+
 def run_stdio_server(handler: MCPHandler, debug: bool = False) -> None:
     """Run the MCP server in stdio mode.
 
@@ -24,20 +66,28 @@ def run_stdio_server(handler: MCPHandler, debug: bool = False) -> None:
     else:
         logger.debug("Starting Chartelier MCP server in stdio mode")
 
-    try:
-        # Read JSON-RPC messages from stdin line by line
-        for line in sys.stdin:
-            line_stripped = line.strip()
-            if not line_stripped:
-                continue
+    # Use the binary streams: messages are UTF-8 JSON, so the text layer's decode/encode
+    # per line is wasted work, and a stray invalid byte can't break the read loop.
+    stdin = sys.stdin.buffer
+    stdout = sys.stdout.buffer
 
+    try:
+        # A helper thread reads the next line while this thread handles the current one.
+        # Messages are still handled here, in request order, so the pipeline keeps running
+        # on the main thread. The small queue bounds how far reading gets ahead.
+        lines: queue.Queue[bytes | Exception | None] = queue.Queue(maxsize=1)
+        reader = threading.Thread(target=_read_lines, args=(stdin, lines), name="chartelier-mcp-reader", daemon=True)
+        reader.start()
+
+        while (line := _next_line(lines)) is not None:
             # Handle the message
-            response = handler.handle_message(line_stripped)
+            response = handler.handle_message(line)
 
             # Send response if one was generated
             if response:
-                sys.stdout.write(response + "\n")
-                sys.stdout.flush()
+                stdout.write(response.encode("utf-8"))
+                stdout.write(b"\n")
+                stdout.flush()
 
     except KeyboardInterrupt:
         logger.debug("Server interrupted by user")
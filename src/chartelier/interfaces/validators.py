@@ -1,35 +1,131 @@
 """Request validators for Chartelier interfaces."""
 
 import csv
-import io
 import json
+import re
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
 from typing import Any, ClassVar
 
-from pydantic import BaseModel, Field, ValidationError, field_validator
-
 from chartelier.core.enums import ErrorCode
 from chartelier.core.errors import ChartelierError
 from chartelier.core.models import ErrorDetail
+from chartelier.infra.serialization import loads
+
+_NON_WHITESPACE = re.compile(r"\S")
+
+
+def _validation_error(message: str, field: str | None, errors: list[str], hint: str) -> ChartelierError:
+    """Build the error raised for failed request validation.
+
+    Error details are only constructed here, on the failure path.
+
+    Args:
+        message: Error message
+        field: Request field the errors refer to, or None for the request as a whole
+        errors: Validation error reasons
+        hint: Correction hint for the user
+
+    Returns:
+        Validation error to raise
+    """
+    return ChartelierError(
+        code=ErrorCode.E400_VALIDATION,
+        message=message,
+        details=[ErrorDetail(field=field, reason=error) for error in errors],
+        hint=hint,
+    )
+
+
+def _count_unquoted_csv(data: str) -> tuple[int, int] | None:
+    """Count header columns and data rows of a CSV that needs no real parsing.
+
+    Without quote characters a field cannot contain a delimiter or line break, so the counts
+    ``csv.reader`` would produce can be taken with ``str.count`` scans instead.
+
+    Args:
+        data: CSV string to count
+
+    Returns:
+        Tuple of (header column count, data row count), or None if the data has quotes,
+        bare carriage returns or no content and must go through ``csv.reader``
+    """
+    if not data or '"' in data:
+        return None
+    carriage_returns = data.count("\r")
+    if carriage_returns and data.count("\r\n") != carriage_returns:
+        return None
+
+    header_end = data.find("\n")
+    if header_end < 0:
+        header_end = len(data)
+    if carriage_returns and data[header_end - 1 : header_end] == "\r":
+        header_end -= 1
+    # csv.reader yields an empty row, not one empty field, for a blank line
+    num_cols = data.count(",", 0, header_end) + 1 if header_end > 0 else 0
+
+    num_lines = data.count("\n") + (0 if data.endswith("\n") else 1)
+    return num_cols, num_lines - 1
+
 
+def _iter_lines(data: str) -> Iterator[str]:
+    """Yield the lines of a string, keeping their newline.
 
-class ValidatedRequest(BaseModel):
-    """Validated request data."""
+    Yields the same lines as iterating ``io.StringIO(data)``, without first copying the whole
+    string into the buffer (at up to 4 bytes per character).
 
-    data: str = Field(..., description="CSV or JSON data string")
-    query: str = Field(..., min_length=1, max_length=1000, description="Natural language query")
-    options: dict[str, Any] = Field(default_factory=dict, description="Visualization options")
-    data_format: str = Field(..., description="Detected data format (csv or json)")
-    data_size_bytes: int = Field(..., description="Size of data in bytes")
+    Args:
+        data: String to split
 
-    @field_validator("query")
-    @classmethod
-    def validate_query_length(cls, v: str) -> str:
-        """Validate query length."""
-        if len(v) == 0:
-            raise ValueError("Query cannot be empty")
-        if len(v) > 1000:
-            raise ValueError("Query exceeds maximum length of 1000 characters")
-        return v
+    Yields:
+        Each line, including its trailing newline if it has one
+    """
+    start = 0
+    end = len(data)
+    while start < end:
+        newline = data.find("\n", start)
+        stop = end if newline < 0 else newline + 1
+        yield data[start:stop]
+        start = stop
+
+
+def _record_columns(records: list[Any]) -> set[str] | None:
+    """Collect the keys of a list of JSON records in a single pass.
+
+    Args:
+        records: Parsed JSON array
+
+    Returns:
+        Union of the record keys, or None if any element is not an object
+    """
+    columns: set[str] = set()
+    for record in records:
+        if not isinstance(record, dict):
+            return None
+        columns.update(record)
+    return columns
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ValidatedRequest:
+    """Validated request data.
+
+    Built by ``RequestValidator`` only after every field has passed validation, so
+    construction does no checking of its own.
+
+    Attributes:
+        data: CSV or JSON data string
+        query: Natural language query
+        options: Visualization options
+        data_format: Detected data format (csv or json)
+        data_size_bytes: Size of data in bytes
+    """
+
+    data: str
+    query: str
+    options: dict[str, Any] = field(default_factory=dict)
+    data_format: str
+    data_size_bytes: int
 
 
 class RequestValidator:
@@ -56,8 +152,9 @@ class RequestValidator:
     WIDTH_MAX = 2000
     HEIGHT_MIN = 300
     HEIGHT_MAX = 2000
-    VALID_FORMATS: ClassVar[list[str]] = ["png", "svg"]
-    VALID_LOCALES: ClassVar[list[str]] = ["ja", "en"]
+    VALID_FORMATS: ClassVar[frozenset[str]] = frozenset(("png", "svg"))
+    VALID_LOCALES: ClassVar[frozenset[str]] = frozenset(("ja", "en"))
+    CSV_DELIMITERS: ClassVar[tuple[str, ...]] = (",", "\t", "|")
 
     def validate(self, request: dict[str, Any]) -> ValidatedRequest:
         """Validate a visualization request.
@@ -71,21 +168,14 @@ class RequestValidator:
         Raises:
             ChartelierError: If validation fails
         """
-        errors = []
-
         # Check required fields
-        if "data" not in request:
-            errors.append("Missing required field: 'data'")
-        if "query" not in request:
-            errors.append("Missing required field: 'query'")
-
-        if errors:
-            error_details = [ErrorDetail(reason=error) for error in errors]
-            raise ChartelierError(
-                code=ErrorCode.E400_VALIDATION,
-                message="Request validation failed",
-                details=error_details,
-                hint="Ensure both 'data' and 'query' fields are present in the request",
+        if "data" not in request or "query" not in request:
+            missing = [f"Missing required field: '{name}'" for name in ("data", "query") if name not in request]
+            raise _validation_error(
+                "Request validation failed",
+                None,
+                missing,
+                "Ensure both 'data' and 'query' fields are present in the request",
             )
 
         data = request["data"]
@@ -95,57 +185,41 @@ class RequestValidator:
         # Validate data
         data_validation = self._validate_data(data)
         if data_validation["errors"]:
-            error_details = [ErrorDetail(field="data", reason=error) for error in data_validation["errors"]]
-            raise ChartelierError(
-                code=ErrorCode.E400_VALIDATION,
-                message="Data validation failed",
-                details=error_details,
-                hint=data_validation.get("hint", "Check your data format and encoding"),
+            raise _validation_error(
+                "Data validation failed",
+                "data",
+                data_validation["errors"],
+                data_validation["hint"] or "Check your data format and encoding",
             )
 
         # Validate query
         query_validation = self._validate_query(query)
         if query_validation["errors"]:
-            error_details = [ErrorDetail(field="query", reason=error) for error in query_validation["errors"]]
-            raise ChartelierError(
-                code=ErrorCode.E400_VALIDATION,
-                message="Query validation failed",
-                details=error_details,
-                hint=query_validation.get("hint", "Query must be between 1 and 1000 characters"),
+            raise _validation_error(
+                "Query validation failed",
+                "query",
+                query_validation["errors"],
+                query_validation["hint"] or "Query must be between 1 and 1000 characters",
             )
 
         # Validate options
         options_validation = self._validate_options(options)
         if options_validation["errors"]:
-            error_details = [ErrorDetail(field="options", reason=error) for error in options_validation["errors"]]
-            raise ChartelierError(
-                code=ErrorCode.E400_VALIDATION,
-                message="Options validation failed",
-                details=error_details,
-                hint=options_validation.get("hint", "Check option values are within valid ranges"),
+            raise _validation_error(
+                "Options validation failed",
+                "options",
+                options_validation["errors"],
+                options_validation["hint"] or "Check option values are within valid ranges",
             )
 
-        # Create validated request
-        try:
-            return ValidatedRequest(
-                data=data,
-                query=query,
-                options=options,
-                data_format=data_validation["format"],
-                data_size_bytes=data_validation["size_bytes"],
-            )
-        except ValidationError as e:
-            error_details = [
-                ErrorDetail(
-                    field=str(err.get("loc", [""])[0]) if err.get("loc") else "", reason=err.get("msg", str(err))
-                )
-                for err in e.errors()
-            ]
-            raise ChartelierError(
-                code=ErrorCode.E400_VALIDATION,
-                message="Failed to create validated request",
-                details=error_details,
-            ) from e
+        # Create validated request; every field has been checked above
+        return ValidatedRequest(
+            data=data,
+            query=query,
+            options=options if options is not None else {},
+            data_format=data_validation["format"],
+            data_size_bytes=data_validation["size_bytes"],
+        )
 
     def _validate_data(self, data: object) -> dict[str, Any]:
         """Validate data field.
@@ -164,8 +238,14 @@ class RequestValidator:
             result["hint"] = "Provide data as a CSV or JSON string"
             return result
 
-        # Check size
-        size_bytes = len(data.encode("utf-8"))
+        # Check size and UTF-8 encoding. A str is UTF-8 encodable unless it holds lone
+        # surrogates, which ASCII text cannot, so only non-ASCII data is encoded to count bytes.
+        try:
+            size_bytes = len(data) if data.isascii() else len(data.encode("utf-8"))
+        except UnicodeEncodeError:
+            result["errors"].append("Data contains invalid UTF-8 characters")
+            result["hint"] = "Ensure data is properly UTF-8 encoded"
+            return result
         result["size_bytes"] = size_bytes
         if size_bytes > self.MAX_DATA_SIZE_BYTES:
             result["errors"].append(
@@ -174,20 +254,13 @@ class RequestValidator:
             result["hint"] = "Reduce data size or use sampling"
             return result
 
-        # Check if empty
-        if not data.strip():
+        # Check if empty (or whitespace only); the search stops at the first non-whitespace
+        # character instead of stripping a copy of the whole payload
+        if _NON_WHITESPACE.search(data) is None:
             result["errors"].append("Data cannot be empty")
             result["hint"] = "Provide valid CSV or JSON data"
             return result
 
-        # Check UTF-8 encoding
-        try:
-            data.encode("utf-8")
-        except UnicodeEncodeError:
-            result["errors"].append("Data contains invalid UTF-8 characters")
-            result["hint"] = "Ensure data is properly UTF-8 encoded"
-            return result
-
         # Detect format
         data_format = self._detect_data_format(data)
         if not data_format:
@@ -262,74 +335,69 @@ class RequestValidator:
             result["hint"] = "Provide options as key-value pairs"
             return result
 
-        # Validate individual option fields
-        self._validate_format_option(options, result)
-        self._validate_dpi_option(options, result)
-        self._validate_width_option(options, result)
-        self._validate_height_option(options, result)
+        # Validate individual option fields in one pass over the supplied options
+        for key, value in options.items():
+            handler = self._OPTION_HANDLERS.get(key)
+            if handler is not None:
+                handler(self, value, result)
         self._validate_total_pixels(options, result)
-        self._validate_locale_option(options, result)
 
         return result
 
-    def _validate_format_option(self, options: dict[str, Any], result: dict[str, Any]) -> None:
+    def _validate_format_option(self, value: object, result: dict[str, Any]) -> None:
         """Validate format option."""
-        if "format" in options:
-            format_value = options["format"]
-            if format_value not in self.VALID_FORMATS:
-                result["errors"].append(
-                    f"Invalid format '{format_value}'. Must be one of: {', '.join(self.VALID_FORMATS)}"
-                )
+        if not (isinstance(value, str) and value in self.VALID_FORMATS):
+            result["errors"].append(
+                f"Invalid format '{value}'. Must be one of: {', '.join(sorted(self.VALID_FORMATS))}"
+            )
 
-    def _validate_dpi_option(self, options: dict[str, Any], result: dict[str, Any]) -> None:
+    def _validate_int_range(self, value: object, result: dict[str, Any], label: str, bounds: tuple[int, int]) -> None:
+        """Validate an integer option that must lie within inclusive bounds."""
+        minimum, maximum = bounds
+        if not isinstance(value, int):
+            result["errors"].append(f"{label} must be an integer")
+        elif not (minimum <= value <= maximum):
+            result["errors"].append(f"{label} must be between {minimum} and {maximum} (got {value})")
+
+    def _validate_dpi_option(self, value: object, result: dict[str, Any]) -> None:
         """Validate DPI option."""
-        if "dpi" in options:
-            dpi = options["dpi"]
-            if not isinstance(dpi, int):
-                result["errors"].append("DPI must be an integer")
-            elif not (self.DPI_MIN <= dpi <= self.DPI_MAX):
-                result["errors"].append(f"DPI must be between {self.DPI_MIN} and {self.DPI_MAX} (got {dpi})")
-
-    def _validate_width_option(self, options: dict[str, Any], result: dict[str, Any]) -> None:
+        self._validate_int_range(value, result, "DPI", (self.DPI_MIN, self.DPI_MAX))
+
+    def _validate_width_option(self, value: object, result: dict[str, Any]) -> None:
         """Validate width option."""
-        if "width" in options:
-            width = options["width"]
-            if not isinstance(width, int):
-                result["errors"].append("Width must be an integer")
-            elif not (self.WIDTH_MIN <= width <= self.WIDTH_MAX):
-                result["errors"].append(f"Width must be between {self.WIDTH_MIN} and {self.WIDTH_MAX} (got {width})")
-
-    def _validate_height_option(self, options: dict[str, Any], result: dict[str, Any]) -> None:
+        self._validate_int_range(value, result, "Width", (self.WIDTH_MIN, self.WIDTH_MAX))
+
+    def _validate_height_option(self, value: object, result: dict[str, Any]) -> None:
         """Validate height option."""
-        if "height" in options:
-            height = options["height"]
-            if not isinstance(height, int):
-                result["errors"].append("Height must be an integer")
-            elif not (self.HEIGHT_MIN <= height <= self.HEIGHT_MAX):
-                result["errors"].append(
-                    f"Height must be between {self.HEIGHT_MIN} and {self.HEIGHT_MAX} (got {height})"
-                )
+        self._validate_int_range(value, result, "Height", (self.HEIGHT_MIN, self.HEIGHT_MAX))
+
+    def _validate_locale_option(self, value: object, result: dict[str, Any]) -> None:
+        """Validate locale option."""
+        if not (isinstance(value, str) and value in self.VALID_LOCALES):
+            result["errors"].append(
+                f"Invalid locale '{value}'. Must be one of: {', '.join(sorted(self.VALID_LOCALES))}"
+            )
 
     def _validate_total_pixels(self, options: dict[str, Any], result: dict[str, Any]) -> None:
         """Validate total image pixels."""
-        if "width" in options and "height" in options:
-            width = options["width"]
-            height = options["height"]
-            if isinstance(width, int) and isinstance(height, int):
-                total_pixels = width * height
-                if total_pixels > self.MAX_IMAGE_PIXELS:
-                    result["errors"].append(
-                        f"Total image size ({total_pixels:,} pixels) exceeds maximum of "
-                        f"{self.MAX_IMAGE_PIXELS:,} pixels"
-                    )
-                    result["hint"] = "Reduce width or height to stay within pixel limit"
-
-    def _validate_locale_option(self, options: dict[str, Any], result: dict[str, Any]) -> None:
-        """Validate locale option."""
-        if "locale" in options:
-            locale = options["locale"]
-            if locale not in self.VALID_LOCALES:
-                result["errors"].append(f"Invalid locale '{locale}'. Must be one of: {', '.join(self.VALID_LOCALES)}")
+        width = options.get("width")
+        height = options.get("height")
+        if isinstance(width, int) and isinstance(height, int):
+            total_pixels = width * height
+            if total_pixels > self.MAX_IMAGE_PIXELS:
+                result["errors"].append(
+                    f"Total image size ({total_pixels:,} pixels) exceeds maximum of {self.MAX_IMAGE_PIXELS:,} pixels"
+                )
+                result["hint"] = "Reduce width or height to stay within pixel limit"
+
+    # Option key -> validator, called with the option value
+    _OPTION_HANDLERS: ClassVar[dict[str, Callable[["RequestValidator", object, dict[str, Any]], None]]] = {
+        "format": _validate_format_option,
+        "dpi": _validate_dpi_option,
+        "width": _validate_width_option,
+        "height": _validate_height_option,
+        "locale": _validate_locale_option,
+    }
 
     def _detect_data_format(self, data: str) -> str | None:
         """Detect data format (CSV or JSON).
@@ -340,31 +408,41 @@ class RequestValidator:
         Returns:
             'csv', 'json', or None if format cannot be determined
         """
-        data_stripped = data.strip()
+        # Locate the first non-whitespace character without stripping (and copying) the data
+        first = _NON_WHITESPACE.search(data)
+        if first is None:
+            return None
+        start = first.start()
 
         # If it looks like JSON (starts with { or [), treat it as JSON
         # even if it fails to parse (will be caught in validation)
-        if data_stripped.startswith(("[", "{")):
+        if data.startswith(("[", "{"), start):
             return "json"
 
-        # Try CSV
-        try:
-            # Use csv.Sniffer to detect CSV format
-            sniffer = csv.Sniffer()
-            sample = data_stripped[:8192]  # Use first 8KB as sample
-            sniffer.sniff(sample)
-        except csv.Error:
-            pass
+        # Treat it as CSV if a common delimiter appears in the first line and, when there is
+        # one, the next non-blank line. The lines are searched in place by index rather than
+        # split out.
+        end = len(data)
+        while data[end - 1].isspace():
+            end -= 1
+        line1_end = data.find("\n", start, end)
+        if line1_end < 0:
+            line1_end = line2_start = line2_end = end
         else:
-            return "csv"
-
-        # Fallback: if it contains common CSV patterns
-        lines = data_stripped.split("\n", 2)
-        if len(lines) >= 2:
-            # Check for comma, tab, or pipe delimiters
-            for delimiter in [",", "\t", "|"]:
-                if delimiter in lines[0] and delimiter in lines[1]:
-                    return "csv"
+            # The last line before end is never blank, so this stops by then
+            line2_start = line1_end + 1
+            while True:
+                line2_end = data.find("\n", line2_start, end)
+                if line2_end < 0:
+                    line2_end = end
+                if _NON_WHITESPACE.search(data, line2_start, line2_end):
+                    break
+                line2_start = line2_end + 1
+        for delimiter in self.CSV_DELIMITERS:
+            if data.find(delimiter, start, line1_end) >= 0 and (
+                line1_end == end or data.find(delimiter, line2_start, line2_end) >= 0
+            ):
+                return "csv"
 
         return None
 
@@ -380,55 +458,64 @@ class RequestValidator:
         result: dict[str, Any] = {"errors": [], "hint": None, "estimated_cells": 0}
 
         try:
-            # Parse CSV to check structure
-            reader = csv.reader(io.StringIO(data))
-            rows = list(reader)
+            counts = _count_unquoted_csv(data)
+            if counts is None:
+                counts = self._count_csv_with_reader(data)
 
-            if not rows:
+            if counts is None:
                 result["errors"].append("CSV data is empty")
                 result["hint"] = "Provide at least a header row and one data row"
                 return result
 
+            num_cols, num_rows = counts
+
             # Check for header
-            if len(rows) == 1:
+            if num_rows == 0:
                 result["errors"].append("CSV has only header row, no data")
                 result["hint"] = "Add data rows to your CSV"
                 return result
 
-            # Check dimensions
-            num_rows = len(rows) - 1  # Exclude header
-            num_cols = len(rows[0]) if rows else 0
-            estimated_cells = num_rows * num_cols
-
-            result["estimated_cells"] = estimated_cells
-
-            # Check cell limit
-            if estimated_cells > self.MAX_CELLS:
-                # This is a warning, not an error - will trigger sampling
-                pass  # Sampling will be handled by DataValidator
-
-            # Check row limit
-            if num_rows > self.MAX_ROWS:
-                # This is a warning, not an error - will trigger sampling
-                pass  # Sampling will be handled by DataValidator
+            # Check dimensions. Row and cell limits are not errors here: exceeding them
+            # triggers sampling, which is handled by DataValidator.
+            result["estimated_cells"] = num_rows * num_cols
 
             # Check column limit
             if num_cols > self.MAX_COLUMNS:
                 result["errors"].append(f"Too many columns ({num_cols}). Maximum is {self.MAX_COLUMNS}")
                 result["hint"] = "Reduce the number of columns in your data"
 
-            # Check for consistent column count
-            for _i, row in enumerate(rows[1:], start=2):
-                if len(row) != num_cols:
-                    # Warning only, can still process
-                    break
-
         except (csv.Error, TypeError, ValueError) as e:
             result["errors"].append(f"Failed to parse CSV: {e}")
             result["hint"] = "Ensure your CSV is properly formatted with consistent delimiters"
 
         return result
 
+    def _count_csv_with_reader(self, data: str) -> tuple[int, int] | None:
+        """Count header columns and data rows by parsing the CSV.
+
+        Rows are counted as they stream past rather than collected, so a large CSV is never
+        held as a list of row lists.
+
+        Args:
+            data: CSV string to count
+
+        Returns:
+            Tuple of (header column count, data row count), or None if there is no header row
+        """
+        reader = csv.reader(_iter_lines(data))
+        header = next(reader, None)
+        if header is None:
+            return None
+
+        num_cols = len(header)
+        num_rows = 0
+        for _row in reader:
+            num_rows += 1
+            if num_cols > self.MAX_COLUMNS:
+                # The column limit fails the request however many rows follow
+                break
+        return num_cols, num_rows
+
     def _validate_json(self, data: str) -> dict[str, Any]:
         """Validate JSON data.
 
@@ -441,7 +528,7 @@ class RequestValidator:
         result: dict[str, Any] = {"errors": [], "hint": None, "estimated_cells": 0}
 
         try:
-            parsed = json.loads(data)
+            parsed = loads(data)
 
             # Check if it's table-like (array of objects or nested structure)
             if isinstance(parsed, list):
@@ -451,10 +538,11 @@ class RequestValidator:
                     return result
 
                 # Check if all elements are dictionaries (table-like)
-                if all(isinstance(item, dict) for item in parsed):
+                columns = _record_columns(parsed)
+                if columns is not None:
                     # Estimate dimensions
                     num_rows = len(parsed)
-                    num_cols = len(set().union(*(item.keys() for item in parsed))) if parsed else 0
+                    num_cols = len(columns)
                     estimated_cells = num_rows * num_cols
 
                     result["estimated_cells"] = estimated_cells
@@ -1,30 +1,33 @@
 """Coordinator for orchestrating the visualization pipeline."""
 
-import io
-import json
-import signal
+from __future__ import annotations
+
+import hashlib
 import time
-from collections.abc import Iterator
-from contextlib import contextmanager
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, ClassVar, TypeVar
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, ClassVar
 
 import polars as pl
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
-from chartelier.core.chart_builder import ChartBuilder
 from chartelier.core.enums import ErrorCode, OutputFormat, PatternID
 from chartelier.core.errors import ChartelierError
 from chartelier.core.models import DataMetadata, ErrorDetail, MappingConfig
-from chartelier.infra.logging import get_logger
-from chartelier.interfaces.validators import ValidatedRequest
-from chartelier.processing.chart_selector import ChartSelector
-from chartelier.processing.data_mapper import DataMapper
-from chartelier.processing.data_processor import DataProcessor
-from chartelier.processing.data_validator import DataValidator
-from chartelier.processing.pattern_selector import (
-    PatternSelector,
-)
+from chartelier.infra.logging import StructuredLogger, get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from chartelier.core.chart_builder import ChartBuilder
+    from chartelier.interfaces.validators import ValidatedRequest
+    from chartelier.processing.chart_selector import ChartSelector
+    from chartelier.processing.data_mapper import DataMapper
+    from chartelier.processing.data_processor import DataProcessor
+    from chartelier.processing.data_validator import DataValidator, ValidatedData
+    from chartelier.processing.pattern_selector import PatternSelector
 
 logger = get_logger(__name__)
 
@@ -40,52 +43,91 @@ class PipelinePhase(str, Enum):
     CHART_BUILDING = "chart_building"
 
 
-class ProcessingContext(BaseModel):
-    """Context shared between pipeline phases."""
+@dataclass(slots=True, kw_only=True)
+class ProcessingContext:
+    """Context shared between pipeline phases.
+
+    Internal to the pipeline and mutated by each phase, so it is a plain dataclass
+    rather than a validated model.
+
+    Attributes:
+        raw_data: Raw data string (CSV or JSON)
+        data_format: Data format (csv or json)
+        query: User's visualization query
+        options: Visualization options
+        parsed_data: Parsed DataFrame
+        data_metadata: Data metadata
+        pattern_id: Selected pattern ID (P01-P32)
+        template_id: Selected template ID
+        processed_data: Processed data
+        mapping_config: Data mapping configuration
+        auxiliary_config: Auxiliary elements configuration
+        data_sampled: Whether data was sampled
+        rows_count: Number of rows in data
+        cols_count: Number of columns in data
+        warnings: Warning messages
+        processing_time_ms: Processing time per phase
+        started_ns: perf_counter_ns() reading when the request started
+        phase_deadline: Monotonic time by which the running phase's LLM calls must be dispatched
+        fallback_applied: Whether fallback was applied
+        operations_applied: Data processing operations applied
+        chart_data: Exported chart image (base64 PNG or SVG markup)
+        chart_format: Format the chart was exported in (png or svg)
+    """
 
-    raw_data: str = Field(..., description="Raw data string (CSV or JSON)")
-    data_format: str = Field(..., description="Data format (csv or json)")
-    query: str = Field(..., description="User's visualization query")
-    options: dict[str, Any] = Field(default_factory=dict, description="Visualization options")
+    raw_data: str
+    data_format: str
+    query: str
+    options: dict[str, Any] = field(default_factory=dict)
 
     # Phase results (will be populated as pipeline progresses)
-    parsed_data: pl.DataFrame | None = Field(None, description="Parsed DataFrame", exclude=True)
-    data_metadata: DataMetadata | None = Field(None, description="Data metadata", exclude=True)
-    pattern_id: str | None = Field(None, description="Selected pattern ID (P01-P32)")
-    template_id: str | None = Field(None, description="Selected template ID")
-    processed_data: pl.DataFrame | None = Field(None, description="Processed data", exclude=True)
-    mapping_config: dict[str, Any] | None = Field(None, description="Data mapping configuration")
-    auxiliary_config: list[str] | None = Field(None, description="Auxiliary elements configuration")
+    parsed_data: pl.DataFrame | None = None
+    data_metadata: DataMetadata | None = None
+    pattern_id: str | None = None
+    template_id: str | None = None
+    processed_data: pl.DataFrame | None = None
+    mapping_config: MappingConfig | None = None
+    auxiliary_config: list[str] | None = None
 
     # Additional metadata
-    data_sampled: bool = Field(default=False, description="Whether data was sampled")
-    rows_count: int | None = Field(None, description="Number of rows in data")
-    cols_count: int | None = Field(None, description="Number of columns in data")
+    data_sampled: bool = False
+    rows_count: int | None = None
+    cols_count: int | None = None
 
-    class Config:
-        """Pydantic config."""
+    # Metadata
+    warnings: list[str] = field(default_factory=list)
+    processing_time_ms: dict[str, float] = field(default_factory=dict)
+    started_ns: int = field(default_factory=time.perf_counter_ns)
+    phase_deadline: float | None = None
+    fallback_applied: bool = False
 
-        arbitrary_types_allowed = True
+    # Phase outputs kept off the caller's options
+    operations_applied: list[str] = field(default_factory=list)
+    chart_data: str | None = None
+    chart_format: str | None = None
 
-    # Metadata
-    warnings: list[str] = Field(default_factory=list, description="Warning messages")
-    processing_time_ms: dict[str, float] = Field(default_factory=dict, description="Processing time per phase")
-    fallback_applied: bool = Field(default=False, description="Whether fallback was applied")
+    def elapsed_ms(self) -> float:
+        """Return the milliseconds elapsed since the request started."""
+        return (time.perf_counter_ns() - self.started_ns) / 1e6
 
 
 class VisualizationResult(BaseModel):
-    """Result of visualization processing."""
+    """Result of visualization processing.
+
+    The coordinator builds results from values it produced itself, so it uses
+    ``model_construct`` and skips validation; the schema is built on first validation or
+    serialization instead of at import. Image data is left out of ``repr`` so logging a
+    result does not print megabytes of base64.
+    """
+
+    model_config = ConfigDict(defer_build=True)
 
     format: str = Field(..., description="Output format (png or svg)")
-    image_data: str | None = Field(None, description="Base64-encoded image data")
+    image_data: str | None = Field(None, description="Base64-encoded image data", repr=False)
     metadata: dict[str, Any] = Field(default_factory=dict, description="Processing metadata")
     error: dict[str, Any] | None = Field(None, description="Error information if failed")
 
 
-# Type variable for timeout decorator
-T = TypeVar("T")
-
-
 class TimeoutError(ChartelierError):
     """Raised when a pipeline phase times out."""
 
@@ -99,30 +141,48 @@ class TimeoutError(ChartelierError):
         )
 
 
-@contextmanager
-def timeout(seconds: float) -> Iterator[None]:
-    """Context manager for timeout.
-
-    Args:
-        seconds: Timeout in seconds
+class Deadline:
+    """Point in time by which pipeline work must finish.
 
-    Raises:
-        TimeoutError: If operation exceeds timeout
+    Deadlines are polled rather than enforced with ``SIGALRM``, so they nest, and work off
+    the main thread (for hosts that call the pipeline from their own threads). The pipeline
+    checks its deadline before each phase starts and hands phases the time left as the
+    deadline for their LLM calls; a phase that has completed is never failed after the fact.
     """
 
-    def timeout_handler(signum: int, frame: Any) -> None:  # noqa: ARG001, ANN401
-        raise TimeoutError("operation", seconds)
+    __slots__ = ("expires", "seconds")
+
+    def __init__(self, seconds: float) -> None:
+        """Start a deadline that expires the given number of seconds from now.
+
+        Args:
+            seconds: Time allowed in seconds
+        """
+        self.seconds = seconds
+        self.expires = time.monotonic() + seconds
+
+    def check(self, phase: str) -> None:
+        """Raise if the deadline has passed.
 
-    # Set the timeout handler
-    old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-    signal.alarm(int(seconds))
+        Args:
+            phase: Name of the phase being checked, for the error
 
-    try:
-        yield
-    finally:
-        # Restore the original handler
-        signal.alarm(0)
-        signal.signal(signal.SIGALRM, old_handler)
+        Raises:
+            TimeoutError: If the deadline has passed
+        """
+        if time.monotonic() > self.expires:
+            raise TimeoutError(phase, self.seconds)
+
+    def within(self, seconds: float) -> float:
+        """Return the monotonic time the given number of seconds from now, capped at this deadline.
+
+        Args:
+            seconds: Time allowed in seconds
+
+        Returns:
+            Monotonic time that is no later than this deadline
+        """
+        return min(self.expires, time.monotonic() + seconds)
 
 
 class Coordinator:
@@ -132,7 +192,10 @@ class Coordinator:
     data validation through chart generation.
     """
 
-    # Phase timeout configuration (in seconds)
+    # Logger shared by all instances
+    logger: ClassVar[StructuredLogger] = get_logger("Coordinator")
+
+    # Phase time budgets (in seconds), passed to each phase's LLM calls as their deadline
     PHASE_TIMEOUTS: ClassVar[dict[PipelinePhase, int]] = {
         PipelinePhase.DATA_VALIDATION: 5,
         PipelinePhase.PATTERN_SELECTION: 10,
@@ -145,6 +208,9 @@ class Coordinator:
     # Overall pipeline timeout
     TOTAL_TIMEOUT: ClassVar[int] = 60
 
+    # Number of recent data validation results kept for requests that resend the same data
+    VALIDATION_CACHE_SIZE: ClassVar[int] = 32
+
     # Phase configuration
     PHASE_CONFIG: ClassVar[dict[PipelinePhase, dict[str, Any]]] = {
         PipelinePhase.DATA_VALIDATION: {
@@ -175,15 +241,63 @@ class Coordinator:
 
     def __init__(self) -> None:
         """Initialize the coordinator."""
-        self.logger = get_logger(self.__class__.__name__)
+        # Phase -> method executing it
+        self._phase_dispatch: dict[PipelinePhase, Callable[[ProcessingContext], None]] = {
+            PipelinePhase.DATA_VALIDATION: self._execute_data_validation,
+            PipelinePhase.PATTERN_SELECTION: self._execute_pattern_selection,
+            PipelinePhase.CHART_SELECTION: self._execute_chart_selection,
+            PipelinePhase.DATA_PROCESSING: self._execute_data_processing,
+            PipelinePhase.DATA_MAPPING: self._execute_data_mapping,
+            PipelinePhase.CHART_BUILDING: self._execute_chart_building,
+        }
+
+        # Data validation results by (raw data digest + format), least recently used first
+        self._validation_cache: OrderedDict[bytes, ValidatedData] = OrderedDict()
+
+    # Processing components are created on first use: altair and the LLM client are slow to
+    # import, and the MCP server builds its coordinator before answering initialize.
+
+    @cached_property
+    def data_validator(self) -> DataValidator:
+        """Data validator, created on first use."""
+        from chartelier.processing.data_validator import DataValidator  # noqa: PLC0415 — Lazy import
+
+        return DataValidator()
+
+    @cached_property
+    def pattern_selector(self) -> PatternSelector:
+        """Pattern selector, created on first use."""
+        from chartelier.processing.pattern_selector import PatternSelector  # noqa: PLC0415 — Lazy import
+
+        return PatternSelector()
+
+    @cached_property
+    def chart_selector(self) -> ChartSelector:
+        """Chart selector, created on first use."""
+        from chartelier.processing.chart_selector import ChartSelector  # noqa: PLC0415 — Lazy import
+
+        return ChartSelector()
+
+    @cached_property
+    def data_processor(self) -> DataProcessor:
+        """Data processor, created on first use."""
+        from chartelier.processing.data_processor import DataProcessor  # noqa: PLC0415 — Lazy import
+
+        return DataProcessor()
 
-        # Initialize processing components
-        self.data_validator = DataValidator()
-        self.pattern_selector = PatternSelector()
-        self.chart_selector = ChartSelector()
-        self.data_processor = DataProcessor()
-        self.data_mapper = DataMapper()
-        self.chart_builder = ChartBuilder()
+    @cached_property
+    def data_mapper(self) -> DataMapper:
+        """Data mapper, created on first use."""
+        from chartelier.processing.data_mapper import DataMapper  # noqa: PLC0415 — Lazy import
+
+        return DataMapper()
+
+    @cached_property
+    def chart_builder(self) -> ChartBuilder:
+        """Chart builder, created on first use."""
+        from chartelier.core.chart_builder import ChartBuilder  # noqa: PLC0415 — Lazy import
+
+        return ChartBuilder()
 
     def process(self, request: ValidatedRequest) -> VisualizationResult:
         """Process a visualization request through the pipeline.
@@ -194,15 +308,15 @@ class Coordinator:
         Returns:
             VisualizationResult with either image data or error information
         """
-        start_time = time.time()
-
-        # Create processing context from validated request
+        # Create processing context from validated request; it records the start time
         context = ProcessingContext(
             raw_data=request.data,
             data_format=request.data_format,
             query=request.query,
             options=request.options,
         )
+        # Format reported by the error responses; success reports the format actually exported
+        requested_format = request.options.get("format", "png")
 
         self.logger.info(
             "Starting visualization pipeline",
@@ -225,32 +339,33 @@ class Coordinator:
                 PipelinePhase.CHART_BUILDING,
             ]
 
-            # Use overall timeout for entire pipeline
-            with timeout(self.TOTAL_TIMEOUT):
-                for phase in phases:
-                    try:
-                        self._execute_phase(phase, context)
-                    except ChartelierError as e:
-                        # Check if this phase is required
-                        config = self.PHASE_CONFIG.get(phase, {})
-                        if config.get("required", True):
-                            # Required phase failed - propagate error
-                            raise
-                        # Optional phase failed - apply fallback and continue
-                        self.logger.warning(
-                            "Optional phase %s failed, applying fallback",
-                            phase.value,
-                            extra={"error": str(e), "fallback": config.get("fallback")},
-                        )
-                        context.fallback_applied = True
-                        context.warnings.append(f"Phase {phase.value} failed: {e.message}. Using fallback.")
+            # Use overall timeout for entire pipeline, checked before each phase starts
+            overall = Deadline(self.TOTAL_TIMEOUT)
+            for phase in phases:
+                overall.check(phase.value)
+                try:
+                    self._execute_phase(phase, context, overall)
+                except ChartelierError as e:
+                    # Check if this phase is required
+                    config = self.PHASE_CONFIG.get(phase, {})
+                    if config.get("required", True):
+                        # Required phase failed - propagate error
+                        raise
+                    # Optional phase failed - apply fallback and continue
+                    self.logger.warning(
+                        "Optional phase %s failed, applying fallback",
+                        phase.value,
+                        extra={"error": str(e), "fallback": config.get("fallback")},
+                    )
+                    context.fallback_applied = True
+                    context.warnings.append(f"Phase {phase.value} failed: {e.message}. Using fallback.")
 
             # Build final response
             return self._build_success_response(context, request)
 
         except ChartelierError as e:
             # Handle known errors
-            processing_time = (time.time() - start_time) * 1000
+            processing_time = context.elapsed_ms()
 
             self.logger.warning(
                 "Pipeline processing failed",
@@ -261,8 +376,8 @@ class Coordinator:
                 },
             )
 
-            return VisualizationResult(
-                format=request.options.get("format", "png"),
+            return VisualizationResult.model_construct(
+                format=requested_format,
                 error={
                     "code": e.code.value,
                     "message": e.message,
@@ -278,12 +393,12 @@ class Coordinator:
 
         except Exception as e:
             # Handle unexpected errors
-            processing_time = (time.time() - start_time) * 1000
+            processing_time = context.elapsed_ms()
 
             self.logger.exception("Unexpected error in pipeline")
 
-            return VisualizationResult(
-                format=request.options.get("format", "png"),
+            return VisualizationResult.model_construct(
+                format=requested_format,
                 error={
                     "code": ErrorCode.E500_INTERNAL.value,
                     "message": "Internal server error",
@@ -296,73 +411,18 @@ class Coordinator:
                 },
             )
 
-    def _parse_data(self, context: ProcessingContext) -> None:
-        """Parse raw data into DataFrame.
-
-        Args:
-            context: Processing context to update
-
-        Raises:
-            ChartelierError: If data parsing fails
-        """
-        try:
-            if context.data_format == "csv":
-                # Parse CSV
-                context.parsed_data = pl.read_csv(
-                    io.StringIO(context.raw_data),
-                    ignore_errors=False,
-                    try_parse_dates=True,
-                )
-            elif context.data_format == "json":
-                # Parse JSON - support both array of objects and columnar format
-                data = json.loads(context.raw_data)
-                if isinstance(data, list):
-                    # Array of objects format
-                    context.parsed_data = pl.DataFrame(data)
-                elif isinstance(data, dict):
-                    # Columnar format
-                    context.parsed_data = pl.DataFrame(data)
-                else:
-                    msg = f"Unsupported JSON structure: {type(data)}"
-                    raise ValueError(msg)  # noqa: TRY301
-            else:
-                msg = f"Unsupported data format: {context.data_format}"
-                raise ValueError(msg)  # noqa: TRY301
-
-            # Store basic stats
-            if context.parsed_data is not None:
-                context.rows_count = context.parsed_data.height
-                context.cols_count = context.parsed_data.width
-
-            self.logger.debug(
-                "Data parsed successfully",
-                extra={
-                    "format": context.data_format,
-                    "rows": context.rows_count,
-                    "cols": context.cols_count,
-                },
-            )
-
-        except Exception as e:
-            raise ChartelierError(
-                code=ErrorCode.E415_UNSUPPORTED_FORMAT,
-                message=f"Failed to parse {context.data_format} data: {e}",
-                hint="Ensure the data is valid CSV or JSON format",
-                details=[ErrorDetail(field="data", reason=str(e))],
-            ) from e
-
-    def _execute_phase(self, phase: PipelinePhase, context: ProcessingContext) -> None:
+    def _execute_phase(self, phase: PipelinePhase, context: ProcessingContext, overall: Deadline | None = None) -> None:
         """Execute a single pipeline phase.
 
         Args:
             phase: The phase to execute
             context: Processing context to update
+            overall: Deadline of the whole pipeline, which caps the phase's own budget (optional)
 
         Raises:
             ChartelierError: If phase execution fails
-            TimeoutError: If phase exceeds timeout
         """
-        phase_start = time.time()
+        phase_start_ns = time.perf_counter_ns()
         phase_timeout = self.PHASE_TIMEOUTS.get(phase, 10)
 
         try:
@@ -372,20 +432,9 @@ class Coordinator:
                 extra={"phase": phase.value, "timeout": phase_timeout},
             )
 
-            # Execute phase with timeout
-            with timeout(phase_timeout):
-                if phase == PipelinePhase.DATA_VALIDATION:
-                    self._execute_data_validation(context)
-                elif phase == PipelinePhase.PATTERN_SELECTION:
-                    self._execute_pattern_selection(context)
-                elif phase == PipelinePhase.CHART_SELECTION:
-                    self._execute_chart_selection(context)
-                elif phase == PipelinePhase.DATA_PROCESSING:
-                    self._execute_data_processing(context)
-                elif phase == PipelinePhase.DATA_MAPPING:
-                    self._execute_data_mapping(context)
-                elif phase == PipelinePhase.CHART_BUILDING:
-                    self._execute_chart_building(context)
+            # Phases bound their LLM calls by this deadline; work that completes is kept
+            context.phase_deadline = overall.within(phase_timeout) if overall else time.monotonic() + phase_timeout
+            self._phase_dispatch[phase](context)
 
             self.logger.debug(
                 "Phase %s completed successfully",
@@ -393,19 +442,25 @@ class Coordinator:
                 extra={"phase": phase.value},
             )
 
-        except TimeoutError as e:
-            # Re-raise with phase information
-            raise TimeoutError(phase.value, phase_timeout) from e
-
         finally:
+            context.phase_deadline = None
             # Record phase timing
-            phase_time = (time.time() - phase_start) * 1000
-            context.processing_time_ms[phase.value] = phase_time
+            context.processing_time_ms[phase.value] = (time.perf_counter_ns() - phase_start_ns) / 1e6
 
     def _execute_data_validation(self, context: ProcessingContext) -> None:
         """Execute data validation phase."""
-        # Validate and parse data
-        validated = self.data_validator.validate(context.raw_data, context.data_format)
+        # Validate and parse data, reusing the result for data seen in a recent request
+        key = hashlib.blake2b(context.raw_data.encode("utf-8"), digest_size=16).digest() + context.data_format.encode()
+        validated = self._validation_cache.get(key)
+        if validated is None:
+            validated = self.data_validator.validate(context.raw_data, context.data_format)
+            self._validation_cache[key] = validated
+            while len(self._validation_cache) > self.VALIDATION_CACHE_SIZE:
+                self._validation_cache.popitem(last=False)
+        else:
+            self._validation_cache.move_to_end(key)
+            # Later phases only derive new frames, but hand out a clone so a cached frame is never shared
+            validated = validated.model_copy(update={"df": validated.df.clone()})
 
         # Update context
         context.parsed_data = validated.df
@@ -417,6 +472,14 @@ class Coordinator:
         context.rows_count = validated.df.height
         context.cols_count = validated.df.width
 
+        # Fail fast: selecting and mapping a chart for no rows only ends in a chart building error
+        if context.rows_count == 0:
+            raise ChartelierError(
+                code=ErrorCode.E422_UNPROCESSABLE,
+                message="Data has no rows",
+                hint="Provide at least one data row",
+            )
+
     def _execute_pattern_selection(self, context: ProcessingContext) -> None:
         """Execute pattern selection phase."""
         if context.data_metadata is None:
@@ -427,7 +490,7 @@ class Coordinator:
             )
 
         # Select pattern
-        selection = self.pattern_selector.select(context.data_metadata, context.query)
+        selection = self.pattern_selector.select(context.data_metadata, context.query, context.phase_deadline)
 
         # Update context
         context.pattern_id = selection.pattern_id.value
@@ -439,8 +502,9 @@ class Coordinator:
             context.pattern_id = PatternID.P01.value
             context.warnings.append("Pattern selection failed, using default line chart pattern")
 
-        # Select chart
-        chart_selection = self.chart_selector.select_chart(
+        # Select chart and auxiliary elements (a plain list of element IDs); the two LLM calls
+        # overlap only when the pattern offers several charts
+        chart_selection = self.chart_selector.select_chart_and_auxiliary(
             pattern_id=PatternID(context.pattern_id),
             metadata=context.data_metadata
             if context.data_metadata
@@ -448,20 +512,12 @@ class Coordinator:
                 rows=0, cols=0, dtypes={}, has_datetime=False, has_category=False, null_ratio={}, sampled=False
             ),
             query=context.query,
-        )
-
-        # Select auxiliary elements
-        auxiliary_selection = self.chart_selector.select_auxiliary(
-            template_id=chart_selection.template_id,
-            query=context.query,
+            deadline=context.phase_deadline,
         )
 
         # Update context
         context.template_id = chart_selection.template_id
-        if hasattr(auxiliary_selection, "auxiliary"):
-            context.auxiliary_config = auxiliary_selection.auxiliary
-        else:
-            context.auxiliary_config = []
+        context.auxiliary_config = chart_selection.auxiliary
 
     def _execute_data_processing(self, context: ProcessingContext) -> None:
         """Execute data processing phase."""
@@ -479,14 +535,14 @@ class Coordinator:
         # Update context
         context.processed_data = processed.df
         # Store operations applied for metadata
-        context.options["_operations_applied"] = processed.operations_applied
-        context.warnings.extend([f"Data processing: {op}" for op in processed.operations_applied])
+        context.operations_applied = processed.operations_applied
+        context.warnings.extend(f"Data processing: {op}" for op in processed.operations_applied)
 
     def _execute_data_mapping(self, context: ProcessingContext) -> None:
         """Execute data mapping phase."""
         if context.processed_data is None or context.template_id is None:
             # Use auto mapping if no processed data
-            context.mapping_config = self._get_auto_mapping(context)
+            context.mapping_config = MappingConfig(**self._get_auto_mapping(context))
             return
 
         # Map data to template
@@ -495,19 +551,11 @@ class Coordinator:
             template_id=context.template_id,
             query=context.query,
             auxiliary_config={"elements": context.auxiliary_config} if context.auxiliary_config else None,
+            deadline=context.phase_deadline,
         )
 
         # Update context
-        # MappingConfig is already a dict-like object
-        context.mapping_config = {
-            "x": mapping.x,
-            "y": mapping.y,
-            "color": mapping.color,
-            "size": mapping.size,
-            "facet": mapping.facet,
-            "row": mapping.row,
-            "column": mapping.column,
-        }
+        context.mapping_config = mapping
 
     def _execute_chart_building(self, context: ProcessingContext) -> None:
         """Execute chart building phase."""
@@ -523,11 +571,11 @@ class Coordinator:
                 ],
             )
 
-        # Build chart
+        # Build chart from only the mapped columns; templates serialize every column they receive
         chart = self.chart_builder.build(
             template_id=context.template_id,
-            data=context.processed_data,
-            mapping=MappingConfig(**context.mapping_config),
+            data=self._project_mapped_columns(context.processed_data, context.mapping_config),
+            mapping=context.mapping_config,
             auxiliary=context.auxiliary_config,
             auxiliary_config={"elements": context.auxiliary_config} if context.auxiliary_config else None,
         )
@@ -555,9 +603,15 @@ class Coordinator:
             else:
                 raise
 
+        if format == "png" and not self.chart_builder.png_available:
+            # vl-convert is missing, so export() served its SVG fallback
+            context.warnings.append("PNG export unavailable, returning SVG instead")
+            context.fallback_applied = True
+            format = "svg"
+
         # Store result in context (we'll retrieve it later)
-        context.options["_chart_data"] = image_data
-        context.options["_chart_format"] = format
+        context.chart_data = image_data
+        context.chart_format = format
 
     def _get_auto_mapping(self, context: ProcessingContext) -> dict[str, Any]:
         """Get automatic mapping for data."""
@@ -566,45 +620,54 @@ class Coordinator:
 
         # Simple auto-mapping: first numeric column as y, first temporal/ordinal as x
         mapping = {}
-        df = context.processed_data
-
-        # Find x column (temporal or ordinal)
-        for col in df.columns:
-            dtype = str(df[col].dtype)
-            if "Date" in dtype or "date" in dtype:
-                mapping["x"] = col
-                break
-
-        # If no temporal, use first column
-        if "x" not in mapping and len(df.columns) > 0:
-            mapping["x"] = df.columns[0]
-
-        # Find y column (numeric)
-        for col in df.columns:
-            if col != mapping.get("x"):
-                dtype = str(df[col].dtype)
-                if "Int" in dtype or "Float" in dtype:
-                    mapping["y"] = col
-                    break
+        schema = context.processed_data.schema
+
+        # Find x column (date or datetime), else use first column
+        x = next((name for name, dtype in schema.items() if dtype in (pl.Date, pl.Datetime)), None)
+        if x is None:
+            x = next(iter(schema), None)
+        if x is not None:
+            mapping["x"] = x
+
+        # Find y column (integer or float)
+        y = next(
+            (name for name, dtype in schema.items() if name != x and (dtype.is_integer() or dtype.is_float())),
+            None,
+        )
+        if y is not None:
+            mapping["y"] = y
 
         return mapping
 
+    @staticmethod
+    def _project_mapped_columns(df: pl.DataFrame, mapping_config: MappingConfig) -> pl.DataFrame:
+        """Narrow the frame to the columns referenced by the mapping.
+
+        The projection is planned lazily and collected once, so unmapped columns are
+        never copied into the chart spec. Mapped names absent from the frame are left
+        for the template to report.
+        """
+        columns = [name for name in dict.fromkeys(dict(mapping_config).values()) if name in df.schema]
+        if not columns or len(columns) == df.width:
+            return df
+        return df.lazy().select(columns).collect()
+
     def _build_success_response(self, context: ProcessingContext, request: ValidatedRequest) -> VisualizationResult:
         """Build successful visualization response."""
         # Get chart data from context
-        image_data = context.options.get("_chart_data")
-        format = context.options.get("_chart_format", request.options.get("format", "png"))
+        image_data = context.chart_data
+        format = context.chart_format or request.options.get("format", "png")
 
-        # Calculate total processing time
-        total_time = sum(context.processing_time_ms.values())
+        # Measure total processing time end to end rather than summing the phases
+        total_time = context.elapsed_ms()
 
         # Build metadata according to MCP specification
         metadata = {
             "pattern_id": context.pattern_id or "P01",  # Default to P01 if not set
             "template_id": context.template_id or "line",  # Default template
-            "mapping": context.mapping_config or {},
+            "mapping": context.mapping_config.model_dump(exclude_none=True) if context.mapping_config else {},
             "auxiliary": context.auxiliary_config or [],
-            "operations_applied": context.options.get("_operations_applied", []),
+            "operations_applied": context.operations_applied,
             "decisions": {
                 "pattern": {"elapsed_ms": context.processing_time_ms.get(PipelinePhase.PATTERN_SELECTION.value, 0)},
                 "chart": {"elapsed_ms": context.processing_time_ms.get(PipelinePhase.CHART_SELECTION.value, 0)},
@@ -615,7 +678,7 @@ class Coordinator:
                 "sampled": context.data_sampled,
                 "duration_ms": {
                     "total": total_time,
-                    **dict(context.processing_time_ms.items()),
+                    **context.processing_time_ms,
                 },
             },
             "versions": {
@@ -627,7 +690,7 @@ class Coordinator:
             "fallback_applied": context.fallback_applied,
         }
 
-        return VisualizationResult(
+        return VisualizationResult.model_construct(
             format=format,
             image_data=image_data,
             metadata=metadata,
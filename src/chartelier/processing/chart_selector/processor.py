@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
+from collections import Counter, OrderedDict
+from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, ClassVar
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
 
 from pydantic import BaseModel, Field
 
@@ -17,14 +20,17 @@ from chartelier.infra.llm_client import (
     ResponseFormat,
     get_llm_client,
 )
-from chartelier.infra.logging import get_logger
+from chartelier.infra.logging import StructuredLogger, get_logger
 from chartelier.infra.prompt_template import PromptTemplate
+from chartelier.infra.serialization import loads
 
 if TYPE_CHECKING:
     from chartelier.core.models import DataMetadata
 
 logger = get_logger(__name__)
 
+_T = TypeVar("_T")
+
 
 class ChartSelection(BaseModel):
     """Result of chart selection process."""
@@ -38,12 +44,23 @@ class ChartSelection(BaseModel):
 class ChartSelector:
     """Selects optimal chart types and auxiliary elements based on pattern and data."""
 
+    # Logger shared by all instances
+    logger: ClassVar[StructuredLogger] = get_logger("ChartSelector")
+
     # Default model
     DEFAULT_MODEL: ClassVar[str] = "gpt-5-mini"
 
     # Maximum auxiliary elements
     MAX_AUXILIARY_ELEMENTS: ClassVar[int] = 3
 
+    # Descriptions shown to the LLM for each auxiliary element
+    AUXILIARY_DESCRIPTIONS: ClassVar[dict[AuxiliaryElement, str]] = {
+        AuxiliaryElement.TARGET_LINE: "Display target or goal reference line",
+    }
+
+    # Number of recent LLM selections kept for repeated (options, data shape, query) inputs
+    SELECTION_CACHE_SIZE: ClassVar[int] = 512
+
     def __init__(
         self,
         llm_client: LLMClient | None = None,
@@ -59,13 +76,20 @@ class ChartSelector:
         """
         self.llm_client = llm_client or get_llm_client()
         self.chart_builder = chart_builder or ChartBuilder()
-        self.logger = get_logger(self.__class__.__name__)
         self.model = model or self.DEFAULT_MODEL
 
-        # Load prompt templates
-        template_dir = Path(__file__).parent
-        self.chart_prompt = PromptTemplate.from_component(template_dir, "chart_selection")
-        self.auxiliary_prompt = PromptTemplate.from_component(template_dir, "auxiliary_selection")
+        # LLM selections by prompt inputs, least recently used first. Answers are only reused
+        # when the client really sends selections at temperature 0; some models (e.g. the
+        # default gpt-5 family) are always sampled, and a sampled answer is not pinned.
+        # Clients written before effective_temperature existed send what is requested.
+        effective_temperature = getattr(self.llm_client, "effective_temperature", None)
+        self.cache_enabled = effective_temperature is None or effective_temperature(self.model, 0.0) == 0
+        self._chart_cache: OrderedDict[tuple[str, ...], ChartSelection] = OrderedDict()
+        self._auxiliary_cache: OrderedDict[tuple[str, ...], tuple[str, ...]] = OrderedDict()
+        self.cache_hits = 0
+        # Prompt JSON for each option set; bounded by the registered templates and elements
+        self._chart_options_json: dict[tuple[str, ...], str] = {}
+        self._auxiliary_options_json: dict[tuple[str, ...], str] = {}
 
         self.logger.debug(
             "Initialized ChartSelector",
@@ -74,11 +98,25 @@ class ChartSelector:
             },
         )
 
+    # Prompt templates are loaded on first use: with a single chart per pattern the chart
+    # prompt is never rendered, and auxiliary selection often needs no LLM call either.
+
+    @cached_property
+    def chart_prompt(self) -> PromptTemplate:
+        """Chart selection prompt, loaded on first use."""
+        return PromptTemplate.from_component(Path(__file__).parent, "chart_selection")
+
+    @cached_property
+    def auxiliary_prompt(self) -> PromptTemplate:
+        """Auxiliary selection prompt, loaded on first use."""
+        return PromptTemplate.from_component(Path(__file__).parent, "auxiliary_selection")
+
     def select_chart(
         self,
         pattern_id: PatternID,
         metadata: DataMetadata,
         query: str | None = None,
+        deadline: float | None = None,
     ) -> ChartSelection:
         """Select optimal chart type for the given pattern and data.
 
@@ -86,6 +124,7 @@ class ChartSelector:
             pattern_id: Selected pattern ID
             metadata: Data metadata
             query: User's visualization query (optional)
+            deadline: Monotonic time after which no LLM request is dispatched (optional)
 
         Returns:
             ChartSelection with chosen template ID
@@ -121,7 +160,7 @@ class ChartSelector:
 
         try:
             # Use LLM to select best chart
-            return self._select_with_llm(pattern_id, available_charts, metadata, query)
+            return self._select_with_llm(pattern_id, available_charts, metadata, query, deadline)
 
         except (LLMTimeoutError, LLMAPIError) as e:
             self.logger.warning(
@@ -139,14 +178,27 @@ class ChartSelector:
         query: str,
         metadata: DataMetadata | None = None,
         auxiliary_config: dict[str, Any] | None = None,
+        deadline: float | None = None,
     ) -> list[str]:
         """Select auxiliary elements for the chart.
 
+        The LLM is only consulted when the choice is open. ``auxiliary_config["mode"]``
+        selects how elements are chosen:
+
+        - ``"auto"`` (default): the LLM picks from the template's allowed elements
+        - ``"none"``: no auxiliary elements
+        - ``"all"``: every allowed element, up to the maximum
+        - ``"explicit"``: the IDs listed in ``auxiliary_config["elements"]`` that the
+          template allows, up to the maximum
+
+        An empty query also selects no elements, as there is no intent to act on.
+
         Args:
             template_id: Selected template ID
             query: User's visualization query
             metadata: Data metadata (optional)
             auxiliary_config: Configuration for auxiliary elements (optional)
+            deadline: Monotonic time after which no LLM request is dispatched (optional)
 
         Returns:
             List of auxiliary element IDs (max 3)
@@ -156,6 +208,10 @@ class ChartSelector:
             extra={"template_id": template_id},
         )
 
+        mode = (auxiliary_config or {}).get("mode", "auto")
+        if mode == "none" or not query.strip():
+            return []
+
         # Get template spec to know allowed auxiliary elements
         template_spec = self.chart_builder.get_template_spec(template_id)
         if not template_spec:
@@ -163,12 +219,18 @@ class ChartSelector:
                 "Template spec not found",
                 extra={"template_id": template_id},
             )
-            return []
 
-        allowed_auxiliary = template_spec.allowed_auxiliary
+        allowed_auxiliary = template_spec.allowed_auxiliary if template_spec else []
         if not allowed_auxiliary:
             return []
 
+        # Deterministic modes need no LLM call
+        allowed_ids = tuple(elem.value for elem in allowed_auxiliary)
+        if mode == "all":
+            return list(allowed_ids[: self.MAX_AUXILIARY_ELEMENTS])
+        if mode == "explicit":
+            return self._normalize_auxiliary((auxiliary_config or {}).get("elements") or [], allowed_ids)
+
         try:
             # Use LLM to select auxiliary elements
             return self._select_auxiliary_with_llm(
@@ -177,6 +239,7 @@ class ChartSelector:
                 query,
                 metadata,
                 auxiliary_config,
+                deadline,
             )
 
         except (LLMTimeoutError, LLMAPIError) as e:
@@ -189,12 +252,94 @@ class ChartSelector:
             )
             return []
 
+    def select_chart_and_auxiliary(
+        self,
+        pattern_id: PatternID,
+        metadata: DataMetadata,
+        query: str | None = None,
+        auxiliary_config: dict[str, Any] | None = None,
+        deadline: float | None = None,
+    ) -> ChartSelection:
+        """Select the chart and its auxiliary elements, overlapping the two LLM calls.
+
+        Synchronous wrapper around :meth:`aselect_chart_and_auxiliary`; it runs its own event
+        loop, so it must not be called from a running one. Patterns with at most one chart
+        (currently every registered pattern) need no chart LLM call, so there is nothing to
+        overlap and both selections run directly on the calling thread.
+
+        Args:
+            pattern_id: Selected pattern ID
+            metadata: Data metadata
+            query: User's visualization query (optional)
+            auxiliary_config: Configuration for auxiliary elements (optional)
+            deadline: Monotonic time after which no LLM request is dispatched (optional)
+
+        Returns:
+            ChartSelection with the chosen template ID and auxiliary elements
+        """
+        if len(self.chart_builder.get_available_charts(pattern_id)) <= 1:
+            selection = self.select_chart(pattern_id, metadata, query, deadline)
+            auxiliary = self.select_auxiliary(selection.template_id, query or "", metadata, auxiliary_config, deadline)
+            return selection.model_copy(update={"auxiliary": auxiliary})
+        return asyncio.run(self.aselect_chart_and_auxiliary(pattern_id, metadata, query, auxiliary_config, deadline))
+
+    async def aselect_chart_and_auxiliary(
+        self,
+        pattern_id: PatternID,
+        metadata: DataMetadata,
+        query: str | None = None,
+        auxiliary_config: dict[str, Any] | None = None,
+        deadline: float | None = None,
+    ) -> ChartSelection:
+        """Select the chart and its auxiliary elements, overlapping the two LLM calls.
+
+        Auxiliary selection only needs a template ID. When the pattern offers several charts,
+        elements are selected speculatively for the first one (the fallback choice) while the
+        chart LLM call is in flight, and selected again only if a different chart is chosen.
+        Both selections run in worker threads through :meth:`select_chart` and
+        :meth:`select_auxiliary`, so they share their caches and fallbacks.
+
+        Args:
+            pattern_id: Selected pattern ID
+            metadata: Data metadata
+            query: User's visualization query (optional)
+            auxiliary_config: Configuration for auxiliary elements (optional)
+            deadline: Monotonic time after which no LLM request is dispatched (optional)
+
+        Returns:
+            ChartSelection with the chosen template ID and auxiliary elements
+        """
+        available_charts = self.chart_builder.get_available_charts(pattern_id)
+        auxiliary_query = query or ""
+
+        if len(available_charts) <= 1:
+            # The chart is known without an LLM call, so there is nothing to overlap
+            selection = self.select_chart(pattern_id, metadata, query, deadline)
+            auxiliary = await asyncio.to_thread(
+                self.select_auxiliary, selection.template_id, auxiliary_query, metadata, auxiliary_config, deadline
+            )
+            return selection.model_copy(update={"auxiliary": auxiliary})
+
+        speculative_id = available_charts[0].template_id
+        selection, auxiliary = await asyncio.gather(
+            asyncio.to_thread(self.select_chart, pattern_id, metadata, query, deadline),
+            asyncio.to_thread(
+                self.select_auxiliary, speculative_id, auxiliary_query, metadata, auxiliary_config, deadline
+            ),
+        )
+        if selection.template_id != speculative_id:
+            auxiliary = await asyncio.to_thread(
+                self.select_auxiliary, selection.template_id, auxiliary_query, metadata, auxiliary_config, deadline
+            )
+        return selection.model_copy(update={"auxiliary": auxiliary})
+
     def _select_with_llm(
         self,
         pattern_id: PatternID,
         available_charts: list[Any],
         metadata: DataMetadata,
         query: str | None,
+        deadline: float | None = None,
     ) -> ChartSelection:
         """Select chart using LLM.
 
@@ -203,26 +348,37 @@ class ChartSelector:
             available_charts: List of available chart specifications
             metadata: Data metadata
             query: User query
+            deadline: Monotonic time after which no LLM request is dispatched
 
         Returns:
             ChartSelection
         """
-        # Format chart options
-        chart_options = [
-            {
-                "id": chart.template_id,
-                "name": chart.name,
-            }
-            for chart in available_charts
-        ]
+        chart_ids = tuple(chart.template_id for chart in available_charts)
 
         # Format data info
         data_info = self._format_data_info(metadata)
 
+        # The prompt sees only these inputs, so they identify the answer
+        cache_key = (pattern_id.value, *chart_ids, data_info, query or "")
+        cached = self._cache_get(self._chart_cache, cache_key)
+        if cached is not None:
+            self.logger.debug(
+                "Chart selection cache hit", extra={"pattern_id": pattern_id.value, "cache_hits": self.cache_hits}
+            )
+            return cached.model_copy()
+
+        # Format chart options; they depend only on the template set, so build them once per set
+        chart_options = self._chart_options_json.get(chart_ids)
+        if chart_options is None:
+            chart_options = json.dumps(
+                [{"id": chart.template_id, "name": chart.name} for chart in available_charts], indent=2
+            )
+            self._chart_options_json[chart_ids] = chart_options
+
         # Render prompt
         messages = self.chart_prompt.render(
             pattern_id=pattern_id.value,
-            chart_options=json.dumps(chart_options, indent=2),
+            chart_options=chart_options,
             data_info=data_info,
             query=query or "Visualize the data",
         )
@@ -233,31 +389,34 @@ class ChartSelector:
             response_format=ResponseFormat.JSON,
             temperature=0.0,
             model=self.model,
+            deadline=deadline,
+            semantic_query=query,
         )
 
         # Parse response
         try:
-            data = json.loads(response.content)
+            data = loads(response.content)
             template_id = data.get("template_id")
 
             # Validate template_id
-            valid_ids = [c.template_id for c in available_charts]
-            if template_id not in valid_ids:
+            if template_id not in chart_ids:
                 self.logger.warning(
                     "Invalid template_id from LLM",
                     extra={
                         "template_id": template_id,
-                        "valid_ids": valid_ids,
+                        "valid_ids": list(chart_ids),
                     },
                 )
                 return self._get_fallback_chart(pattern_id)
 
-            return ChartSelection(
+            selection = ChartSelection(
                 template_id=template_id,
                 auxiliary=[],
                 reasoning=data.get("reasoning"),
                 fallback_applied=False,
             )
+            self._cache_put(self._chart_cache, cache_key, selection)
+            return selection.model_copy()
 
         except (json.JSONDecodeError, KeyError) as e:
             self.logger.warning(
@@ -266,13 +425,14 @@ class ChartSelector:
             )
             return self._get_fallback_chart(pattern_id)
 
-    def _select_auxiliary_with_llm(
+    def _select_auxiliary_with_llm(  # noqa: PLR0913 — Selection inputs plus the call deadline
         self,
         template_id: str,
         allowed_auxiliary: list[AuxiliaryElement],
         query: str,
         metadata: DataMetadata | None,
         auxiliary_config: dict[str, Any] | None,  # noqa: ARG002 — Reserved for future use
+        deadline: float | None = None,
     ) -> list[str]:
         """Select auxiliary elements using LLM.
 
@@ -282,27 +442,44 @@ class ChartSelector:
             query: User query
             metadata: Data metadata
             auxiliary_config: Auxiliary configuration
+            deadline: Monotonic time after which no LLM request is dispatched
 
         Returns:
             List of auxiliary element IDs
         """
-        # Format auxiliary options
-        auxiliary_options = [
-            {
-                "id": elem.value,
-                "name": elem.value.replace("_", " ").title(),
-                "description": self._get_auxiliary_description(elem),
-            }
-            for elem in allowed_auxiliary
-        ]
+        auxiliary_ids = tuple(elem.value for elem in allowed_auxiliary)
 
         # Format data info if available
         data_info = self._format_data_info(metadata) if metadata else "Data information not available"
 
+        cache_key = (template_id, *auxiliary_ids, data_info, query)
+        cached = self._cache_get(self._auxiliary_cache, cache_key)
+        if cached is not None:
+            self.logger.debug(
+                "Auxiliary selection cache hit", extra={"template_id": template_id, "cache_hits": self.cache_hits}
+            )
+            return list(cached)
+
+        # Format auxiliary options, built once per allowed element set
+        auxiliary_options = self._auxiliary_options_json.get(auxiliary_ids)
+        if auxiliary_options is None:
+            auxiliary_options = json.dumps(
+                [
+                    {
+                        "id": elem.value,
+                        "name": elem.value.replace("_", " ").title(),
+                        "description": self._get_auxiliary_description(elem),
+                    }
+                    for elem in allowed_auxiliary
+                ],
+                indent=2,
+            )
+            self._auxiliary_options_json[auxiliary_ids] = auxiliary_options
+
         # Render prompt
         messages = self.auxiliary_prompt.render(
             template_id=template_id,
-            auxiliary_options=json.dumps(auxiliary_options, indent=2),
+            auxiliary_options=auxiliary_options,
             query=query,
             data_info=data_info,
             max_elements=self.MAX_AUXILIARY_ELEMENTS,
@@ -314,25 +491,17 @@ class ChartSelector:
             response_format=ResponseFormat.JSON,
             temperature=0.0,
             model=self.model,
+            deadline=deadline,
+            semantic_query=query,
         )
 
         # Parse response
         try:
-            data = json.loads(response.content)
+            data = loads(response.content)
             selected = data.get("auxiliary", [])
 
-            # Validate, remove duplicates, and limit to max elements
-            valid_ids = [elem.value for elem in allowed_auxiliary]
-            selected = [aid for aid in selected if aid in valid_ids]
-            # Remove duplicates while preserving order
-            seen: set[str] = set()
-            unique_selected = []
-            for item in selected:
-                if item not in seen:
-                    seen.add(item)
-                    unique_selected.append(item)
-            selected = unique_selected
-            selected = selected[: self.MAX_AUXILIARY_ELEMENTS]
+            selected = self._normalize_auxiliary(selected, auxiliary_ids)
+            self._cache_put(self._auxiliary_cache, cache_key, tuple(selected))
 
             self.logger.info(
                 "Auxiliary elements selected",
@@ -351,6 +520,41 @@ class ChartSelector:
             )
             return []
 
+    def _normalize_auxiliary(self, selected: list[Any], allowed_ids: tuple[str, ...]) -> list[str]:
+        """Keep allowed IDs only, remove duplicates preserving order, and limit to the maximum.
+
+        Args:
+            selected: Requested auxiliary element IDs
+            allowed_ids: IDs the template allows
+
+        Returns:
+            List of auxiliary element IDs
+        """
+        unique = dict.fromkeys(aid for aid in selected if aid in allowed_ids)
+        return list(unique)[: self.MAX_AUXILIARY_ELEMENTS]
+
+    def _cache_get(self, cache: OrderedDict[tuple[str, ...], _T], key: tuple[str, ...]) -> _T | None:
+        """Return a cached selection and mark it most recently used, or None on a miss."""
+        if not self.cache_enabled:
+            return None
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+            self.cache_hits += 1
+        return value
+
+    def _cache_put(self, cache: OrderedDict[tuple[str, ...], _T], key: tuple[str, ...], value: _T) -> None:
+        """Store a selection, evicting the least recently used beyond ``SELECTION_CACHE_SIZE``.
+
+        Only answers parsed from the LLM are stored; fallbacks after an LLM error are not,
+        so a transient failure is retried on the next request.
+        """
+        if not self.cache_enabled:
+            return
+        cache[key] = value
+        while len(cache) > self.SELECTION_CACHE_SIZE:
+            cache.popitem(last=False)
+
     def _get_fallback_chart(self, pattern_id: PatternID) -> ChartSelection:
         """Get fallback chart for a pattern.
 
@@ -397,13 +601,9 @@ class ChartSelector:
             f"- Columns: {metadata.cols}",
         ]
 
-        # Add column types
-        type_counts: dict[str, int] = {}
-        for dtype in metadata.dtypes.values():
-            type_counts[dtype] = type_counts.get(dtype, 0) + 1
-
-        for dtype, count in type_counts.items():
-            lines.append(f"- {dtype.capitalize()} columns: {count}")
+        # Add column types, in order of first appearance
+        type_counts = Counter(metadata.dtypes.values())
+        lines.extend(f"- {dtype.capitalize()} columns: {count}" for dtype, count in type_counts.items())
 
         # Add characteristics
         if metadata.has_datetime:
@@ -422,7 +622,4 @@ class ChartSelector:
         Returns:
             Description string
         """
-        descriptions = {
-            AuxiliaryElement.TARGET_LINE: "Display target or goal reference line",
-        }
-        return descriptions.get(element, "")
+        return self.AUXILIARY_DESCRIPTIONS.get(element, "")
@@ -101,6 +101,7 @@ class DataMapper:
         template_id: str,
         query: str,
         auxiliary_config: dict[str, Any] | None = None,  # noqa: ARG002
+        deadline: float | None = None,
     ) -> MappingConfig:
         """Map data columns to template encodings.
 
@@ -109,6 +110,7 @@ class DataMapper:
             template_id: Selected template ID
             query: User's original query for context
             auxiliary_config: Optional auxiliary element configuration
+            deadline: Monotonic time after which no LLM request is dispatched (optional)
 
         Returns:
             MappingConfig with column to encoding mappings
@@ -142,6 +144,7 @@ class DataMapper:
                 column_info=column_info,
                 template_spec=template_spec,
                 query=query,
+                deadline=deadline,
             )
             self.logger.info("LLM mapping successful")
         except Exception as e:  # noqa: BLE001
@@ -221,6 +224,7 @@ class DataMapper:
         column_info: dict[str, dict[str, Any]],
         template_spec: TemplateSpec,
         query: str,
+        deadline: float | None = None,
     ) -> MappingConfig:
         """Use LLM to suggest optimal column mappings.
 
@@ -228,6 +232,7 @@ class DataMapper:
             column_info: Column metadata
             template_spec: Template specification
             query: User's query for context
+            deadline: Monotonic time after which no LLM request is dispatched
 
         Returns:
             MappingConfig based on LLM suggestion
@@ -263,6 +268,7 @@ class DataMapper:
                 temperature=0.3,
                 max_tokens=500,
                 response_format=ResponseFormat.JSON,
+                deadline=deadline,
             )
 
             mapping_dict = json.loads(response.content)
@@ -13,6 +13,7 @@ from chartelier.core.enums import ErrorCode
 from chartelier.core.errors import ChartelierError
 from chartelier.core.models import DataMetadata, ErrorDetail
 from chartelier.infra.logging import get_logger
+from chartelier.infra.serialization import loads
 
 logger = get_logger(__name__)
 
@@ -177,14 +178,11 @@ class DataValidator:
         Returns:
             Parsed DataFrame.
         """
-        # Try to parse as records format first
         try:
-            json_data = json.loads(data)
-            if isinstance(json_data, list):
-                # Array of records
-                return pl.DataFrame(json_data)
-            if isinstance(json_data, dict):
-                # Object with arrays (columnar format)
+            json_data = loads(data)
+            # polars tells records (list of objects) from columnar (object of arrays) itself, but
+            # would also accept a bare string (one row per character) or null (an empty frame)
+            if isinstance(json_data, (list, dict)):
                 return pl.DataFrame(json_data)
             msg = f"Unsupported JSON structure: {type(json_data)}"
             raise ValueError(msg)
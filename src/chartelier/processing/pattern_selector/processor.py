@@ -89,12 +89,13 @@ class PatternSelector:
             },
         )
 
-    def select(self, metadata: DataMetadata, query: str) -> PatternSelection:
+    def select(self, metadata: DataMetadata, query: str, deadline: float | None = None) -> PatternSelection:
         """Select a visualization pattern based on data and query.
 
         Args:
             metadata: Data metadata including column types and statistics
             query: User's visualization query
+            deadline: Monotonic time after which no LLM request is dispatched (optional)
 
         Returns:
             PatternSelection with chosen pattern ID
@@ -127,6 +128,8 @@ class PatternSelector:
                 response_format=ResponseFormat.JSON,
                 temperature=0.0,  # Deterministic selection
                 model=self.model,  # Use configured model
+                deadline=deadline,
+                semantic_query=query,
             )
 
             # Parse and validate response
@@ -1,7 +1,12 @@
 """Tests for LLM client implementations."""
 
+import asyncio
 import json
-from unittest.mock import MagicMock, patch
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -9,12 +14,18 @@ from chartelier.core.enums import ErrorCode
 from chartelier.infra.llm_client import (
     LiteLLMClient,
     LLMAPIError,
+    LLMCache,
+    LLMInputTooLargeError,
     LLMMessage,
     LLMResponse,
     LLMSettings,
     LLMTimeoutError,
     MockLLMClient,
     ResponseFormat,
+    SemanticLLMCache,
+    SQLiteLLMCache,
+    _default_settings,
+    get_llm_cache,
     get_llm_client,
 )
 
@@ -71,6 +82,7 @@ class TestLLMSettings:
         assert settings.max_retries == 3
         assert settings.retry_delay == 1.0
         assert settings.temperature == 0.0
+        assert settings.max_tokens is None
         assert settings.disable_llm is False
 
     def test_settings_from_env(self, monkeypatch):
@@ -86,6 +98,20 @@ class TestLLMSettings:
         assert settings.timeout == 30
         assert settings.disable_llm is True
 
+    def test_default_settings_loaded_once(self, monkeypatch):
+        """Test that clients without explicit settings share one environment load."""
+        _default_settings.cache_clear()
+        monkeypatch.setenv("CHARTELIER_LLM_MODEL", "gpt-4")
+        try:
+            first = MockLLMClient()
+            monkeypatch.setenv("CHARTELIER_LLM_MODEL", "gpt-4o")
+            second = MockLLMClient()
+
+            assert first.settings is second.settings
+            assert second.settings.model == "gpt-4"
+        finally:
+            _default_settings.cache_clear()
+
 
 class TestLLMErrors:
     """Tests for LLM error classes."""
@@ -154,6 +180,15 @@ class TestMockLLMClient:
         parsed = json.loads(response.content)
         assert parsed["response"] == "Not JSON"
 
+    def test_mock_default_response_reassigned(self):
+        """Test mock client picks up a default response set after construction."""
+        client = MockLLMClient(default_response="Not JSON")
+        client.default_response = '{"key": "value"}'
+        messages = [LLMMessage(role="user", content="Hello")]
+
+        response = client.complete(messages, response_format=ResponseFormat.JSON)
+        assert json.loads(response.content) == {"key": "value"}
+
     def test_mock_simulate_timeout(self):
         """Test mock client simulating timeout."""
         client = MockLLMClient(simulate_timeout=True)
@@ -174,6 +209,247 @@ class TestMockLLMClient:
         assert "Mock API error" in str(exc_info.value)
 
 
+def _completion_response(content: str) -> MagicMock:
+    """Build a minimal litellm-style completion response."""
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = content
+    response.choices[0].finish_reason = "stop"
+    response.model = "gpt-4o"
+    response.usage = None
+    return response
+
+
+def _joined_event(client: LiteLLMClient) -> threading.Event:
+    """Return an event set once another caller starts waiting on the client's in-flight request."""
+    (flight,) = client._inflight.values()  # noqa: SLF001 — Testing internals
+    joined = threading.Event()
+    wait = flight.done.wait
+
+    def _wait(timeout: float | None = None) -> bool:
+        joined.set()
+        return wait(timeout)
+
+    flight.done.wait = _wait
+    return joined
+
+
+class TestInFlightDeduplication:
+    """Tests for coalescing identical concurrent requests."""
+
+    def test_concurrent_identical_requests_share_one_call(self):
+        """Test a duplicate deterministic request waits for the in-flight one."""
+        with patch.object(LiteLLMClient, "_ensure_litellm"):
+            client = LiteLLMClient(LLMSettings(model="gpt-4o", temperature=0.0))
+            client._litellm = MagicMock()  # noqa: SLF001 — Testing internals
+            started = threading.Event()
+            release = threading.Event()
+
+            def _slow_completion(**_: object) -> MagicMock:
+                started.set()
+                release.wait(timeout=5)
+                return _completion_response("shared")
+
+            client._litellm.completion.side_effect = _slow_completion  # noqa: SLF001
+            messages = [LLMMessage(role="user", content="Hello")]
+
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                first = pool.submit(client.complete, messages)
+                assert started.wait(timeout=5)
+                joined = _joined_event(client)
+                second = pool.submit(client.complete, messages)
+                # Only let the leader finish once the second caller is waiting on it
+                assert joined.wait(timeout=5)
+                release.set()
+                results = [first.result(timeout=5), second.result(timeout=5)]
+
+            assert [r.content for r in results] == ["shared", "shared"]
+            assert client._litellm.completion.call_count == 1  # noqa: SLF001
+            assert not client._inflight  # noqa: SLF001
+
+    def test_sampled_requests_are_not_coalesced(self):
+        """Test non-deterministic requests are always sent individually."""
+        with patch.object(LiteLLMClient, "_ensure_litellm"):
+            client = LiteLLMClient(LLMSettings(model="gpt-4o", temperature=0.7))
+            client._litellm = MagicMock()  # noqa: SLF001 — Testing internals
+            client._litellm.acompletion = AsyncMock(return_value=_completion_response("sampled"))  # noqa: SLF001
+            messages = [LLMMessage(role="user", content="Hello")]
+
+            asyncio.run(client.acomplete_many([messages, messages]))
+
+            assert client._litellm.acompletion.await_count == 2  # noqa: SLF001
+
+    def test_async_identical_requests_share_one_call(self):
+        """Test concurrent identical async requests await a single provider call."""
+        with patch.object(LiteLLMClient, "_ensure_litellm"):
+            client = LiteLLMClient(LLMSettings(model="gpt-4o", temperature=0.0))
+            client._litellm = MagicMock()  # noqa: SLF001 — Testing internals
+
+            async def _slow_acompletion(**_: object) -> MagicMock:
+                await asyncio.sleep(0.05)
+                return _completion_response("shared")
+
+            client._litellm.acompletion = AsyncMock(side_effect=_slow_acompletion)  # noqa: SLF001
+            messages = [LLMMessage(role="user", content="Hello")]
+
+            results = asyncio.run(client.acomplete_many([messages, messages, messages]))
+
+            assert [r.content for r in results] == ["shared"] * 3
+            assert client._litellm.acompletion.await_count == 1  # noqa: SLF001
+            assert not client._ainflight  # noqa: SLF001
+
+    def test_async_follower_takes_over_cancelled_leader(self):
+        """Test cancelling the leader's task doesn't cancel followers; one of them resends."""
+        with patch.object(LiteLLMClient, "_ensure_litellm"):
+            client = LiteLLMClient(LLMSettings(model="gpt-4o", temperature=0.0))
+            client._litellm = MagicMock()  # noqa: SLF001 — Testing internals
+
+            async def _slow_acompletion(**_: object) -> MagicMock:
+                await asyncio.sleep(0.05)
+                return _completion_response("resent")
+
+            client._litellm.acompletion = AsyncMock(side_effect=_slow_acompletion)  # noqa: SLF001
+            messages = [LLMMessage(role="user", content="Hello")]
+
+            async def _run() -> LLMResponse:
+                leader = asyncio.create_task(client.acomplete(messages))
+                await asyncio.sleep(0.01)
+                follower = asyncio.create_task(client.acomplete(messages))
+                await asyncio.sleep(0.01)
+                leader.cancel()
+                return await follower
+
+            assert asyncio.run(_run()).content == "resent"
+            assert client._litellm.acompletion.await_count == 2  # noqa: SLF001
+            assert not client._ainflight  # noqa: SLF001
+
+    def test_followers_raise_their_own_error_instance(self):
+        """Test a leader's failure reaches followers as a copy, not the shared instance."""
+        with patch.object(LiteLLMClient, "_ensure_litellm"):
+            client = LiteLLMClient(LLMSettings(model="gpt-4o", temperature=0.0, max_retries=1))
+            client._litellm = MagicMock()  # noqa: SLF001 — Testing internals
+            started = threading.Event()
+            release = threading.Event()
+
+            class MockAPIError(Exception):
+                status_code = 503
+
+            def _failing_completion(**_: object) -> MagicMock:
+                started.set()
+                release.wait(timeout=5)
+                raise MockAPIError("unavailable")
+
+            client._litellm.completion.side_effect = _failing_completion  # noqa: SLF001
+            messages = [LLMMessage(role="user", content="Hello")]
+
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                first = pool.submit(client.complete, messages)
+                assert started.wait(timeout=5)
+                joined = _joined_event(client)
+                second = pool.submit(client.complete, messages)
+                # Only let the leader finish once the second caller is waiting on it
+                assert joined.wait(timeout=5)
+                release.set()
+                errors = [first.exception(timeout=5), second.exception(timeout=5)]
+
+            assert all(isinstance(error, LLMAPIError) for error in errors)
+            assert errors[0] is not errors[1]
+            assert str(errors[0]) == str(errors[1])
+            assert errors[0].status_code == errors[1].status_code == 503
+            assert client._litellm.completion.call_count == 1  # noqa: SLF001
+
+    def test_follower_takes_over_interrupted_leader(self):
+        """Test a KeyboardInterrupt in the leader stays there; a follower resends the request."""
+        with patch.object(LiteLLMClient, "_ensure_litellm"):
+            client = LiteLLMClient(LLMSettings(model="gpt-4o", temperature=0.0))
+            client._litellm = MagicMock()  # noqa: SLF001 — Testing internals
+            started = threading.Event()
+            release = threading.Event()
+            calls = []
+
+            def _completion(**_: object) -> MagicMock:
+                calls.append(None)
+                if len(calls) == 1:
+                    started.set()
+                    release.wait(timeout=5)
+                    raise KeyboardInterrupt
+                return _completion_response("resent")
+
+            client._litellm.completion.side_effect = _completion  # noqa: SLF001
+            messages = [LLMMessage(role="user", content="Hello")]
+
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                first = pool.submit(client.complete, messages)
+                assert started.wait(timeout=5)
+                joined = _joined_event(client)
+                second = pool.submit(client.complete, messages)
+                # Only let the leader finish once the second caller is waiting on it
+                assert joined.wait(timeout=5)
+                release.set()
+
+                assert isinstance(first.exception(timeout=5), KeyboardInterrupt)
+                assert second.result(timeout=5).content == "resent"
+
+            assert len(calls) == 2
+            assert not client._inflight  # noqa: SLF001
+
+
+class TestAsyncCompletion:
+    """Tests for the async completion API."""
+
+    def test_acomplete_many_preserves_order_and_errors(self):
+        """Test fan-out returns responses in order and surfaces failures in place."""
+        ok = MockLLMClient(default_response="ok")
+        failing = MockLLMClient(simulate_error=True)
+        messages = [LLMMessage(role="user", content="Hello")]
+
+        results = asyncio.run(ok.acomplete_many([messages, messages]))
+        assert [r.content for r in results] == ["ok", "ok"]
+        assert ok.call_count == 2
+
+        results = asyncio.run(failing.acomplete_many([messages]))
+        assert isinstance(results[0], LLMAPIError)
+
+    def test_litellm_acomplete_uses_acompletion(self):
+        """Test the LiteLLM async path awaits litellm.acompletion."""
+        with patch.object(LiteLLMClient, "_ensure_litellm"):
+            client = LiteLLMClient()
+            mock_litellm = MagicMock()
+            client._litellm = mock_litellm  # noqa: SLF001 — Testing internals
+
+            mock_response = MagicMock()
+            mock_response.choices = [MagicMock()]
+            mock_response.choices[0].message.content = "Async response"
+            mock_response.choices[0].finish_reason = "stop"
+            mock_response.model = "gpt-5-mini"
+            mock_response.usage = None
+            mock_litellm.acompletion = AsyncMock(return_value=mock_response)
+
+            response = asyncio.run(client.acomplete([LLMMessage(role="user", content="Hello")]))
+
+            assert response.content == "Async response"
+            mock_litellm.acompletion.assert_awaited_once()
+            mock_litellm.completion.assert_not_called()
+
+    def test_litellm_acomplete_retries_api_errors(self):
+        """Test the async path retries translated API errors."""
+        settings = LLMSettings(max_retries=2, retry_delay=0.01)
+
+        with patch.object(LiteLLMClient, "_ensure_litellm"):
+            client = LiteLLMClient(settings)
+            mock_litellm = MagicMock()
+            client._litellm = mock_litellm  # noqa: SLF001 — Testing internals
+
+            class MockAPIError(Exception):
+                pass
+
+            mock_litellm.acompletion = AsyncMock(side_effect=MockAPIError("boom"))
+
+            with pytest.raises(LLMAPIError):
+                asyncio.run(client.acomplete([LLMMessage(role="user", content="Hello")]))
+            assert mock_litellm.acompletion.await_count == 2
+
+
 class TestLiteLLMClient:
     """Tests for LiteLLM client."""
 
@@ -219,6 +495,9 @@ class TestLiteLLMClient:
             assert len(call_kwargs["messages"]) == 1
             assert call_kwargs["messages"][0]["role"] == "user"
             assert call_kwargs["messages"][0]["content"] == "Hello"
+            assert "max_tokens" not in call_kwargs
+            assert call_kwargs["timeout"] == 10
+            assert call_kwargs["max_retries"] == 0
 
     def test_litellm_json_format(self):
         """Test JSON response format with LiteLLM."""
@@ -301,6 +580,157 @@ class TestLiteLLMClient:
             assert exc_info.value.code == ErrorCode.E424_UPSTREAM_LLM
             assert "Rate limit exceeded" in str(exc_info.value)
 
+    def test_litellm_static_messages_first(self):
+        """Test system messages are emitted ahead of the conversation with trailing whitespace removed."""
+        with patch.object(LiteLLMClient, "_ensure_litellm"):
+            client = LiteLLMClient()
+            client._litellm = MagicMock()  # noqa: SLF001 — Testing internals
+            client._litellm.get_llm_provider.return_value = ("gpt-5-mini", "openai", None, None)  # noqa: SLF001
+
+            messages = [
+                LLMMessage(role="user", content="Hello"),
+                LLMMessage(role="system", content="Be brief.  \n"),
+            ]
+            request = client._build_request_kwargs(messages, ResponseFormat.TEXT, {})  # noqa: SLF001
+
+            assert request["messages"] == [
+                {"role": "system", "content": "Be brief."},
+                {"role": "user", "content": "Hello"},
+            ]
+
+    def test_litellm_anthropic_cache_control(self):
+        """Test static messages get a cache-control breakpoint for Anthropic models."""
+        with patch.object(LiteLLMClient, "_ensure_litellm"):
+            client = LiteLLMClient()
+            client._litellm = MagicMock()  # noqa: SLF001 — Testing internals
+            client._litellm.get_llm_provider.return_value = ("claude", "anthropic", None, None)  # noqa: SLF001
+
+            messages = [LLMMessage(role="system", content="Rules"), LLMMessage(role="user", content="Hello")]
+            request = client._build_request_kwargs(messages, ResponseFormat.TEXT, {"model": "claude"})  # noqa: SLF001
+
+            assert request["messages"][0]["content"] == [
+                {"type": "text", "text": "Rules", "cache_control": {"type": "ephemeral"}}
+            ]
+            assert request["messages"][1] == {"role": "user", "content": "Hello"}
+
+    def test_litellm_called_on_caller_thread(self):
+        """Test calls run on the calling thread, bounded by litellm's timeout rather than a worker pool."""
+        with patch.object(LiteLLMClient, "_ensure_litellm"):
+            client = LiteLLMClient(LLMSettings(max_tokens=4096))
+            client._litellm = MagicMock()  # noqa: SLF001 — Testing internals
+            threads = []
+
+            def _completion(**_: object) -> MagicMock:
+                threads.append(threading.current_thread())
+                return _completion_response("ok")
+
+            client._litellm.completion.side_effect = _completion  # noqa: SLF001
+
+            client.complete([LLMMessage(role="user", content="Hello")])
+
+            assert threads == [threading.current_thread()]
+            assert client._litellm.completion.call_args[1]["max_tokens"] == 4096  # noqa: SLF001
+
+    def test_litellm_expired_deadline_is_not_dispatched(self):
+        """Test a request past its deadline is dropped before reaching the provider."""
+        with patch.object(LiteLLMClient, "_ensure_litellm"):
+            client = LiteLLMClient()
+            client._litellm = MagicMock()  # noqa: SLF001 — Testing internals
+
+            with pytest.raises(LLMTimeoutError):
+                client.complete([LLMMessage(role="user", content="Hello")], deadline=time.monotonic() - 1)
+
+            client._litellm.completion.assert_not_called()  # noqa: SLF001
+
+    def test_litellm_deadline_stops_retries(self):
+        """Test retries stop once the overall deadline passes."""
+        settings = LLMSettings(max_retries=5, retry_delay=0.05)
+
+        with patch.object(LiteLLMClient, "_ensure_litellm"):
+            client = LiteLLMClient(settings)
+            client._litellm = MagicMock()  # noqa: SLF001 — Testing internals
+
+            class MockAPIError(Exception):
+                pass
+
+            client._litellm.completion.side_effect = MockAPIError("boom")  # noqa: SLF001
+
+            with pytest.raises(LLMTimeoutError):
+                client.complete([LLMMessage(role="user", content="Hello")], deadline=time.monotonic() + 0.03)
+
+            assert client._litellm.completion.call_count == 1  # noqa: SLF001
+
+    def test_litellm_retry_honors_retry_after(self):
+        """Test a provider Retry-After header sets the wait before the next attempt."""
+        settings = LLMSettings(max_retries=2, retry_delay=5.0)
+
+        with patch.object(LiteLLMClient, "_ensure_litellm"):
+            client = LiteLLMClient(settings)
+            client._litellm = MagicMock()  # noqa: SLF001 — Testing internals
+
+            class MockAPIError(Exception):
+                status_code = 429
+
+            rate_limited = MockAPIError("rate limited")
+            rate_limited.headers = {"retry-after": "0.25"}
+            client._litellm.completion.side_effect = [  # noqa: SLF001
+                rate_limited,
+                MagicMock(
+                    choices=[MagicMock(message=MagicMock(content="ok"), finish_reason="stop")],
+                    model="m",
+                    usage=None,
+                ),
+            ]
+
+            with patch("chartelier.infra.llm_client.time.sleep") as mock_sleep:
+                response = client.complete([LLMMessage(role="user", content="Hello")], temperature=0.5)
+
+            assert response.content == "ok"
+            mock_sleep.assert_called_once_with(0.25)
+
+    def test_backoff_delay_is_jittered_and_capped(self):
+        """Test backoff delays stay between retry_delay and twice the previous delay, capped at timeout."""
+        client = MockLLMClient(LLMSettings(retry_delay=1.0, timeout=10))
+        error = LLMAPIError("boom")
+
+        delays = {client._backoff_delay(error, 4.0, None) for _ in range(50)}  # noqa: SLF001
+        assert all(1.0 <= delay <= 8.0 for delay in delays)
+        assert len(delays) > 1
+
+        assert client._backoff_delay(error, 100.0, None) <= 10  # noqa: SLF001
+        assert client._backoff_delay(LLMAPIError("boom", retry_after=60), 1.0, None) == 10  # noqa: SLF001
+
+    def test_litellm_refuses_oversized_prompt(self):
+        """Test prompts above the input token ceiling never reach the provider."""
+        settings = LLMSettings(max_input_tokens=10)
+
+        with patch.object(LiteLLMClient, "_ensure_litellm"):
+            client = LiteLLMClient(settings)
+            client._litellm = MagicMock()  # noqa: SLF001 — Testing internals
+
+            with pytest.raises(LLMInputTooLargeError) as exc_info:
+                client.complete([LLMMessage(role="user", content="x" * 100)])
+
+            assert exc_info.value.code == ErrorCode.E413_TOO_LARGE
+            client._litellm.completion.assert_not_called()  # noqa: SLF001
+
+    def test_litellm_exception_dispatch_walks_mro(self):
+        """Test subclasses of registered provider exceptions are translated."""
+
+        class ProviderTimeout(Exception):  # noqa: N818 — Mirrors provider naming
+            pass
+
+        class ReadTimeout(ProviderTimeout):
+            pass
+
+        with patch.object(LiteLLMClient, "_ensure_litellm"):
+            client = LiteLLMClient()
+            client._exception_translators[ProviderTimeout] = client._timeout_error  # noqa: SLF001
+
+            translated = client._translate_exception(ReadTimeout("slow"), "gpt-5-mini")  # noqa: SLF001
+            assert isinstance(translated, LLMTimeoutError)
+            assert client._translate_exception(ValueError("other"), "gpt-5-mini") is None  # noqa: SLF001
+
     def test_litellm_with_api_key(self):
         """Test LiteLLM with API key setting."""
         settings = LLMSettings(api_key="test-api-key")
@@ -330,6 +760,232 @@ class TestLiteLLMClient:
             assert call_kwargs["api_key"] == "test-api-key"
 
 
+class TestLLMCache:
+    """Tests for LLM response caches."""
+
+    def test_key_ignores_transport_params(self):
+        """Test cache key depends only on response-affecting parameters."""
+        base = {"model": "m", "messages": [{"role": "user", "content": "hi"}], "temperature": 0}
+        assert LLMCache.make_key(base) == LLMCache.make_key({**base, "timeout": 5, "api_key": "secret"})
+        assert LLMCache.make_key(base) != LLMCache.make_key({**base, "model": "other"})
+
+    def test_key_separates_message_boundaries(self):
+        """Test that moving text between messages changes the cache key."""
+        split_a = {"model": "m", "messages": [{"role": "user", "content": "ab"}, {"role": "user", "content": "c"}]}
+        split_b = {"model": "m", "messages": [{"role": "user", "content": "a"}, {"role": "user", "content": "bc"}]}
+        assert LLMCache.make_key(split_a) != LLMCache.make_key(split_b)
+
+    def test_lru_eviction(self):
+        """Test least recently used entries are evicted first."""
+        cache = LLMCache(max_entries=2)
+        cache.set("a", LLMResponse(content="a"))
+        cache.set("b", LLMResponse(content="b"))
+        cache.get("a")
+        cache.set("c", LLMResponse(content="c"))
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_ttl_expiry(self):
+        """Test expired entries are not returned."""
+        cache = LLMCache(ttl_seconds=-1)
+        cache.set("a", LLMResponse(content="a"))
+        assert cache.get("a") is None
+
+    def test_sqlite_roundtrip(self, tmp_path):
+        """Test responses persist across SQLite cache instances."""
+        path = str(tmp_path / "llm_cache.sqlite")
+        SQLiteLLMCache(path).set("k", LLMResponse(content="cached", model="m"))
+
+        cached = SQLiteLLMCache(path).get("k")
+        assert cached is not None
+        assert cached.content == "cached"
+        assert cached.model == "m"
+
+    def test_sqlite_bounded_by_max_entries(self, tmp_path):
+        """Test the SQLite cache keeps only the newest max_entries responses."""
+        cache = SQLiteLLMCache(str(tmp_path / "llm_cache.sqlite"), max_entries=2)
+        for key in ("a", "b", "c"):
+            cache.set(key, LLMResponse(content=key))
+
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+        assert cache.get("c") is not None
+
+    def test_sqlite_set_drops_expired_entries(self, tmp_path):
+        """Test storing a response removes expired rows that are never read again."""
+        path = str(tmp_path / "llm_cache.sqlite")
+        cache = SQLiteLLMCache(path, ttl_seconds=60)
+        with patch("chartelier.infra.llm_client.time.time", return_value=1_000.0):
+            cache.set("old", LLMResponse(content="old"))
+        cache.set("new", LLMResponse(content="new"))
+
+        keys = [row[0] for row in sqlite3.connect(path).execute("SELECT key FROM llm_cache")]
+        assert keys == ["new"]
+
+    def test_shared_cache_follows_settings(self, tmp_path):
+        """Test clients configured alike share a cache, and differently configured ones don't."""
+        settings = LLMSettings(cache_max_entries=3)
+        assert get_llm_cache(settings) is get_llm_cache(LLMSettings(cache_max_entries=3))
+        assert get_llm_cache(settings) is not get_llm_cache(LLMSettings(cache_max_entries=4))
+        assert get_llm_cache(settings).max_entries == 3
+
+        sqlite_cache = get_llm_cache(LLMSettings(cache_path=str(tmp_path / "c.sqlite"), cache_max_entries=5))
+        assert isinstance(sqlite_cache, SQLiteLLMCache)
+        assert sqlite_cache.max_entries == 5
+
+    def test_litellm_serves_deterministic_requests_from_cache(self):
+        """Test a repeated temperature=0 request skips the network call."""
+        with patch.object(LiteLLMClient, "_ensure_litellm"):
+            client = LiteLLMClient(LLMSettings(model="gpt-4o"), LLMCache())
+
+            mock_litellm = MagicMock()
+            client._litellm = mock_litellm  # noqa: SLF001 — Testing internals
+            mock_response = MagicMock()
+            mock_response.choices = [MagicMock()]
+            mock_response.choices[0].message.content = "Cached response"
+            mock_response.choices[0].finish_reason = "stop"
+            mock_response.model = "gpt-4o"
+            mock_response.usage = None
+            mock_litellm.completion.return_value = mock_response
+
+            messages = [LLMMessage(role="user", content="Hello")]
+            first = client.complete(messages)
+            second = client.complete(messages)
+
+            assert first.content == second.content == "Cached response"
+            mock_litellm.completion.assert_called_once()
+
+    def test_litellm_does_not_cache_sampled_requests(self):
+        """Test requests with non-zero temperature always reach the provider."""
+        with patch.object(LiteLLMClient, "_ensure_litellm"):
+            client = LiteLLMClient(LLMSettings(model="gpt-4o", temperature=0.7), LLMCache())
+
+            mock_litellm = MagicMock()
+            client._litellm = mock_litellm  # noqa: SLF001 — Testing internals
+            mock_response = MagicMock()
+            mock_response.choices = [MagicMock()]
+            mock_response.choices[0].message.content = "Response"
+            mock_response.choices[0].finish_reason = "stop"
+            mock_response.model = "gpt-4o"
+            mock_response.usage = None
+            mock_litellm.completion.return_value = mock_response
+
+            messages = [LLMMessage(role="user", content="Hello")]
+            client.complete(messages)
+            client.complete(messages)
+
+            assert mock_litellm.completion.call_count == 2
+
+    def test_litellm_effective_temperature(self):
+        """Test the reported temperature matches what is sent, including the GPT-5 override."""
+        with patch.object(LiteLLMClient, "_ensure_litellm"):
+            client = LiteLLMClient(LLMSettings(model="gpt-5-mini", temperature=0.0))
+
+            assert client.effective_temperature() == 1.0
+            assert client.effective_temperature("gpt-5-mini", 0.0) == 1.0
+            assert client.effective_temperature("gpt-4o", 0.0) == 0.0
+            assert client.effective_temperature("gpt-4o") == 0.0
+            assert MockLLMClient().effective_temperature("gpt-5-mini", 0.0) == 0.0
+
+
+class TestSemanticLLMCache:
+    """Tests for the similarity-based response cache."""
+
+    @staticmethod
+    def _embed(text):
+        # Bag-of-words over a tiny vocabulary is enough to exercise similarity
+        vocab = ["show", "display", "sales", "trend", "compare", "regions"]
+        words = text.lower().split()
+        return [float(words.count(w)) for w in vocab]
+
+    @staticmethod
+    def _request(query, system="Pick a chart", data_info="rows=10"):
+        # The user turn mixes fixed template text and data details with the query, as rendered prompts do
+        user_text = f"Choose a pattern for the query.\nQuery: {query}\nData: {data_info}"
+        return {
+            "model": "m",
+            "messages": [{"role": "system", "content": system}, {"role": "user", "content": user_text}],
+            "temperature": 0,
+        }
+
+    def _key(self, cache, query, **kwargs):
+        return cache.make_key(self._request(query, **kwargs), query)
+
+    def test_hit_on_similar_query(self):
+        """Test a paraphrased query in an otherwise identical request returns the cached response."""
+        cache = SemanticLLMCache(self._embed, threshold=0.6)
+        cache.set(self._key(cache, "show sales trend"), LLMResponse(content="P01"))
+
+        hit = cache.get(self._key(cache, "display sales trend"))
+        assert hit is not None
+        assert hit.content == "P01"
+
+    def test_miss_below_threshold(self):
+        """Test a dissimilar query misses."""
+        cache = SemanticLLMCache(self._embed, threshold=0.6)
+        cache.set(self._key(cache, "show sales trend"), LLMResponse(content="P01"))
+        assert cache.get(self._key(cache, "compare regions")) is None
+
+    def test_namespaced_by_system_prompt(self):
+        """Test the same query under a different system prompt misses."""
+        cache = SemanticLLMCache(self._embed, threshold=0.6)
+        cache.set(self._key(cache, "show sales trend"), LLMResponse(content="P01"))
+        assert cache.get(self._key(cache, "show sales trend", system="Map columns")) is None
+
+    def test_namespaced_by_rest_of_user_message(self):
+        """Test the same query about different data misses, however similar the prompts are overall."""
+        cache = SemanticLLMCache(self._embed, threshold=0.6)
+        cache.set(self._key(cache, "show sales trend"), LLMResponse(content="P01"))
+        assert cache.get(self._key(cache, "show sales trend", data_info="rows=500")) is None
+
+    def test_only_query_is_embedded(self):
+        """Test the embedding covers the query alone, not the template text around it."""
+        embed = MagicMock(side_effect=self._embed)
+        cache = SemanticLLMCache(embed)
+
+        cache.make_key(self._request("show sales trend"), "show sales trend")
+
+        embed.assert_called_once_with("show sales trend")
+
+    def test_litellm_embeds_query_once_per_miss(self):
+        """Test a miss reuses its embedding to store the response, and hits match by query."""
+        embed = MagicMock(side_effect=self._embed)
+        with patch.object(LiteLLMClient, "_ensure_litellm"):
+            client = LiteLLMClient(LLMSettings(model="gpt-4o"), None, SemanticLLMCache(embed, threshold=0.6))
+            mock_litellm = MagicMock()
+            client._litellm = mock_litellm  # noqa: SLF001 — Testing internals
+            mock_litellm.completion.return_value = _completion_response("P01")
+
+            first = client.complete(
+                [LLMMessage(role="user", content="Query: show sales trend")], semantic_query="show sales trend"
+            )
+            assert embed.call_count == 1
+
+            second = client.complete(
+                [LLMMessage(role="user", content="Query: display sales trend")], semantic_query="display sales trend"
+            )
+
+        assert first.content == second.content == "P01"
+        mock_litellm.completion.assert_called_once()
+        assert "semantic_query" not in mock_litellm.completion.call_args.kwargs
+
+    def test_litellm_skips_semantic_cache_without_query(self):
+        """Test requests that don't name their query are never matched by similarity."""
+        embed = MagicMock(side_effect=self._embed)
+        with patch.object(LiteLLMClient, "_ensure_litellm"):
+            client = LiteLLMClient(LLMSettings(model="gpt-4o"), None, SemanticLLMCache(embed, threshold=0.6))
+            mock_litellm = MagicMock()
+            client._litellm = mock_litellm  # noqa: SLF001 — Testing internals
+            mock_litellm.completion.return_value = _completion_response("P01")
+
+            client.complete([LLMMessage(role="user", content="show sales trend")])
+            client.complete([LLMMessage(role="user", content="show sales trend")])
+
+        embed.assert_not_called()
+        assert mock_litellm.completion.call_count == 2
+
+
 class TestGetLLMClient:
     """Tests for get_llm_client factory function."""
 
@@ -345,7 +1001,7 @@ class TestGetLLMClient:
         mock_litellm_class.return_value = MagicMock()
         settings = LLMSettings(disable_llm=False)
         get_llm_client(settings)
-        mock_litellm_class.assert_called_once_with(settings)
+        mock_litellm_class.assert_called_once_with(settings, get_llm_cache(settings), None)
 
     def test_fallback_to_mock_when_litellm_unavailable(self):
         """Test fallback to mock when litellm is not available."""
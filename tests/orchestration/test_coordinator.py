@@ -1,5 +1,6 @@
 """Unit tests for the Coordinator class."""
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import polars as pl
@@ -7,7 +8,7 @@ import pytest
 
 from chartelier.core.enums import ErrorCode, PatternID
 from chartelier.core.errors import ChartelierError
-from chartelier.core.models import DataMetadata
+from chartelier.core.models import DataMetadata, MappingConfig
 from chartelier.interfaces.validators import ValidatedRequest
 from chartelier.orchestration import (
     Coordinator,
@@ -15,6 +16,8 @@ from chartelier.orchestration import (
     ProcessingContext,
     VisualizationResult,
 )
+from chartelier.orchestration.coordinator import Deadline
+from chartelier.processing.chart_selector import ChartSelection
 from chartelier.processing.data_validator import ValidatedData
 from chartelier.processing.pattern_selector import PatternSelection, PatternSelectionError
 
@@ -28,6 +31,15 @@ class TestCoordinator:
         assert coordinator is not None
         assert coordinator.logger is not None
 
+    def test_components_created_on_first_use(self) -> None:
+        """Test processing components are only created when first accessed, then reused."""
+        coordinator = Coordinator()
+        assert "chart_builder" not in vars(coordinator)
+
+        builder = coordinator.chart_builder
+        assert coordinator.chart_builder is builder
+        assert "pattern_selector" not in vars(coordinator)
+
     def test_process_with_mocked_pipeline(self) -> None:
         """Test full pipeline with mocked components."""
         coordinator = Coordinator()
@@ -75,13 +87,9 @@ class TestCoordinator:
                 reasoning="Time series data",
             )
 
-            mock_chart.return_value = MagicMock(
-                template_id="line_chart",
-            )
+            mock_chart.return_value = ChartSelection(template_id="line_chart")
 
-            mock_aux.return_value = MagicMock(
-                auxiliary=[],
-            )
+            mock_aux.return_value = ["target_line"]
 
             mock_process.return_value = MagicMock(
                 df=test_df,
@@ -90,16 +98,7 @@ class TestCoordinator:
 
             mock_spec.return_value = MagicMock()
 
-            # Return a MappingConfig-like object with proper attributes
-            mock_mapping = MagicMock()
-            mock_mapping.x = "x"
-            mock_mapping.y = "y"
-            mock_mapping.color = None
-            mock_mapping.size = None
-            mock_mapping.facet = None
-            mock_mapping.row = None
-            mock_mapping.column = None
-            mock_map.return_value = mock_mapping
+            mock_map.return_value = MappingConfig(x="x", y="y")
 
             mock_build.return_value = MagicMock()  # Chart object
             mock_export.return_value = "<svg>...</svg>"
@@ -115,6 +114,22 @@ class TestCoordinator:
             assert result.metadata["template_id"] == "line_chart"
             assert result.metadata["stats"]["rows"] == 2
             assert result.metadata["stats"]["cols"] == 2
+            assert result.metadata["mapping"] == {"x": "x", "y": "y"}
+            assert result.metadata["auxiliary"] == ["target_line"]
+            assert mock_build.call_args.kwargs["auxiliary"] == ["target_line"]
+
+    def test_empty_data_fails_before_pattern_selection(self) -> None:
+        """Test data with no rows fails in validation without reaching the later phases."""
+        coordinator = Coordinator()
+        request = ValidatedRequest(data="x,y\n", query="test", data_format="csv", data_size_bytes=4)
+
+        result = coordinator.process(request)
+
+        assert result.error is not None
+        assert result.error["code"] == ErrorCode.E422_UNPROCESSABLE.value
+        assert result.image_data is None
+        assert result.format == "png"
+        assert "pattern_selector" not in vars(coordinator)
 
     def test_data_validation_with_csv(self) -> None:
         """Test data validation with CSV data."""
@@ -157,8 +172,38 @@ class TestCoordinator:
             assert context.rows_count == 2
             assert context.cols_count == 2
 
-    def test_parse_data_methods(self) -> None:
-        """Test internal data parsing methods."""
+    def test_data_validation_reused_for_same_data(self) -> None:
+        """Test resending the same data reuses the cached validation result."""
+        coordinator = Coordinator()
+
+        def make_context(raw_data: str, data_format: str = "csv") -> ProcessingContext:
+            return ProcessingContext(raw_data=raw_data, data_format=data_format, query="test", options={})
+
+        with patch.object(coordinator.data_validator, "validate", wraps=coordinator.data_validator.validate) as spy:
+            first = make_context("x,y\n1,2\n3,4")
+            coordinator._execute_data_validation(first)  # noqa: SLF001
+            second = make_context("x,y\n1,2\n3,4")
+            coordinator._execute_data_validation(second)  # noqa: SLF001
+            coordinator._execute_data_validation(make_context("x,y\n5,6\n7,8"))  # noqa: SLF001
+
+        assert spy.call_count == 2
+        assert second.parsed_data is not first.parsed_data
+        assert second.parsed_data.equals(first.parsed_data)
+        assert second.rows_count == 2
+
+    def test_data_validation_cache_is_bounded(self) -> None:
+        """Test the least recently used validation result is evicted past the cache size."""
+        coordinator = Coordinator()
+
+        with patch.object(Coordinator, "VALIDATION_CACHE_SIZE", 2):
+            for value in range(3):
+                context = ProcessingContext(raw_data=f"x,y\n{value},1", data_format="csv", query="test", options={})
+                coordinator._execute_data_validation(context)  # noqa: SLF001
+
+        assert len(coordinator._validation_cache) == 2  # noqa: SLF001
+
+    def test_data_validation_parses_data(self) -> None:
+        """Test the data validation phase parses CSV and JSON data."""
         coordinator = Coordinator()
 
         # Test CSV parsing
@@ -168,7 +213,7 @@ class TestCoordinator:
             query="test",
             options={},
         )
-        coordinator._parse_data(context_csv)  # noqa: SLF001
+        coordinator._execute_data_validation(context_csv)  # noqa: SLF001
         assert context_csv.parsed_data is not None
         assert context_csv.rows_count == 2
         assert context_csv.cols_count == 2
@@ -180,7 +225,7 @@ class TestCoordinator:
             query="test",
             options={},
         )
-        coordinator._parse_data(context_json)  # noqa: SLF001
+        coordinator._execute_data_validation(context_json)  # noqa: SLF001
         assert context_json.parsed_data is not None
 
         # Test invalid format
@@ -191,8 +236,8 @@ class TestCoordinator:
             options={},
         )
         with pytest.raises(ChartelierError) as exc_info:
-            coordinator._parse_data(context_invalid)  # noqa: SLF001
-        assert exc_info.value.code == ErrorCode.E415_UNSUPPORTED_FORMAT
+            coordinator._execute_data_validation(context_invalid)  # noqa: SLF001
+        assert exc_info.value.code == ErrorCode.E422_UNPROCESSABLE
 
     def test_processing_context_creation(self) -> None:
         """Test ProcessingContext model."""
@@ -221,6 +266,15 @@ class TestCoordinator:
         assert context.rows_count is None
         assert context.cols_count is None
 
+        # Plain slotted struct: no per-instance __dict__, unknown attributes are rejected
+        assert not hasattr(context, "__dict__")
+        with pytest.raises(AttributeError):
+            context.unknown = 1  # type: ignore[attr-defined]
+
+        # Elapsed time counts from the recorded start
+        context.started_ns -= 5_000_000
+        assert context.elapsed_ms() >= 5.0
+
     def test_pipeline_phase_enum(self) -> None:
         """Test PipelinePhase enum values."""
         assert PipelinePhase.DATA_VALIDATION.value == "data_validation"
@@ -264,6 +318,7 @@ class TestCoordinator:
         assert result_success.image_data == "<svg>...</svg>"
         assert result_success.error is None
         assert result_success.metadata["pattern_id"] == "P01"
+        assert "<svg>" not in repr(result_success)
 
     def test_phase_timing_recorded(self) -> None:
         """Test that phase execution times are recorded."""
@@ -297,6 +352,13 @@ class TestCoordinator:
             assert PipelinePhase.DATA_VALIDATION.value in context.processing_time_ms
             assert context.processing_time_ms[PipelinePhase.DATA_VALIDATION.value] > 0
 
+        # The reported total is measured end to end, so it covers every recorded phase
+        result = coordinator._build_success_response(  # noqa: SLF001
+            context, ValidatedRequest(data="x,y\n1,2", query="test", data_format="csv", data_size_bytes=7)
+        )
+        duration_ms = result.metadata["stats"]["duration_ms"]
+        assert duration_ms["total"] >= duration_ms[PipelinePhase.DATA_VALIDATION.value]
+
     def test_required_phase_failure_propagates(self) -> None:
         """Test that required phase failures are propagated."""
         coordinator = Coordinator()
@@ -321,6 +383,112 @@ class TestCoordinator:
             assert result.error["code"] == ErrorCode.E422_UNPROCESSABLE.value
             assert "Cannot determine pattern" in result.error["message"]
 
+    def test_phase_finishing_past_budget_is_kept(self) -> None:
+        """Test phases that complete after their time budget keep their results."""
+        coordinator = Coordinator()
+        request = ValidatedRequest(
+            data="x,y\n1,2\n3,4",
+            query="Show a line chart",
+            options={"format": "svg"},
+            data_format="csv",
+            data_size_bytes=13,
+        )
+
+        with (
+            patch.dict(Coordinator.PHASE_TIMEOUTS, dict.fromkeys(PipelinePhase, 0)),
+            patch.object(coordinator.pattern_selector, "select") as mock_pattern,
+            patch.object(coordinator.chart_selector, "select_chart_and_auxiliary") as mock_chart,
+            patch.object(coordinator.data_mapper, "map") as mock_map,
+            patch.object(coordinator.chart_builder, "build"),
+            patch.object(coordinator.chart_builder, "export") as mock_export,
+        ):
+            mock_pattern.return_value = PatternSelection(pattern_id=PatternID.P01, reasoning="Trend")
+            mock_chart.return_value = ChartSelection(template_id="line_chart")
+            mock_map.return_value = MappingConfig(x="x", y="y")
+            mock_export.return_value = "<svg>...</svg>"
+
+            result = coordinator.process(request)
+
+        assert result.error is None
+        assert result.image_data == "<svg>...</svg>"
+        # The optional chart selection phase completed, so no fallback replaced its result
+        assert result.metadata["fallback_applied"] is False
+        assert result.metadata["template_id"] == "line_chart"
+
+    def test_expired_pipeline_deadline_fails_before_phase(self) -> None:
+        """Test the overall deadline is checked before a phase starts."""
+        coordinator = Coordinator()
+        request = ValidatedRequest(
+            data="x,y\n1,2",
+            data_format="csv",
+            query="test",
+            options={},
+            data_size_bytes=7,
+        )
+
+        with (
+            patch.object(Coordinator, "TOTAL_TIMEOUT", -1),
+            patch.object(coordinator.data_validator, "validate") as mock_validate,
+        ):
+            result = coordinator.process(request)
+
+        assert result.error is not None
+        assert result.error["code"] == ErrorCode.E408_TIMEOUT.value
+        assert PipelinePhase.DATA_VALIDATION.value in result.error["message"]
+        mock_validate.assert_not_called()
+
+    def test_llm_phases_receive_deadline(self) -> None:
+        """Test LLM calls get the phase budget, capped at the overall deadline, as their deadline."""
+        coordinator = Coordinator()
+        context = ProcessingContext(raw_data="x,y\n1,2", data_format="csv", query="test")
+        context.data_metadata = DataMetadata(
+            rows=1,
+            cols=2,
+            dtypes={"x": "int", "y": "int"},
+            has_datetime=False,
+            has_category=False,
+            null_ratio={},
+            sampled=False,
+        )
+        overall = Deadline(1)
+
+        with patch.object(coordinator.pattern_selector, "select") as mock_select:
+            mock_select.return_value = PatternSelection(pattern_id=PatternID.P01, reasoning="Trend")
+            coordinator._execute_phase(PipelinePhase.PATTERN_SELECTION, context, overall)  # noqa: SLF001
+
+        deadline = mock_select.call_args.args[2]
+        assert deadline == overall.expires
+        # The deadline only applies while its phase runs
+        assert context.phase_deadline is None
+
+        with patch.object(coordinator.pattern_selector, "select") as mock_select:
+            mock_select.return_value = PatternSelection(pattern_id=PatternID.P01, reasoning="Trend")
+            with patch.dict(Coordinator.PHASE_TIMEOUTS, {PipelinePhase.PATTERN_SELECTION: 0.5}):
+                coordinator._execute_phase(PipelinePhase.PATTERN_SELECTION, context, overall)  # noqa: SLF001
+
+        assert mock_select.call_args.args[2] < overall.expires
+
+    def test_process_off_main_thread(self) -> None:
+        """Test the pipeline runs on a worker thread, as a threaded host would call it."""
+        coordinator = Coordinator()
+        request = ValidatedRequest(
+            data="x,y\n1,2",
+            data_format="csv",
+            query="test",
+            options={},
+            data_size_bytes=7,
+        )
+
+        with (
+            patch.object(coordinator.pattern_selector, "select") as mock_select,
+            ThreadPoolExecutor(max_workers=1) as executor,
+        ):
+            mock_select.side_effect = PatternSelectionError(reason="Cannot determine pattern")
+            result = executor.submit(coordinator.process, request).result()
+
+        assert result.error is not None
+        assert result.error["code"] == ErrorCode.E422_UNPROCESSABLE.value
+
     def test_auto_mapping_generation(self) -> None:
         """Test automatic mapping generation."""
         coordinator = Coordinator()
@@ -361,3 +529,77 @@ class TestCoordinator:
 
         assert mapping["x"] == "category"
         assert mapping["y"] == "count"
+
+    def test_auto_mapping_uses_dtypes(self) -> None:
+        """Test auto mapping picks datetime x and integer y by dtype, skipping durations and strings."""
+        coordinator = Coordinator()
+        context = ProcessingContext(raw_data="", data_format="csv", query="test", options={})
+        context.processed_data = pl.DataFrame(
+            {
+                "elapsed": pl.Series([1, 2], dtype=pl.Duration("ms")),
+                "label": ["a", "b"],
+                "when": pl.Series([1, 2], dtype=pl.Datetime("ms", "UTC")),
+                "count": pl.Series([3, 4], dtype=pl.UInt32),
+            }
+        )
+
+        assert coordinator._get_auto_mapping(context) == {"x": "when", "y": "count"}  # noqa: SLF001
+
+        context.processed_data = pl.DataFrame({"label": ["a"]})
+        assert coordinator._get_auto_mapping(context) == {"x": "label"}  # noqa: SLF001
+
+    def test_chart_building_receives_mapped_columns_only(self) -> None:
+        """Test chart building is handed the stored mapping and only the columns it references."""
+        coordinator = Coordinator()
+        context = ProcessingContext(raw_data="", data_format="csv", query="test", options={"format": "svg"})
+        context.processed_data = pl.DataFrame({"x": [1, 2], "notes": ["a", "b"], "y": [3, 4]})
+        context.template_id = "P01_line"
+        context.mapping_config = MappingConfig(x="x", y="y", facet="missing")
+
+        with (
+            patch.object(coordinator.chart_builder, "build") as mock_build,
+            patch.object(coordinator.chart_builder, "export", return_value="<svg/>"),
+        ):
+            coordinator._execute_chart_building(context)  # noqa: SLF001
+
+        assert mock_build.call_args.kwargs["data"].columns == ["x", "y"]
+        assert mock_build.call_args.kwargs["mapping"] is context.mapping_config
+        assert context.processed_data.columns == ["x", "notes", "y"]
+
+    def test_chart_building_leaves_options_untouched(self) -> None:
+        """Test exported chart output is stored on the context, not in the caller's options."""
+        coordinator = Coordinator()
+        options = {"format": "svg"}
+        context = ProcessingContext(raw_data="", data_format="csv", query="test", options=options)
+        context.processed_data = pl.DataFrame({"x": [1, 2], "y": [3, 4]})
+        context.template_id = "P01_line"
+        context.mapping_config = MappingConfig(x="x", y="y")
+
+        with (
+            patch.object(coordinator.chart_builder, "build"),
+            patch.object(coordinator.chart_builder, "export", return_value="<svg/>"),
+        ):
+            coordinator._execute_chart_building(context)  # noqa: SLF001
+
+        assert options == {"format": "svg"}
+        assert context.chart_data == "<svg/>"
+        assert context.chart_format == "svg"
+
+    def test_chart_building_labels_svg_when_png_unavailable(self) -> None:
+        """Test a PNG request is reported as SVG once the builder knows vl-convert is missing."""
+        coordinator = Coordinator()
+        coordinator.chart_builder._png_available = False  # noqa: SLF001
+        context = ProcessingContext(raw_data="", data_format="csv", query="test", options={"format": "png"})
+        context.processed_data = pl.DataFrame({"x": [1, 2], "y": [3, 4]})
+        context.template_id = "P01_line"
+        context.mapping_config = MappingConfig(x="x", y="y")
+
+        with (
+            patch.object(coordinator.chart_builder, "build"),
+            patch.object(coordinator.chart_builder, "_export_svg", return_value="<svg/>"),
+        ):
+            coordinator._execute_chart_building(context)  # noqa: SLF001
+
+        assert context.chart_data == "<svg/>"
+        assert context.chart_format == "svg"
+        assert context.fallback_applied is True
@@ -1,13 +1,22 @@
 """System tests for MCP handler."""
 
 import json
+from unittest.mock import Mock, patch
 
-from chartelier.interfaces.mcp.handler import MCPHandler
+import pytest
+
+from chartelier.interfaces.mcp.handler import MAX_MESSAGE_BYTES, MCPHandler, _text_error
 from chartelier.interfaces.mcp.protocol import (
+    JSONRPCError,
     JSONRPCRequest,
     JSONRPCResponse,
     MCPMethod,
+    TextContent,
+    ToolCallResult,
+    ToolsListResult,
+    get_chartelier_tool,
 )
+from chartelier.interfaces.validators import RequestValidator
 
 
 class TestMCPHandler:
@@ -377,3 +386,199 @@ class TestMCPHandler:
         request2 = JSONRPCRequest(id=2, method=MCPMethod.TOOLS_LIST)
         handler.handle_message(json.dumps(request2.model_dump()))
         assert handler.request_count == 2
+
+    def test_non_ascii_round_trip_without_orjson(self) -> None:
+        """Test messages round-trip identically with and without the orjson accelerator."""
+        request = json.dumps({"jsonrpc": "2.0", "id": "req-日本語", "method": "未知のメソッド"})
+
+        fast = MCPHandler().handle_message(request)
+        with patch("chartelier.infra.serialization._orjson", None):
+            fallback = MCPHandler().handle_message(request)
+
+        assert fast is not None
+        assert fallback is not None
+        assert json.loads(fast) == json.loads(fallback)
+        assert json.loads(fast)["id"] == "req-日本語"
+
+    def test_tool_error_omits_empty_structured_content(self) -> None:
+        """Test that unset optional result fields are omitted rather than sent as null."""
+        handler = MCPHandler()
+        request = JSONRPCRequest(id=9, method=MCPMethod.TOOLS_CALL, params={"name": "unknown_tool", "arguments": {}})
+
+        response_data = json.loads(handler.handle_message(json.dumps(request.model_dump())))
+
+        assert response_data["result"]["isError"] is True
+        assert "structuredContent" not in response_data["result"]
+
+    def test_cached_tools_list_matches_model_serialization(self) -> None:
+        """Test the pre-serialized tools/list response equals a freshly serialized one."""
+        handler = MCPHandler()
+        request = {"jsonrpc": "2.0", "id": "list-1", "method": "tools/list"}
+
+        response_str = handler.handle_message(json.dumps(request))
+
+        expected = JSONRPCResponse(id="list-1", result=ToolsListResult(tools=[get_chartelier_tool()]))
+        assert json.loads(response_str) == json.loads(expected.model_dump_json(exclude_none=True))
+
+    def test_invalid_request_envelope(self) -> None:
+        """Test malformed JSON-RPC envelopes are answered with Invalid Request."""
+        handler = MCPHandler()
+
+        for message, expected_id in (
+            ("[1, 2]", 0),
+            (json.dumps({"jsonrpc": "2.0", "id": 3, "method": 42}), 3),
+            (json.dumps({"jsonrpc": "2.0", "id": 4, "method": "ping", "params": [1]}), 4),
+            (json.dumps({"jsonrpc": "1.0", "id": "x", "method": "ping"}), "x"),
+        ):
+            response = JSONRPCResponse(**json.loads(handler.handle_message(message)))
+            assert response.id == expected_id
+            assert response.error is not None
+            assert response.error["code"] == -32600
+
+    def test_error_template_matches_model_serialization(self) -> None:
+        """Test templated error responses equal the equivalent pydantic serialization."""
+        handler = MCPHandler()
+        request = {"jsonrpc": "2.0", "id": 'q-"1"', "method": "unknown/\u65e5\u672c"}
+
+        response_str = handler.handle_message(json.dumps(request))
+
+        expected = JSONRPCResponse(
+            id='q-"1"',
+            error=JSONRPCError(code=-32601, message="Method not found: unknown/\u65e5\u672c").model_dump(),
+        )
+        assert json.loads(response_str) == json.loads(expected.model_dump_json(exclude_none=True))
+
+    def test_bytes_message(self) -> None:
+        """Test raw UTF-8 bytes are accepted as read from the binary stdin stream."""
+        handler = MCPHandler()
+
+        response_str = handler.handle_message(b'{"jsonrpc": "2.0", "id": 11, "method": "ping"}')
+
+        assert json.loads(response_str) == {"jsonrpc": "2.0", "id": 11, "result": {}}
+
+    def test_internal_error_keeps_request_id(self) -> None:
+        """Test an unexpected handler failure is reported against the request's ID."""
+        handler = MCPHandler()
+        handler._dispatch["ping"] = Mock(side_effect=RuntimeError("boom"))  # noqa: SLF001
+
+        response_str = handler.handle_message(json.dumps({"jsonrpc": "2.0", "id": "p-1", "method": "ping"}))
+
+        response = JSONRPCResponse(**json.loads(response_str))
+        assert response.id == "p-1"
+        assert response.error["code"] == -32603
+        assert response.error["data"] == "boom"
+
+    def test_invalid_request_reason_logged(self) -> None:
+        """Test the reason a request is invalid reaches the log as a field."""
+        handler = MCPHandler()
+
+        with patch("chartelier.interfaces.mcp.handler.logger") as mock_logger:
+            handler.handle_message(json.dumps({"jsonrpc": "1.0", "id": 1, "method": "ping"}))
+
+        mock_logger.warning.assert_called_once()
+        assert mock_logger.warning.call_args.args == ("Invalid JSON-RPC request",)
+        assert mock_logger.warning.call_args.kwargs["reason"]
+
+    def test_oversized_message_rejected_before_parsing(self) -> None:
+        """Test messages over the size cap are refused without being parsed."""
+        handler = MCPHandler()
+        message = json.dumps({"jsonrpc": "2.0", "id": 12, "method": "ping"})
+
+        with (
+            patch("chartelier.interfaces.mcp.handler.MAX_MESSAGE_BYTES", len(message) - 1),
+            patch("chartelier.interfaces.mcp.handler.loads") as loads,
+        ):
+            response_str = handler.handle_message(message)
+
+        loads.assert_not_called()
+        response = JSONRPCResponse(**json.loads(response_str))
+        assert response.id == 0
+        assert response.error["code"] == -32600
+
+    @pytest.mark.parametrize("char", ["\x01", "é", "Ж", "日", "😀"])
+    def test_message_cap_covers_escaped_data(self, char: str) -> None:
+        """Test data at the validator's size cap fits the message cap however it is escaped."""
+        data = char * 1000
+        inflation = (len(json.dumps(data)) - 2) / len(data.encode("utf-8"))
+        arguments = {"data": "", "query": "q" * RequestValidator.MAX_QUERY_LENGTH}
+        envelope = json.dumps({"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"arguments": arguments}})
+
+        assert inflation * RequestValidator.MAX_DATA_SIZE_BYTES + len(envelope) <= MAX_MESSAGE_BYTES
+
+    def test_text_message_cap_counts_utf8_bytes(self) -> None:
+        """Test text messages are measured in UTF-8 bytes, like the bytes the server reads."""
+        handler = MCPHandler()
+        message = json.dumps(
+            {"jsonrpc": "2.0", "id": 15, "method": "ping", "params": {"note": "日本語"}}, ensure_ascii=False
+        )
+        size = len(message.encode("utf-8"))
+
+        with patch("chartelier.interfaces.mcp.handler.MAX_MESSAGE_BYTES", size - 1):
+            rejected = JSONRPCResponse(**json.loads(handler.handle_message(message)))
+        with patch("chartelier.interfaces.mcp.handler.MAX_MESSAGE_BYTES", size):
+            accepted = JSONRPCResponse(**json.loads(handler.handle_message(message)))
+
+        # The character count alone would have let the message through
+        assert len(message) < size - 1
+        assert rejected.error["code"] == -32600
+        assert accepted.error is None
+
+    def test_tool_call_arguments_must_be_object(self) -> None:
+        """Test tools/call rejects non-object arguments the same way as a missing name."""
+        handler = MCPHandler()
+        request = {
+            "jsonrpc": "2.0",
+            "id": 13,
+            "method": "tools/call",
+            "params": {"name": "chartelier_visualize", "arguments": ["not", "an", "object"]},
+        }
+
+        response = JSONRPCResponse(**json.loads(handler.handle_message(json.dumps(request))))
+
+        assert response.error is None
+        assert response.result["isError"] is True
+        assert response.result["content"][0]["text"] == "Invalid parameters: 'arguments' must be an object"
+
+    def test_invalid_tool_call_reason_logged(self) -> None:
+        """Test the reason tool call parameters are invalid reaches the log as a field."""
+        handler = MCPHandler()
+        request = {"jsonrpc": "2.0", "id": 14, "method": "tools/call", "params": {"arguments": {}}}
+
+        with patch("chartelier.interfaces.mcp.handler.logger") as mock_logger:
+            handler.handle_message(json.dumps(request))
+
+        mock_logger.warning.assert_called_once()
+        assert mock_logger.warning.call_args.args == ("Invalid tool call parameters",)
+        assert mock_logger.warning.call_args.kwargs["reason"]
+
+    def test_handler_uses_slots(self) -> None:
+        """Test the handler keeps its state in slots rather than an instance dict."""
+        handler = MCPHandler()
+
+        assert not hasattr(handler, "__dict__")
+        handler.handle_message(json.dumps({"jsonrpc": "2.0", "id": 14, "method": "ping"}))
+        assert handler.request_count == 1
+
+    def test_ping_response_matches_model_serialization(self) -> None:
+        """Test the pre-serialized ping result matches the JSONRPCResponse serialization."""
+        handler = MCPHandler()
+
+        response_str = handler.handle_message(json.dumps({"jsonrpc": "2.0", "id": "keepalive", "method": "ping"}))
+
+        expected = JSONRPCResponse(id="keepalive", result={}).model_dump_json(exclude_none=True)
+        assert json.loads(response_str) == json.loads(expected)
+
+    def test_text_error_matches_model_serialization(self) -> None:
+        """Test the dict error result serializes like the equivalent ToolCallResult."""
+        structured = {"error": {"code": "E400_VALIDATION", "message": "bad", "hint": None}}
+
+        for args, model in [
+            (("plain",), ToolCallResult(content=[TextContent(text="plain")], isError=True)),
+            (
+                ("with details", structured),
+                ToolCallResult(content=[TextContent(text="with details")], structuredContent=structured, isError=True),
+            ),
+        ]:
+            actual = JSONRPCResponse(id=1, result=_text_error(*args)).model_dump_json(exclude_none=True)
+            expected = JSONRPCResponse(id=1, result=model).model_dump_json(exclude_none=True)
+            assert actual == expected
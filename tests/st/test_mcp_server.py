@@ -0,0 +1,67 @@
+"""System tests for the MCP stdio server loop."""
+
+import io
+import json
+import sys
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from chartelier.core.enums import ErrorCode
+from chartelier.interfaces.mcp.handler import MCPHandler
+from chartelier.interfaces.mcp.server import run_stdio_server
+from chartelier.processing.pattern_selector import PatternSelectionError
+
+
+def _run_server(monkeypatch: pytest.MonkeyPatch, handler: MCPHandler, messages: list[dict]) -> list[dict]:
+    """Feed messages to the stdio server and return the decoded responses."""
+    stdin = io.BytesIO(b"".join(json.dumps(message).encode("utf-8") + b"\n" for message in messages))
+    stdout = io.BytesIO()
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(stdin))
+    monkeypatch.setattr(sys, "stdout", io.TextIOWrapper(stdout))
+
+    run_stdio_server(handler)
+
+    return [json.loads(line) for line in stdout.getvalue().splitlines()]
+
+
+class TestStdioServer:
+    """Test the stdio read loop end to end."""
+
+    def test_tools_call_over_stdio(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test tools/call runs the pipeline on the main thread while stdin is read ahead."""
+        handler = MCPHandler()
+        messages = [
+            {"jsonrpc": "2.0", "id": 1, "method": "ping"},
+            {
+                "jsonrpc": "2.0",
+                "id": 2,
+                "method": "tools/call",
+                "params": {
+                    "name": "chartelier_visualize",
+                    "arguments": {"data": "x,y\n1,2\n3,4", "query": "Show a line chart"},
+                },
+            },
+        ]
+
+        threads = []
+
+        def fail_selection(*_args: object) -> None:
+            threads.append(threading.current_thread())
+            raise PatternSelectionError(reason="Cannot determine pattern")
+
+        with patch.object(handler.coordinator.pattern_selector, "select") as mock_select:
+            mock_select.side_effect = fail_selection
+            responses = _run_server(monkeypatch, handler, messages)
+
+        # Responses are written in request order
+        assert [response["id"] for response in responses] == [1, 2]
+
+        result = responses[1]["result"]
+        assert result["isError"] is True
+        # The pipeline itself ran and failed at pattern selection, not on a thread-bound timeout
+        assert result["structuredContent"]["error"]["code"] == ErrorCode.E422_UNPROCESSABLE.value
+        assert "Cannot determine pattern" in result["content"][0]["text"]
+        mock_select.assert_called_once()
+        assert threads == [threading.main_thread()]
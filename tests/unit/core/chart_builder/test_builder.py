@@ -55,6 +55,15 @@ class TestChartBuilder:
         assert len(charts) == 1
         assert charts[0].template_id == "P02_bar"
 
+    def test_available_charts_cached_until_registration(self, builder):
+        """Test available charts are reused per pattern and refreshed when a template is registered."""
+        charts = builder.get_available_charts(PatternID.P01)
+        charts.clear()  # Callers get their own list
+        assert [c.template_id for c in builder.get_available_charts(PatternID.P01)] == ["P01_line"]
+
+        builder.register_template("P01_line_alt", LineTemplate())
+        assert [c.template_id for c in builder.get_available_charts(PatternID.P01)] == ["P01_line", "P01_line_alt"]
+
     def test_build_chart_success(self, builder, sample_data):
         """Test successful chart building."""
         mapping = MappingConfig(x="date", y="value")
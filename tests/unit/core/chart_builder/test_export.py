@@ -155,6 +155,21 @@ class TestChartExport:
         ):
             builder.export(sample_chart, OutputFormat.PNG)
 
+    def test_export_png_skipped_once_vl_convert_missing(self, builder, sample_chart):
+        """Test a missing vl-convert is remembered so later PNG exports go straight to SVG."""
+        assert builder.png_available is True
+
+        with (
+            patch.dict("sys.modules", {"vl_convert": None}),
+            patch.object(builder, "_export_svg", return_value="<svg/>"),
+        ):
+            assert builder.export(sample_chart, OutputFormat.PNG) == "<svg/>"
+            assert builder.png_available is False
+
+            with patch.object(builder, "_export_png") as mock_png:
+                assert builder.export(sample_chart, OutputFormat.PNG) == "<svg/>"
+                mock_png.assert_not_called()
+
     def test_export_svg_fallback_to_altair(self, builder, sample_chart):
         """Test SVG export falling back to Altair's built-in method."""
         # Mock _export_svg to simulate the altair fallback case
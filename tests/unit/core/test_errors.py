@@ -5,10 +5,12 @@ import json
 from chartelier.core.enums import ErrorCode, MCPErrorCode, PipelinePhase
 from chartelier.core.errors import (
     BusinessError,
+    ChartBuildError,
     ChartelierError,
     DataTooLargeError,
     DependencyUnavailableError,
     ErrorDetail,
+    ExportError,
     MappingError,
     PatternSelectionError,
     RateLimitError,
@@ -308,6 +310,13 @@ class TestErrorMapping:
         error = DependencyUnavailableError("test")
         assert map_to_mcp_error_code(error) == MCPErrorCode.INTERNAL_ERROR
 
+    def test_mcp_code_inherited_by_subclasses(self) -> None:
+        """Test that subclasses inherit the MCP code of their nearest declaring base."""
+        assert map_to_mcp_error_code(ExportError("test")) == MCPErrorCode.INTERNAL_ERROR
+        assert map_to_mcp_error_code(ChartBuildError("test")) == MCPErrorCode.APPLICATION_ERROR
+        assert map_to_mcp_error_code(DataTooLargeError("test")) == MCPErrorCode.APPLICATION_ERROR
+        assert map_to_mcp_error_code(TimeoutError("test")) == MCPErrorCode.APPLICATION_ERROR
+
     def test_create_mcp_error_response(self) -> None:
         """Test MCP error response creation."""
         error = ValidationError(
@@ -19,6 +19,7 @@ from chartelier.core.models import (
     VersionInfo,
     VisualizeOptions,
     VisualizeRequest,
+    VisualizeResponse,
 )
 
 
@@ -183,6 +184,49 @@ class TestChartMetadata:
         assert metadata.versions.api == "0.2.1"
 
 
+class TestVisualizeResponse:
+    """Test VisualizeResponse model."""
+
+    def _metadata(self) -> ChartMetadata:
+        return ChartMetadata(
+            pattern_id=PatternID.P01,
+            template_id="line",
+            stats=ProcessingStats(rows=1, cols=1),
+        )
+
+    def test_image_is_base64_of_raw_bytes(self) -> None:
+        """Test image is lazily base64-encoded from image_bytes."""
+        response = VisualizeResponse(format=OutputFormat.PNG, image_bytes=b"\x89PNG", metadata=self._metadata())
+        assert response.image == "iVBORw=="
+
+    def test_serialization_emits_base64_only(self) -> None:
+        """Test raw bytes are excluded from serialized output."""
+        response = VisualizeResponse(format=OutputFormat.SVG, image_bytes=b"<svg/>", metadata=self._metadata())
+        dumped = json.loads(response.model_dump_json())
+        assert dumped["image"] == "PHN2Zy8+"
+        assert "image_bytes" not in dumped
+
+    def test_round_trip_through_json(self) -> None:
+        """Test the serialized form, with its base64 image, validates back into the model."""
+        response = VisualizeResponse(format=OutputFormat.PNG, image_bytes=b"\x89PNG", metadata=self._metadata())
+
+        restored = VisualizeResponse.model_validate_json(response.model_dump_json())
+
+        assert restored == response
+        assert restored.image_bytes == b"\x89PNG"
+
+    def test_invalid_base64_image_rejected(self) -> None:
+        """Test an image that isn't base64 fails validation."""
+        with pytest.raises(PydanticValidationError):
+            VisualizeResponse.model_validate({"format": "svg", "image": "not base64!", "metadata": self._metadata()})
+
+    def test_schema_matches_wire_format(self) -> None:
+        """Test the validation schema requires the base64 image, as documented, not the raw bytes."""
+        schema = VisualizeResponse.model_json_schema()
+        assert "image" in schema["properties"]
+        assert "image_bytes" not in schema["properties"]
+
+
 class TestErrorResponse:
     """Test ErrorResponse model."""
 
@@ -248,6 +292,16 @@ class TestPatternSelection:
         assert selection.reasoning == "Single time series data"
         assert selection.confidence == 0.95
 
+    def test_pattern_id_from_string(self) -> None:
+        """Test raw string pattern IDs resolve to enum members."""
+        selection = PatternSelection(pattern_id="P12")
+        assert selection.pattern_id is PatternID.P12
+
+    def test_invalid_pattern_id(self) -> None:
+        """Test unknown pattern IDs still fail validation."""
+        with pytest.raises(PydanticValidationError):
+            PatternSelection(pattern_id="P99")
+
     def test_confidence_validation(self) -> None:
         """Test confidence range validation."""
         with pytest.raises(PydanticValidationError) as exc_info:
@@ -3,11 +3,13 @@
 import json
 import logging
 import os
+from datetime import UTC, datetime
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from chartelier.infra.logging import StructuredLogger, get_logger, redact_query
+from chartelier.infra.logging import StructuredFormatter, StructuredLogger, get_logger, redact_query
 
 
 class TestStructuredLogger:
@@ -51,6 +53,26 @@ class TestStructuredLogger:
         assert extra["rows"] == 100
         assert extra["cols"] == 5
 
+    def test_disabled_level_skips_underlying_logger(self) -> None:
+        """Test that calls below the enabled level never reach the underlying logger."""
+        mock_logger = MagicMock(spec=logging.Logger)
+        mock_logger.isEnabledFor.side_effect = lambda level: level >= logging.INFO
+        logger = StructuredLogger(mock_logger)
+
+        logger.debug("hidden", rows=1)
+        logger.info("shown", rows=1)
+
+        mock_logger.log.assert_called_once_with(logging.INFO, "shown", extra={"rows": 1})
+
+    def test_is_enabled_for_delegates(self) -> None:
+        """Test that level checks are answered by the underlying logger."""
+        mock_logger = MagicMock(spec=logging.Logger)
+        mock_logger.isEnabledFor.side_effect = lambda level: level >= logging.WARNING
+        logger = StructuredLogger(mock_logger)
+
+        assert logger.isEnabledFor(logging.WARNING) is True
+        assert logger.isEnabledFor(logging.INFO) is False
+
 
 class TestGetLogger:
     """Tests for get_logger function."""
@@ -135,6 +157,25 @@ class TestStructuredFormatter:
         assert "T" in ts  # Date-time separator
         assert ts.endswith(("Z", "+00:00")) or "+" in ts  # Has timezone
 
+    def test_timestamp_matches_record_time(self) -> None:
+        """Test cached timestamp formatting matches datetime's ISO output."""
+        formatter = StructuredFormatter()
+        for created in (1700000000.123456, 1700000000.9999996, 1700000001.0, 1700000002.5000005):
+            record = logging.LogRecord("t", logging.INFO, __file__, 1, "m", None, None)
+            record.created = created
+            entry = json.loads(formatter.format(record))
+            assert entry["ts"] == datetime.fromtimestamp(created, UTC).isoformat(timespec="microseconds")
+
+    def test_unserializable_extras(self) -> None:
+        """Test extras that JSON can't encode natively are stringified."""
+        formatter = StructuredFormatter()
+        record = logging.LogRecord("t", logging.INFO, __file__, 1, "m", None, None)
+        record.path = Path("data") / "x"
+        record.big = 2**70
+        entry = json.loads(formatter.format(record))
+        assert entry["path"] == str(Path("data") / "x")
+        assert entry["big"] == 2**70
+
 
 class TestRedactQuery:
     """Tests for redact_query function."""
@@ -181,6 +222,16 @@ class TestRedactQuery:
         result2 = redact_query(query)
         assert result1 == result2  # Should be deterministic
 
+    def test_long_hyphenated_numbers_not_redacted(self) -> None:
+        """Test that digit strings with dots and hyphens are treated as numeric."""
+        query = "order 1234-5678-9012-3456 at 3.14159265358979"
+        assert redact_query(query) == query
+
+    def test_long_symbolic_token_redacted(self) -> None:
+        """Test that long tokens without letters are still redacted when not numeric."""
+        result = redact_query("token !!@@##$$%%^^&&**")
+        assert result.startswith("token [REDACTED_")
+
     def test_preserves_structure(self) -> None:
         """Test that query structure is preserved."""
         query = "SELECT col1, verylongsecretcolumnname, col3 FROM table"
@@ -1,7 +1,9 @@
 """Unit tests for PromptTemplate utility."""
 
+import os
 import textwrap
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from jinja2 import UndefinedError
@@ -86,6 +88,18 @@ class TestPromptTemplate:
         assert messages[1].role == "user"
         assert messages[1].content == "Hello Alice, your task is: Write a test"
 
+    def test_static_prefix_is_stable(self, simple_prompt_toml: str, tmp_path: Path) -> None:
+        """Test variable-free messages render identically regardless of inputs."""
+        prompt_file = tmp_path / "test_prompt.toml"
+        prompt_file.write_text(simple_prompt_toml)
+        template = PromptTemplate(prompt_file)
+
+        first = template.render(name="Alice", task="A")
+        second = template.render(name="Bob", task="B")
+
+        assert first[0].content == second[0].content == "You are a helpful assistant."
+        assert first[1].content != second[1].content
+
     def test_render_complex_template(self, complex_prompt_toml: str, tmp_path: Path) -> None:
         """Test rendering a complex template with loops and conditionals."""
         # Setup
@@ -197,6 +211,63 @@ class TestPromptTemplate:
         messages = template.render(name="Bob", task="Test task")
         assert len(messages) == 2
 
+    def test_from_component_caches_instances(self, simple_prompt_toml: str, tmp_path: Path) -> None:
+        """Test that from_component reuses instances until the file changes."""
+        prompts_dir = tmp_path / "component" / "prompts"
+        prompts_dir.mkdir(parents=True)
+        prompt_file = prompts_dir / "test_prompt.toml"
+        prompt_file.write_text(simple_prompt_toml)
+
+        first = PromptTemplate.from_component(tmp_path / "component", "test_prompt")
+        second = PromptTemplate.from_component(tmp_path / "component", "test_prompt")
+        assert first is second
+
+        # Touching the file with a new mtime invalidates the cached instance
+        stat = prompt_file.stat()
+        os.utime(prompt_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        third = PromptTemplate.from_component(tmp_path / "component", "test_prompt")
+        assert third is not first
+
+        PromptTemplate.clear_cache()
+        assert PromptTemplate.from_component(tmp_path / "component", "test_prompt") is not third
+
+    def test_partially_static_message_matches_full_render(self, tmp_path: Path) -> None:
+        """Test that splitting off the literal head does not change the rendered output."""
+        toml_content = textwrap.dedent("""\
+            version = "v0.1.0"
+
+            [[messages]]
+            role = "user"
+            do_strip = false
+            content = \"\"\"
+            Guidelines:
+            - Be concise
+              {% if detailed %}
+            Detail for {{ name }}
+              {% endif %}
+            Done
+            \"\"\"
+        """)
+        prompt_file = tmp_path / "test.toml"
+        prompt_file.write_text(toml_content)
+        template = PromptTemplate(prompt_file)
+        source = template.config.messages[0].content
+
+        for detailed in (True, False):
+            messages = template.render(name="Alice", detailed=detailed)
+            expected = template.env.from_string(source).render(name="Alice", detailed=detailed)
+            assert messages[0].content == expected
+
+    def test_templates_share_environment(self, simple_prompt_toml: str, tmp_path: Path) -> None:
+        """Test that all templates reuse one Jinja2 environment."""
+        prompt_file = tmp_path / "test.toml"
+        prompt_file.write_text(simple_prompt_toml)
+
+        first = PromptTemplate(prompt_file)
+        second = PromptTemplate(prompt_file)
+
+        assert first.env is second.env
+
     def test_get_required_variables(self, simple_prompt_toml: str, tmp_path: Path) -> None:
         """Test getting required variables from template."""
         prompt_file = tmp_path / "test.toml"
@@ -209,6 +280,17 @@ class TestPromptTemplate:
         assert "task" in required_vars
         assert len(required_vars) == 2
 
+    def test_get_required_variables_does_not_reparse(self, simple_prompt_toml: str, tmp_path: Path) -> None:
+        """Test that required variables come from the load-time parse."""
+        prompt_file = tmp_path / "test.toml"
+        prompt_file.write_text(simple_prompt_toml)
+        template = PromptTemplate(prompt_file)
+
+        with patch.object(template.env, "parse") as mock_parse:
+            assert template.get_required_variables() == {"name", "task"}
+
+        mock_parse.assert_not_called()
+
     def test_invalid_jinja2_template(self, tmp_path: Path) -> None:
         """Test that invalid Jinja2 syntax raises error."""
         toml_content = textwrap.dedent("""\
@@ -0,0 +1,53 @@
+"""Unit tests for JSON serialization helpers."""
+
+import json
+import math
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
+
+from chartelier.infra.serialization import dumps, loads
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def parser(request: pytest.FixtureRequest) -> Iterator[None]:
+    """Run a test with orjson and again with the stdlib fallback."""
+    if request.param == "orjson":
+        yield
+    else:
+        with patch("chartelier.infra.serialization._orjson", None):
+            yield
+
+
+@pytest.mark.usefixtures("parser")
+class TestSerialization:
+    """Tests for loads/dumps with and without orjson."""
+
+    def test_loads_round_trip(self) -> None:
+        """Test str and bytes parse the same with either parser."""
+        text = '{"name": "ä", "values": [1, 2.5, null]}'
+        assert loads(text) == loads(text.encode()) == {"name": "ä", "values": [1, 2.5, None]}
+
+    def test_loads_invalid_raises_json_decode_error(self) -> None:
+        """Test invalid JSON and invalid UTF-8 raise json.JSONDecodeError with either parser."""
+        with pytest.raises(json.JSONDecodeError):
+            loads('{"key": "value"')
+        with pytest.raises(json.JSONDecodeError):
+            loads(b'{"key": "\xff"}')
+
+    def test_loads_accepts_stdlib_extensions(self) -> None:
+        """Test documents the stdlib accepts but orjson rejects parse with either parser."""
+        values = loads('[NaN, Infinity, -Infinity, "\\ud800"]')
+        assert math.isnan(values[0])
+        assert values[1:] == [math.inf, -math.inf, "\ud800"]
+
+    def test_dumps_keeps_non_ascii_and_big_ints(self) -> None:
+        """Test output is unescaped UTF-8 text and integers beyond 64 bits are supported."""
+        assert dumps("日本語") == '"日本語"'
+        assert json.loads(dumps({"name": "日本語"})) == {"name": "日本語"}
+        assert dumps(2**70) == str(2**70)
+
+    def test_dumps_default(self) -> None:
+        """Test unsupported objects go through default."""
+        assert json.loads(dumps({"value": {2, 1}}, default=sorted)) == {"value": [1, 2]}
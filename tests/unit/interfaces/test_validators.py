@@ -1,12 +1,14 @@
 """Unit tests for request validators."""
 
+import io
 import json
+from unittest.mock import patch
 
 import pytest
 
 from chartelier.core.enums import ErrorCode
 from chartelier.core.errors import ChartelierError
-from chartelier.interfaces.validators import RequestValidator, ValidatedRequest
+from chartelier.interfaces.validators import RequestValidator, ValidatedRequest, _iter_lines
 
 
 class TestRequestValidator:
@@ -82,6 +84,24 @@ class TestRequestValidator:
         result = validator.validate(request)
         assert result.data == request["data"]  # Should pass for valid UTF-8
 
+    def test_lone_surrogate_data(self, validator: RequestValidator) -> None:
+        """Test data that cannot be encoded as UTF-8 is reported instead of raising."""
+        request = {
+            "data": "test,value\nrow1,\ud800",
+            "query": "Show data",
+        }
+        with pytest.raises(ChartelierError) as exc_info:
+            validator.validate(request)
+        assert any("invalid UTF-8" in detail.reason for detail in exc_info.value.details)
+
+    def test_data_size_counts_utf8_bytes(self, validator: RequestValidator) -> None:
+        """Test the reported size is the UTF-8 byte length for ASCII and non-ASCII data."""
+        ascii_data = "test,value\nrow1,cafe"
+        non_ascii_data = "test,value\nrow1,café"
+
+        assert validator.validate({"data": ascii_data, "query": "q"}).data_size_bytes == len(ascii_data)
+        assert validator.validate({"data": non_ascii_data, "query": "q"}).data_size_bytes == len(ascii_data) + 1
+
     # UT-VAL-003: CSV header validation
     def test_csv_without_header(self, validator: RequestValidator) -> None:
         """Test CSV with only header row (no data)."""
@@ -105,6 +125,12 @@ class TestRequestValidator:
         assert exc_info.value.code == ErrorCode.E400_VALIDATION
         assert any("empty" in detail.reason.lower() for detail in exc_info.value.details)
 
+    def test_whitespace_only_data(self, validator: RequestValidator) -> None:
+        """Test whitespace-only data is rejected as empty."""
+        with pytest.raises(ChartelierError) as exc_info:
+            validator.validate({"data": " \n\t\u3000\r\n", "query": "Show data"})
+        assert any("cannot be empty" in detail.reason for detail in exc_info.value.details)
+
     # UT-VAL-004: Different CSV delimiters
     def test_csv_with_comma_delimiter(self, validator: RequestValidator) -> None:
         """Test CSV with comma delimiter."""
@@ -178,6 +204,47 @@ class TestRequestValidator:
         result = validator.validate(request)
         assert result.data_format == "csv"
 
+    def test_csv_estimated_cells(self, validator: RequestValidator) -> None:
+        """Test CSV rows are counted without the header, including ragged rows."""
+        result = validator._validate_csv("a,b,c\n1,2,3\n4,5\n6,7,8")  # noqa: SLF001
+
+        assert result["errors"] == []
+        assert result["estimated_cells"] == 9
+
+    def test_detect_data_format_from_first_lines(self, validator: RequestValidator) -> None:
+        """Test format detection looks at the leading non-whitespace text and first two non-blank lines."""
+        assert validator._detect_data_format("  \n[{}]") == "json"  # noqa: SLF001
+        assert validator._detect_data_format("\na,b\n1,2\n\n") == "csv"  # noqa: SLF001
+        assert validator._detect_data_format("a|b") == "csv"  # noqa: SLF001
+        assert validator._detect_data_format("a,b\n12\n3,4") is None  # noqa: SLF001
+        assert validator._detect_data_format("a,b\n\n1,2") == "csv"  # noqa: SLF001
+        assert validator._detect_data_format("a\tb\r\n \r\n1\t2") == "csv"  # noqa: SLF001
+        assert validator._detect_data_format("a,b\n\n12") is None  # noqa: SLF001
+        assert validator._detect_data_format("just some prose") is None  # noqa: SLF001
+        assert validator._detect_data_format(" \n\t") is None  # noqa: SLF001
+
+    def test_json_estimated_cells_uses_all_record_keys(self, validator: RequestValidator) -> None:
+        """Test JSON column count is the union of keys across all records."""
+        data = json.dumps([{"a": 1}, {"a": 2, "b": 3}, {"c": 4}])
+
+        result = validator._validate_json(data)  # noqa: SLF001
+
+        assert result["errors"] == []
+        assert result["estimated_cells"] == 9
+
+    def test_csv_counts_match_reader_with_and_without_quotes(self, validator: RequestValidator) -> None:
+        """Test the quote-free counting shortcut agrees with parsing the CSV."""
+        for data in ["a,b\r\n1,2\r\n\r\n3,4\r\n", '"a,x",b\n"1\n2",3\n4,5', "\na,b\n1,2"]:
+            fast = validator._validate_csv(data)  # noqa: SLF001
+            with patch("chartelier.interfaces.validators._count_unquoted_csv", return_value=None):
+                parsed = validator._validate_csv(data)  # noqa: SLF001
+            assert fast == parsed
+
+    def test_iter_lines_matches_stringio(self) -> None:
+        """Test line iteration matches io.StringIO, which csv.reader used to be fed."""
+        for data in ["", "a", "a\n", "a\r\nb", "\n\n", 'x,"multi\nline"\r\n1,2\r']:
+            assert list(_iter_lines(data)) == list(io.StringIO(data))
+
     # UT-VAL-008: Column boundary validation
     def test_column_limit_exceeded(self, validator: RequestValidator) -> None:
         """Test CSV with too many columns."""
@@ -208,6 +275,16 @@ class TestRequestValidator:
         assert exc_info.value.code == ErrorCode.E400_VALIDATION
         assert any("Invalid JSON" in detail.reason for detail in exc_info.value.details)
 
+    def test_json_accepted_with_and_without_orjson(self, validator: RequestValidator) -> None:
+        """Test stdlib JSON extensions orjson rejects (NaN, escaped lone surrogates) stay accepted."""
+        data = json.dumps([{"name": "\ud800", "value": float("nan")}, {"name": "b", "value": float("inf")}])
+        assert "NaN" in data
+        assert "\\ud800" in data
+
+        assert validator.validate({"data": data, "query": "Show data"}).data_format == "json"
+        with patch("chartelier.infra.serialization._orjson", None):
+            assert validator.validate({"data": data, "query": "Show data"}).data_format == "json"
+
     def test_non_tabular_json(self, validator: RequestValidator) -> None:
         """Test JSON that is not table-like."""
         request = {
@@ -322,6 +399,9 @@ class TestRequestValidator:
             validator.validate(request)
         assert any("DPI must be between" in detail.reason for detail in exc_info.value.details)
 
+        assert exc_info.value.details[0].field == "options"
+        assert exc_info.value.hint == "Check option values are within valid ranges"
+
         # Above maximum
         request["options"]["dpi"] = 301
         with pytest.raises(ChartelierError) as exc_info:
@@ -368,6 +448,20 @@ class TestRequestValidator:
             validator.validate(request)
         assert any("Invalid locale" in detail.reason for detail in exc_info.value.details)
 
+    def test_unhashable_or_null_options(self, validator: RequestValidator, valid_csv_data: str) -> None:
+        """Test non-string choices and explicit nulls are reported as validation errors."""
+        request = {
+            "data": valid_csv_data,
+            "query": "Show data",
+            "options": {"format": ["png"], "locale": None, "dpi": None},
+        }
+        with pytest.raises(ChartelierError) as exc_info:
+            validator.validate(request)
+        reasons = [detail.reason for detail in exc_info.value.details]
+        assert any("Invalid format" in reason for reason in reasons)
+        assert any("Invalid locale" in reason for reason in reasons)
+        assert "DPI must be an integer" in reasons
+
     # UT-VAL-014: Maximum pixel validation
     def test_exceeds_max_pixels(self, validator: RequestValidator, valid_csv_data: str) -> None:
         """Test image dimensions exceeding maximum pixels."""
@@ -394,6 +488,14 @@ class TestRequestValidator:
         assert result.query == "Show sales trend"
         assert result.options == {}
 
+    def test_null_options_become_empty(self, validator: RequestValidator, valid_csv_data: str) -> None:
+        """Test explicit null options are accepted and normalized to an empty dict."""
+        result = validator.validate({"data": valid_csv_data, "query": "Show data", "options": None})
+
+        assert result.options == {}
+        with pytest.raises(AttributeError):
+            result.query = "changed"  # type: ignore[misc]
+
     def test_valid_json_request(self, validator: RequestValidator, valid_json_data: str) -> None:
         """Test valid request with JSON data."""
         request = {
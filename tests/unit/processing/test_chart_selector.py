@@ -1,14 +1,14 @@
 """Unit tests for ChartSelector component."""
 
 import json
-from unittest.mock import MagicMock, Mock
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
 from chartelier.core.chart_builder.builder import ChartBuilder, ChartSpec
 from chartelier.core.enums import AuxiliaryElement, PatternID
 from chartelier.core.models import DataMetadata
-from chartelier.infra.llm_client import MockLLMClient
+from chartelier.infra.llm_client import LLMResponse, MockLLMClient
 from chartelier.processing.chart_selector import ChartSelection, ChartSelector
 
 
@@ -61,6 +61,143 @@ class TestChartSelector:
 
         return mock
 
+    def test_repeated_selection_served_from_cache(
+        self, sample_metadata: DataMetadata, mock_chart_builder: Mock
+    ) -> None:
+        """Test identical chart and auxiliary selections call the LLM once."""
+        mock_client = MockLLMClient(default_response=json.dumps({"template_id": "P01_area", "auxiliary": []}))
+        selector = ChartSelector(llm_client=mock_client, chart_builder=mock_chart_builder)
+
+        first = selector.select_chart(PatternID.P01, sample_metadata, "Show trend")
+        second = selector.select_chart(PatternID.P01, sample_metadata, "Show trend")
+        assert second == first
+        assert second is not first
+        assert mock_client.call_count == 1
+
+        selector.select_chart(PatternID.P01, sample_metadata, "Show another trend")
+        assert mock_client.call_count == 2
+
+        assert selector.select_auxiliary("P01_line", "Add target", sample_metadata) == []
+        assert selector.select_auxiliary("P01_line", "Add target", sample_metadata) == []
+        assert mock_client.call_count == 3
+        assert selector.cache_hits == 2
+
+    def test_sampled_selections_not_cached(self, sample_metadata: DataMetadata, mock_chart_builder: Mock) -> None:
+        """Test selections are not reused when the client samples despite temperature 0."""
+        mock_client = MockLLMClient(default_response=json.dumps({"template_id": "P01_area", "auxiliary": []}))
+        with patch.object(mock_client, "effective_temperature", return_value=1.0):
+            selector = ChartSelector(llm_client=mock_client, chart_builder=mock_chart_builder)
+
+        assert selector.cache_enabled is False
+        selector.select_chart(PatternID.P01, sample_metadata, "Show trend")
+        selector.select_chart(PatternID.P01, sample_metadata, "Show trend")
+        selector.select_auxiliary("P01_line", "Add target", sample_metadata)
+        selector.select_auxiliary("P01_line", "Add target", sample_metadata)
+        assert mock_client.call_count == 4
+        assert selector.cache_hits == 0
+
+    def test_client_without_effective_temperature(
+        self, sample_metadata: DataMetadata, mock_chart_builder: Mock
+    ) -> None:
+        """Test clients predating effective_temperature still work and are cached as requested."""
+        mock_client = Mock(spec=["complete", "acomplete"])
+        mock_client.complete.return_value = LLMResponse(content=json.dumps({"template_id": "P01_area"}))
+        selector = ChartSelector(llm_client=mock_client, chart_builder=mock_chart_builder)
+
+        assert selector.cache_enabled is True
+        selector.select_chart(PatternID.P01, sample_metadata, "Show trend")
+        selector.select_chart(PatternID.P01, sample_metadata, "Show trend")
+        assert mock_client.complete.call_count == 1
+
+    def test_option_json_reused_across_queries(self, sample_metadata: DataMetadata, mock_chart_builder: Mock) -> None:
+        """Test the chart options JSON is built once per template set and reused for new queries."""
+        mock_client = MockLLMClient(default_response=json.dumps({"template_id": "P01_line"}))
+        selector = ChartSelector(llm_client=mock_client, chart_builder=mock_chart_builder)
+
+        selector.select_chart(PatternID.P01, sample_metadata, "Show trend")
+        options_json = selector._chart_options_json[("P01_line", "P01_area")]  # noqa: SLF001
+        assert json.loads(options_json) == [
+            {"id": "P01_line", "name": "Line Chart"},
+            {"id": "P01_area", "name": "Area Chart"},
+        ]
+
+        selector.select_chart(PatternID.P01, sample_metadata, "Show another trend")
+        assert selector._chart_options_json[("P01_line", "P01_area")] is options_json  # noqa: SLF001
+        assert mock_client.call_count == 2
+
+    def test_deterministic_auxiliary_modes_skip_llm(
+        self, sample_metadata: DataMetadata, mock_chart_builder: Mock
+    ) -> None:
+        """Test empty queries and the none/all/explicit modes are answered without the LLM."""
+        mock_client = MockLLMClient(default_response=json.dumps({"auxiliary": ["target_line"]}))
+        selector = ChartSelector(llm_client=mock_client, chart_builder=mock_chart_builder)
+
+        assert selector.select_auxiliary("P01_line", "  ", sample_metadata) == []
+        assert selector.select_auxiliary("P01_line", "Add target", sample_metadata, {"mode": "none"}) == []
+        assert selector.select_auxiliary("P01_line", "Add target", sample_metadata, {"mode": "all"}) == ["target_line"]
+        explicit = {"mode": "explicit", "elements": ["mean_line", "target_line", "target_line"]}
+        assert selector.select_auxiliary("P01_line", "Add target", sample_metadata, explicit) == ["target_line"]
+        assert mock_client.call_count == 0
+
+        assert selector.select_auxiliary("P01_line", "Add target", sample_metadata, {"mode": "auto"}) == ["target_line"]
+        assert mock_client.call_count == 1
+
+    def test_failed_selection_not_cached(self, sample_metadata: DataMetadata, mock_chart_builder: Mock) -> None:
+        """Test a fallback after an LLM error is retried rather than served from cache."""
+        mock_client = MockLLMClient(simulate_error=True)
+        selector = ChartSelector(llm_client=mock_client, chart_builder=mock_chart_builder)
+
+        assert selector.select_chart(PatternID.P01, sample_metadata, "Show trend").fallback_applied is True
+        mock_client.simulate_error = False
+        mock_client.default_response = json.dumps({"template_id": "P01_area"})
+        assert selector.select_chart(PatternID.P01, sample_metadata, "Show trend").template_id == "P01_area"
+
+    def test_chart_and_auxiliary_selected_together(
+        self, sample_metadata: DataMetadata, mock_chart_builder: Mock
+    ) -> None:
+        """Test the combined selection fills auxiliary and re-selects only after a missed speculation."""
+        response = json.dumps({"template_id": "P01_line", "auxiliary": ["target_line"]})
+        mock_client = MockLLMClient(default_response=response)
+        selector = ChartSelector(llm_client=mock_client, chart_builder=mock_chart_builder)
+
+        selection = selector.select_chart_and_auxiliary(PatternID.P01, sample_metadata, "Show trend")
+        assert selection.template_id == "P01_line"
+        assert selection.auxiliary == ["target_line"]
+        assert mock_client.call_count == 2
+
+        # Speculation ran for P01_line, so choosing P01_area needs a second auxiliary call
+        mock_client.default_response = json.dumps({"template_id": "P01_area", "auxiliary": ["target_line"]})
+        selection = selector.select_chart_and_auxiliary(PatternID.P01, sample_metadata, "Show area")
+        assert selection.template_id == "P01_area"
+        assert selection.auxiliary == ["target_line"]
+        assert mock_client.call_count == 5
+
+        # A single chart needs no chart LLM call, nor an event loop to overlap calls in
+        with patch("chartelier.processing.chart_selector.processor.asyncio.run") as run:
+            selection = selector.select_chart_and_auxiliary(PatternID.P02, sample_metadata, "Compare", {"mode": "none"})
+            assert selection.template_id == "P02_bar"
+            assert selection.auxiliary == []
+            assert mock_client.call_count == 5
+
+            selection = selector.select_chart_and_auxiliary(PatternID.P02, sample_metadata, "Compare")
+            assert selection.template_id == "P02_bar"
+            assert selection.auxiliary == ["target_line"]
+            assert mock_client.call_count == 6
+        run.assert_not_called()
+
+    def test_prompts_loaded_on_first_use(self, sample_metadata: DataMetadata, mock_chart_builder: Mock) -> None:
+        """Test prompt templates are loaded only when a selection renders them."""
+        mock_client = MockLLMClient(default_response=json.dumps({"template_id": "P01_line"}))
+        selector = ChartSelector(llm_client=mock_client, chart_builder=mock_chart_builder)
+        assert "chart_prompt" not in vars(selector)
+
+        selector.select_chart(PatternID.P02, sample_metadata, "Compare")
+        assert "chart_prompt" not in vars(selector)
+
+        selector.select_chart(PatternID.P01, sample_metadata, "Show trend")
+        assert "chart_prompt" in vars(selector)
+        assert "auxiliary_prompt" not in vars(selector)
+
     def test_ut_cs_001_successful_chart_selection(
         self, sample_metadata: DataMetadata, mock_chart_builder: Mock
     ) -> None:
@@ -114,6 +251,18 @@ class TestChartSelector:
         assert result.fallback_applied is True
         assert result.template_id == "P01_line"
 
+    def test_malformed_llm_json_falls_back(self, sample_metadata: DataMetadata, mock_chart_builder: Mock) -> None:
+        """Test malformed JSON from the LLM falls back, with orjson and with the stdlib parser."""
+        mock_client = MagicMock()
+        mock_client.complete.return_value = MagicMock(content='{"template_id": ')
+        selector = ChartSelector(llm_client=mock_client, chart_builder=mock_chart_builder)
+
+        assert selector.select_chart(PatternID.P01, sample_metadata, "Show trend").fallback_applied is True
+        assert selector.select_auxiliary("P01_line", "Add target", sample_metadata) == []
+        with patch("chartelier.infra.serialization._orjson", None):
+            assert selector.select_chart(PatternID.P01, sample_metadata, "Show trend").fallback_applied is True
+            assert selector.select_auxiliary("P01_line", "Add target", sample_metadata) == []
+
     def test_ut_cs_004_auxiliary_selection(self, sample_metadata: DataMetadata, mock_chart_builder: Mock) -> None:
         """UT-CS-004: Test auxiliary element selection with constraints."""
         # Test successful selection
@@ -2,6 +2,7 @@
 
 import json
 from textwrap import dedent
+from unittest.mock import patch
 
 import polars as pl
 import pytest
@@ -115,6 +116,28 @@ class TestDataValidator:
             validator.validate(invalid_json, "json")
         assert exc_info.value.code == ErrorCode.E422_UNPROCESSABLE
 
+    def test_validate_json_without_orjson(self, validator):
+        """Test JSON parsing matches between orjson and the stdlib fallback."""
+        records = json.dumps([{"name": "ä", "value": 1}, {"name": "b", "value": 2}])
+        columnar = json.dumps({"name": ["ä", "b"], "value": [1, 2]})
+
+        expected = validator.validate(records, "json").df
+        with patch("chartelier.infra.serialization._orjson", None):
+            assert validator.validate(records, "json").df.equals(expected)
+            assert validator.validate(columnar, "json").df.equals(expected)
+            with pytest.raises(ChartelierError):
+                validator.validate('{"key": "value"', "json")
+
+    def test_validate_json_with_non_finite_floats(self, validator):
+        """Test NaN/Infinity written by json.dumps parse the same with and without orjson."""
+        data = json.dumps([{"value": float("nan")}, {"value": float("inf")}, {"value": 1.5}])
+
+        expected = validator.validate(data, "json").df
+        assert expected["value"][1:].to_list() == [float("inf"), 1.5]
+        assert expected["value"].is_nan()[0]
+        with patch("chartelier.infra.serialization._orjson", None):
+            assert validator.validate(data, "json").df.equals(expected)
+
     def test_validate_too_many_columns(self, validator):
         """Test validation with too many columns."""
         # Create CSV with more than max columns
@@ -249,6 +272,13 @@ class TestDataValidator:
             validator.validate(invalid_json, "json")
         assert exc_info.value.code == ErrorCode.E422_UNPROCESSABLE
 
+    @pytest.mark.parametrize("value", [None, 5, True])
+    def test_json_scalar_rejected(self, validator, value):
+        """Test JSON scalars are rejected rather than handed to the DataFrame constructor."""
+        with pytest.raises(ChartelierError) as exc_info:
+            validator.validate(json.dumps(value), "json")
+        assert exc_info.value.code == ErrorCode.E422_UNPROCESSABLE
+
     def test_equidistant_sampling_indices(self, validator):
         """Test that equidistant sampling selects correct indices."""
         # Create a simple DataFrame to test sampling